@@ -1,7 +1,38 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import os
+
+from investor_graph import get_investor_graph
+from leaderboard import POSSIBLE_FIRM_COLUMNS, FirmLeaderboard, find_firm_column, unicorn_valuations
+from profiling import cached_span, span
+from rounds import ROUNDS_COLUMNS, read_rounds
+import sql_engine
+from unicorn_index import DEFAULT_FUZZY_THRESHOLD, VALUATION_COLUMN, get_unicorn_index, load_static_datasets
+from uploads import (
+    EARLY_STAGE_ROUNDS, POSSIBLE_NAME_COLUMNS, POSSIBLE_WEBSITE_COLUMNS, find_name_column, find_website_column,
+    match_portfolio, normalize_columns,
+)
+
+
+def load_rounds(uploaded_file):
+    # Parsed once per upload (streamed in chunks) and shared by both sections and reruns
+    file_id = getattr(uploaded_file, "file_id", None)
+    cached = st.session_state.get("rounds_summary")
+    if file_id is not None and cached is not None and cached[0] == file_id:
+        return cached[1]
+    with span("read rounds upload") as timing:
+        summary = read_rounds(uploaded_file)
+        timing.rows = len(summary)
+    if file_id is not None:
+        st.session_state["rounds_summary"] = (file_id, summary)
+    return summary
+
+
+def get_sql_engine():
+    # One DuckDB connection per session, holding that session's uploads
+    if "sql_engine" not in st.session_state:
+        st.session_state["sql_engine"] = sql_engine.SqlEngine()
+    return st.session_state["sql_engine"]
+
 
 def run():
     # App Title
@@ -16,66 +47,78 @@ def run():
         "Upload a VC Investment Rounds CSV", type=["csv"], key="stages"
     )
 
+    # ✅ Optional DuckDB engine: uploads are queried in SQL and never loaded whole into pandas
+    use_sql_engine = st.toggle("DuckDB engine (large uploads)", value=False, disabled=not sql_engine.available(),
+                               help="Run overlaps, stage counts and follow-on analysis as SQL over the uploaded files.")
+    engine = get_sql_engine() if use_sql_engine else None
+
+    # ✅ Summarize the investment rounds upload once; both sections below read from it
+    rounds_summary = None
+    if uploaded_file_stages is not None:
+        try:
+            with span("rounds summary", engine="duckdb" if engine else "pandas"):
+                rounds_summary = engine.rounds(uploaded_file_stages) if engine else load_rounds(uploaded_file_stages)
+        except pd.errors.EmptyDataError:
+            rounds_summary = None
+
     # -----------------------------------------------
     # 🦄 Unicorn Hit Rate Analyzer
     # -----------------------------------------------
     st.markdown("## 🦄 Unicorn Investment Overlap Analyzer")
 
     if uploaded_file_unicorns is not None:
-        @st.cache_data
-        def load_static_csv():
-            base_path = os.path.dirname(__file__)
-            df_unicorns = pd.read_csv(
-                os.path.join(base_path, "data-clean", "master_unicorns.csv"), on_bad_lines="skip"
-            )
-            df_emerging = pd.read_csv(
-                os.path.join(base_path, "data-clean", "emerging_unicorns.csv"), on_bad_lines="skip"
-            )
-
-            df_unicorns.columns = df_unicorns.columns.str.lower().str.strip()
-            df_emerging.columns = df_emerging.columns.str.lower().str.strip()
-            return df_unicorns, df_emerging
-        
-        # ✅ Load the static unicorn datasets
-        df_unicorns, df_emerging = load_static_csv()
+        # ✅ Load the static unicorn datasets and their name index (built once per process)
+        with cached_span("static datasets", lambda: load_static_datasets.cache_info().misses):
+            df_unicorns, df_emerging = load_static_datasets()
+        with cached_span("unicorn index", lambda: get_unicorn_index.cache_info().misses):
+            unicorn_index = get_unicorn_index()
 
         # ✅ Read and normalize the uploaded file
-        df_uploaded = pd.read_csv(uploaded_file_unicorns)
-        df_uploaded.columns = df_uploaded.columns.str.lower().str.strip()
-
-        # Normalize static datasets (though load_static_csv already did this)
-        df_unicorns.columns = df_unicorns.columns.str.lower().str.strip()
-        df_emerging.columns = df_emerging.columns.str.lower().str.strip()
+        with span("read portfolio upload", engine="duckdb" if engine else "pandas") as timing:
+            if engine is not None:
+                # Distinct names (with websites / firms) and the count of named rows, from SQL
+                df_uploaded, total_uploaded_companies = engine.portfolio(
+                    uploaded_file_unicorns, POSSIBLE_NAME_COLUMNS, POSSIBLE_WEBSITE_COLUMNS, POSSIBLE_FIRM_COLUMNS
+                )
+            else:
+                df_uploaded = pd.read_csv(uploaded_file_unicorns)
+                normalize_columns(df_uploaded)
+            timing.rows = len(df_uploaded)
 
         # Find relevant columns
-        possible_columns = ["organization name", "company", "startup name", "name"]
-        column_uploaded_name = next(
-            (col for col in df_uploaded.columns if col in possible_columns), None
-        )
-        column_unicorns_name = next(
-            (col for col in df_unicorns.columns if col in possible_columns), None
-        )
-        column_emerging_name = next(
-            (col for col in df_emerging.columns if col in possible_columns), None
-        )
+        column_uploaded_name = find_name_column(df_uploaded)
+        column_unicorns_name = find_name_column(df_unicorns)
+        column_emerging_name = find_name_column(df_emerging)
 
         if not column_uploaded_name or not column_unicorns_name:
             st.error("🚨 Missing required columns in the uploaded file.")
             st.stop()
 
-        # Extract company names
+        # Extract company names (and websites, if the upload has them)
         column_uploaded = df_uploaded[column_uploaded_name]
-        column_unicorns = df_unicorns[column_unicorns_name]
-        column_emerging = (
-            df_emerging[column_emerging_name] if column_emerging_name else pd.Series([])
-        )
-
-        # Find overlaps
-        overlaps_unicorns = set(column_unicorns).intersection(set(column_uploaded))
-        overlaps_emerging = set(column_emerging).intersection(set(column_uploaded))
+        column_website_name = find_website_column(df_uploaded)
+        column_websites = df_uploaded[column_website_name] if column_website_name else None
+
+        # ✅ Optional fuzzy matching for names spelled differently from the CB lists
+        fuzzy_matching = st.toggle("Fuzzy name matching", value=False,
+                                   help="Also match names that are spelled slightly differently, scored by character trigram similarity.")
+        fuzzy_threshold = st.slider("Match Confidence Threshold", 0.50, 1.00, DEFAULT_FUZZY_THRESHOLD, 0.01,
+                                    disabled=not fuzzy_matching)
+        fuzzy_threshold = fuzzy_threshold if fuzzy_matching else None
+
+        # Find overlaps: normalized names, so "Stripe, Inc." and "stripe" both match "Stripe"
+        with span("match portfolio", rows=len(column_uploaded), fuzzy=fuzzy_matching):
+            matches_unicorns = match_portfolio(unicorn_index.unicorns, column_uploaded, column_websites, fuzzy_threshold)
+            matches_emerging = (
+                match_portfolio(unicorn_index.emerging, column_uploaded, column_websites, fuzzy_threshold)
+                if column_emerging_name else pd.DataFrame(columns=["input", "match", "kind", "confidence"])
+            )
+        overlaps_unicorns = set(matches_unicorns["match"])
+        overlaps_emerging = set(matches_emerging["match"])
 
         # ✅ Calculate Metrics
-        total_uploaded_companies = len(df_uploaded[column_uploaded_name].dropna())
+        if engine is None:
+            total_uploaded_companies = len(df_uploaded[column_uploaded_name].dropna())
         unicorn_percentage = (
             (len(overlaps_unicorns) / total_uploaded_companies) * 100
             if total_uploaded_companies > 0
@@ -88,41 +131,53 @@ def run():
         with col2:
             st.metric(label="Unicorn Hit Rate", value=f"{unicorn_percentage:.2f}%")
 
-                        # ✅ Extract and display 🦄 Unicorn Overlaps with Valuation + Follow-On Data
-        valuation_column = "post_money_valuation_(in b)"
-        if valuation_column in df_unicorns.columns:
-            df_unicorns_filtered = df_unicorns[df_unicorns[column_unicorns_name].isin(overlaps_unicorns)]
-            df_unicorns_filtered = df_unicorns_filtered[[column_unicorns_name, valuation_column]]
-
-            # ✅ Convert valuation column to numeric:
-            df_unicorns_filtered[valuation_column] = (
-                df_unicorns_filtered[valuation_column]
-                .astype(str)
-                .str.replace(" B", "", regex=False)
-                .astype(float)
+        # ✅ Leaderboard mode: uploads with a "VC Firm" column are ranked firm by firm
+        column_firm_name = find_firm_column(df_uploaded)
+        if column_firm_name:
+            with span("firm leaderboard") as timing:
+                firm_board = FirmLeaderboard(df_uploaded[column_firm_name], column_uploaded, column_websites)
+                leaderboard = firm_board.scores(
+                    unicorn_index, unicorn_valuations(df_unicorns, column_unicorns_name), fuzzy_threshold
+                )
+                timing.rows = len(leaderboard)
+            st.markdown(f"### 🏆 VC Firm Leaderboard ({len(leaderboard)} firms)")
+            st.dataframe(
+                leaderboard.round({"Unicorn Hit Rate %": 2, "Emerging Overlap %": 2, "Unicorn Value ($B)": 1,
+                                   "Valuation-Weighted Hit Rate ($B per company)": 3}),
+                height=400, width=1000,
             )
 
-            # --- Merge Follow-On Data from Investment Rounds CSV ---
-            # Use the investment rounds CSV uploaded via 'uploaded_file_stages'
-            if 'uploaded_file_stages' in globals() and uploaded_file_stages is not None:
-                df_investment = pd.read_csv(uploaded_file_stages)
-                df_investment.columns = df_investment.columns.str.lower().str.strip()
-                if "organization name" in df_investment.columns and "funding round" in df_investment.columns:
-                    # Clean "Funding Round" column (remove text after "-")
-                    df_investment["funding round"] = df_investment["funding round"].astype(str).str.split(" - ").str[0].str.strip()
-                    # Aggregate data: count and list unique funding rounds per organization
-                    follow_on_data = df_investment.groupby("organization name")["funding round"].agg(
-                        ["count", lambda x: ", ".join(sorted(x.unique()))]
+                        # ✅ Extract and display 🦄 Unicorn Overlaps with Valuation + Follow-On Data
+        valuation_column = VALUATION_COLUMN     # numeric (in B) in the static snapshot
+        if valuation_column in df_unicorns.columns:
+            has_follow_on = rounds_summary is not None and not rounds_summary.missing(["organization name", "funding round"])
+            with span("unicorn overlaps", follow_on=has_follow_on) as timing:
+                if engine is not None:
+                    # Overlap join and follow-on aggregation in SQL; only the overlap rows come back
+                    df_unicorns_filtered = engine.unicorn_overlaps(
+                        df_unicorns, column_unicorns_name, valuation_column, overlaps_unicorns,
+                        rounds_summary if has_follow_on else None,
                     )
-                    follow_on_data.columns = ["Investment Count", "Investment Stages"]
                 else:
-                    follow_on_data = pd.DataFrame(columns=["Investment Count", "Investment Stages"])
-            else:
-                follow_on_data = pd.DataFrame(columns=["Investment Count", "Investment Stages"])
-            # --- End of Follow-On Data Merge ---
-
-            # Merge unicorn overlap data with follow-on data
-            df_unicorns_filtered = df_unicorns_filtered.merge(follow_on_data, how="left", left_on=column_unicorns_name, right_index=True)
+                    df_unicorns_filtered = df_unicorns[df_unicorns[column_unicorns_name].isin(overlaps_unicorns)]
+                    df_unicorns_filtered = df_unicorns_filtered[[column_unicorns_name, valuation_column]]
+
+                    # --- Merge Follow-On Data from Investment Rounds CSV ---
+                    # Uses the summary of the investment rounds CSV uploaded via 'uploaded_file_stages'
+                    if has_follow_on:
+                        # Stage lists are only built for the overlapping unicorns
+                        follow_on_data = rounds_summary.follow_on_table(df_unicorns_filtered[column_unicorns_name])
+                    else:
+                        follow_on_data = pd.DataFrame(columns=["Investment Count", "Investment Stages"])
+                    # --- End of Follow-On Data Merge ---
+
+                    # Merge unicorn overlap data with follow-on data
+                    df_unicorns_filtered = df_unicorns_filtered.merge(follow_on_data, how="left", left_on=column_unicorns_name, right_index=True)
+                timing.rows = len(df_unicorns_filtered)
+
+            # ✅ Match confidence (1.00 for exact matches)
+            confidence = matches_unicorns.groupby("match")["confidence"].max()
+            df_unicorns_filtered["Match Confidence"] = df_unicorns_filtered[column_unicorns_name].map(confidence).round(2)
 
             # Fill missing follow-on data with defaults
             df_unicorns_filtered["Investment Count"] = df_unicorns_filtered["Investment Count"].fillna(0).astype(int)
@@ -154,72 +209,74 @@ def run():
 
         display_overlap_table(overlaps_emerging, "🚀 Emerging Unicorn Overlaps", "#2196F3")
 
+        # ✅ Approximate matches, for a quick manual check
+        if fuzzy_matching:
+            fuzzy_matches = pd.concat([matches_unicorns, matches_emerging])
+            fuzzy_matches = fuzzy_matches[fuzzy_matches["kind"] == "fuzzy"].drop_duplicates(["input", "match"])
+            with st.expander(f"🔎 Fuzzy Matches ({len(fuzzy_matches)})"):
+                st.dataframe(
+                    fuzzy_matches.rename(columns={"input": "Uploaded Name", "match": "Matched Company",
+                                                  "confidence": "Match Confidence"})
+                    [["Uploaded Name", "Matched Company", "Match Confidence"]]
+                    .sort_values("Match Confidence", ascending=False).round(2),
+                    height=300, width=700,
+                )
+
     # -----------------------------------------------
     # 📊 Investment Stages & Lead % Analyzer
     # -----------------------------------------------
     st.markdown("## 📊 Investment Stages & Lead % Analyzer")
 
     if uploaded_file_stages is not None:
-        try:
-            # Reset file pointer and read the file contents
-            uploaded_file_stages.seek(0)
-            file_data = uploaded_file_stages.getvalue()
-            if len(file_data) == 0:
-                st.error("🚨 The uploaded investment file is empty. Please upload a valid CSV.")
-            else:
-                # Read the CSV file
-                uploaded_file_stages.seek(0)  # Ensure the pointer is reset before reading
-                df_uploaded = pd.read_csv(uploaded_file_stages)
-
-                # ✅ Normalize column names
-                df_uploaded.columns = df_uploaded.columns.str.lower().str.strip()
-
-                # ✅ Ensure necessary columns exist
-                required_columns = ["announced date", "organization name", "funding round", "lead investor"]
-                if not all(col in df_uploaded.columns for col in required_columns):
-                    st.error("🚨 Missing required columns in the uploaded file (e.g., 'Announced Date').")
-                    st.stop()
-
-                # ✅ Convert "Announced Date" to datetime & extract year
-                df_uploaded["announced date"] = pd.to_datetime(df_uploaded["announced date"], errors="coerce")
-                df_uploaded["year"] = df_uploaded["announced date"].dt.year  # Extract only the year
+        if rounds_summary is None:
+            st.error("🚨 The uploaded investment file is empty. Please upload a valid CSV.")
+        else:
+            # ✅ Ensure necessary columns exist
+            if rounds_summary.missing(ROUNDS_COLUMNS):
+                st.error("🚨 Missing required columns in the uploaded file (e.g., 'Announced Date').")
+                st.stop()
 
-                # ✅ Get min/max years for slider
-                min_year = int(df_uploaded["year"].min())
-                max_year = int(df_uploaded["year"].max())
+            # ✅ Get min/max years for slider
+            year_range = rounds_summary.year_range()
+            if year_range is None:
+                st.error("🚨 No valid 'Announced Date' values in the uploaded file.")
+                st.stop()
+            min_year, max_year = year_range
 
-                # ✅ Add Date Slider
-                selected_year_range = st.slider("📅 Select Year Range", min_year, max_year, (min_year, max_year))
-                
-                # ✅ Filter dataset based on selected years
-                df_uploaded = df_uploaded[(df_uploaded["year"] >= selected_year_range[0]) & 
-                                        (df_uploaded["year"] <= selected_year_range[1])]
+            # ✅ Add Date Slider
+            selected_year_range = st.slider("📅 Select Year Range", min_year, max_year, (min_year, max_year))
 
-                # ✅ Clean "Funding Round" column (Remove text after " - ")
-                df_uploaded["funding round"] = df_uploaded["funding round"].astype(str).str.split(" - ").str[0].str.strip()
+            # ✅ Answer the selected years from the per-year cube (prefix sums, built once per upload)
+            with span("year selection") as timing:
+                selected_rounds = rounds_summary.cube.select(*selected_year_range)
 
                 # ✅ Calculate Metrics
-                total_companies = df_uploaded["organization name"].nunique()
-                lead_count = df_uploaded["lead investor"].str.lower().eq("yes").sum()
-                lead_percentage = (lead_count / len(df_uploaded)) * 100 if len(df_uploaded) > 0 else 0
-
-                # ✅ Display Metrics (Move to top)
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.metric(label="Total Investments", value=f"{len(df_uploaded)}")
-                with col2:
-                    st.metric(label="Lead Investment %", value=f"{lead_percentage:.2f}%")
-
-                # ✅ Count investments per stage
-                stage_counts = df_uploaded["funding round"].value_counts()
-
-                # ✅ Calculate Investment Stage Percentage
-                stage_percentages = (stage_counts / len(df_uploaded)) * 100
-
-                # ✅ Flip bar chart: Investment Stage on Y-axis
-                st.markdown("### 📊 Investment Stages Breakdown")
+                total_investments = len(selected_rounds)
+                total_companies = selected_rounds.company_count()
+                lead_count = selected_rounds.lead_count()
+                timing.rows = total_investments
+            lead_percentage = (lead_count / total_investments) * 100 if total_investments > 0 else 0
+
+            # ✅ Display Metrics (Move to top)
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric(label="Total Investments", value=f"{total_investments}")
+            with col2:
+                st.metric(label="Lead Investment %", value=f"{lead_percentage:.2f}%")
+
+            # ✅ Count investments per stage
+            with span("stage counts"):
+                stage_counts_series = selected_rounds.stage_counts()
+
+            # ✅ Calculate Investment Stage Percentage
+            stage_percentages = (stage_counts_series / total_investments) * 100
+
+            # ✅ Flip bar chart: Investment Stage on Y-axis
+            st.markdown("### 📊 Investment Stages Breakdown")
+            with span("stage chart", rows=len(stage_counts_series)):
+                import matplotlib.pyplot as plt    # ~0.6 s to import: only once there is a chart to draw
                 fig, ax = plt.subplots(figsize=(8, 6))
-                bars = ax.barh(stage_counts.index, stage_counts.values, color="navy")
+                bars = ax.barh(stage_counts_series.index, stage_counts_series.values, color="navy")
 
                 # ✅ Add data labels at the end of each bar
                 for bar in bars:
@@ -232,46 +289,39 @@ def run():
                 ax.invert_yaxis()  # Flip the order of Y-axis labels
                 st.pyplot(fig)
 
-                # ✅ Display Investment Stage Percentages
-                st.markdown("### 📊 Investment Stage Percentages (deal by deal basis)")
-                
-            # ✅ Calculate Early and Growth Stage Exposure
-                # Define early-stage funding rounds
-                early_stage_rounds = ["pre-seed round", "seed round", "series a", "series b"]
-
-                # Count early-stage investments (match funding rounds in a case-insensitive manner)
-                early_stage_count = df_uploaded["funding round"].str.lower().isin(early_stage_rounds).sum()
+            # ✅ Display Investment Stage Percentages
+            st.markdown("### 📊 Investment Stage Percentages (deal by deal basis)")
 
-                # Calculate total investments
-                total_investments = len(df_uploaded)
+            # ✅ Calculate Early and Growth Stage Exposure
+            # Count early-stage investments (match funding rounds in a case-insensitive manner)
+            early_stage_count = stage_counts_series[stage_counts_series.index.str.lower().isin(EARLY_STAGE_ROUNDS)].sum()
 
-                # Calculate early-stage and growth-stage percentages
-                if total_investments > 0:
-                    early_stage_percentage = (early_stage_count / total_investments) * 100
-                    growth_stage_percentage = 100 - early_stage_percentage
-                else:
-                    early_stage_percentage = 0
-                    growth_stage_percentage = 0
-
-                # ✅ Display Early/Growth % Metrics
-                col3, col4 = st.columns(2)
-                with col3:
-                    st.metric(
-                        label="Early Stage Exposure %",
-                        value=f"{early_stage_percentage:.2f}%",
-                        help="Percentage of investments made in pre-seed round, seed round, series a, and series b rounds."
-                    )
-                with col4:
-                    st.metric(
-                        label="Growth Stage Exposure %",
-                        value=f"{growth_stage_percentage:.2f}%",
-                        help="Percentage of investments made in later stages beyond Series B."
-                    )
+            # Calculate early-stage and growth-stage percentages
+            if total_investments > 0:
+                early_stage_percentage = (early_stage_count / total_investments) * 100
+                growth_stage_percentage = 100 - early_stage_percentage
+            else:
+                early_stage_percentage = 0
+                growth_stage_percentage = 0
+
+            # ✅ Display Early/Growth % Metrics
+            col3, col4 = st.columns(2)
+            with col3:
+                st.metric(
+                    label="Early Stage Exposure %",
+                    value=f"{early_stage_percentage:.2f}%",
+                    help="Percentage of investments made in pre-seed round, seed round, series a, and series b rounds."
+                )
+            with col4:
+                st.metric(
+                    label="Growth Stage Exposure %",
+                    value=f"{growth_stage_percentage:.2f}%",
+                    help="Percentage of investments made in later stages beyond Series B."
+                )
 
-                
             stage_percent_df = pd.DataFrame({
-                "Investment Stage": stage_counts.index,
-                "Total Count": stage_counts.values,
+                "Investment Stage": stage_counts_series.index,
+                "Total Count": stage_counts_series.values,
                 "Percentage": stage_percentages.values
             })
 
@@ -286,14 +336,10 @@ def run():
             # -----------------------------------------------
             st.markdown("### 🔄 Follow-On Investment Analysis")
 
-            # ✅ Count occurrences of each company
-            company_counts = df_uploaded.groupby("organization name")["funding round"].agg(
-                ["count", lambda x: ", ".join(sorted(x.unique()))]
-            )
-            company_counts.columns = ["Investment Count", "Investment Stages"]
-
-            # ✅ Filter to show only companies with more than 1 investment
-            follow_on_companies = company_counts[company_counts["Investment Count"] > 1].reset_index()
+            # ✅ Companies with more than 1 investment (stage lists are only built for these)
+            with span("follow-on table") as timing:
+                follow_on_companies = selected_rounds.follow_on_table(min_count=2).reset_index()
+                timing.rows = len(follow_on_companies)
 
             # ✅ Calculate Follow-On Rate (percentage of companies with >1 investment)
             follow_on_rate = (len(follow_on_companies) / total_companies) * 100 if total_companies > 0 else 0
@@ -307,6 +353,64 @@ def run():
                 st.dataframe(follow_on_companies, height=400, width=700)
             else:
                 st.info("No companies received multiple investments in this timeframe.")
-        except pd.errors.EmptyDataError:
-            st.error("🚨 The uploaded investment file is empty. Please upload a valid CSV.")
 
+            # -----------------------------------------------
+            # ✅ Stage Transitions & Time Between Rounds
+            # -----------------------------------------------
+            with span("time between rounds"):
+                selected_follow_on = rounds_summary.follow_on.between(*selected_year_range)
+                median_days = selected_follow_on.median_days_between_rounds()
+            st.metric(label="Median Time Between Rounds",
+                      value=f"{median_days / 30.44:.1f} months" if median_days == median_days else "—",
+                      help="Median gap between consecutive rounds of the same company in this timeframe.")
+
+            with span("stage transitions"):
+                transitions = selected_follow_on.transition_matrix()
+            if transitions.values.sum() > 0:
+                st.markdown("### 🔀 Stage Transitions (from → next round)")
+                st.dataframe(transitions, height=400, width=900)
+                st.dataframe(
+                    (selected_follow_on.median_days_to_stage() / 30.44).round(1).rename("Median Months From Previous Round"),
+                    height=300, width=500,
+                )
+
+    # -----------------------------------------------
+    # 🕸️ Investor Co-Investment Network
+    # -----------------------------------------------
+    st.markdown("## 🕸️ Investor Co-Investment Network")
+
+    # ✅ Graph of the investors listed in the static datasets (built once per process)
+    graph_datasets = {"Unicorns": "unicorns", "Emerging Unicorns": "emerging", "2024 Unicorns": "2024"}
+    graph_dataset = st.radio("Investor Data", list(graph_datasets), horizontal=True, key="investor_graph")
+    with cached_span("investor graph", lambda: get_investor_graph.cache_info().misses) as timing:
+        investor_graph = get_investor_graph(graph_datasets[graph_dataset])
+        timing.rows = len(investor_graph)
+    investor = st.selectbox("Investor", investor_graph.top_investors(len(investor_graph))["Investor"],
+                            key="investor_graph_investor")
+    col1, col2 = st.columns(2)
+    with col1:
+        top_k = st.slider("Top Co-Investors", 5, 50, 10, key="investor_graph_top_k")
+    with col2:
+        hops = st.slider("Network Hops", 1, 3, 2, key="investor_graph_hops")
+
+    with span("co-investor queries"):
+        co_investors = investor_graph.co_investors(investor, top_k)
+        network = investor_graph.neighbourhood(investor, hops)
+
+    # ✅ Display Metrics
+    col3, col4, col5 = st.columns(3)
+    with col3:
+        st.metric(label=f"{graph_dataset} Backed", value=f"{len(investor_graph.portfolio(investor))}")
+    with col4:
+        st.metric(label="Direct Co-Investors", value=f"{(network['Hops'] == 1).sum()}")
+    with col5:
+        st.metric(label=f"Investors Within {hops} Hops", value=f"{len(network)}")
+
+    st.markdown(f"### 🤝 Who Co-Invests Most With {investor}")
+    if co_investors.empty:
+        st.info("No co-investors found in this dataset.")
+    else:
+        co_investors["Companies"] = [
+            ", ".join(investor_graph.shared_companies(investor, other)) for other in co_investors["Investor"]
+        ]
+        st.dataframe(co_investors, height=400, width=900)
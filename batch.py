@@ -0,0 +1,299 @@
+# batch.py
+#
+# Headless batch analysis of portfolio and investment-rounds CSVs.
+# Every CSV under the given files, directories and glob patterns is classified
+# by its header (a "Funding Round" column marks an investment-rounds export, a
+# company name column a portfolio) and analyzed as the analyzer page would:
+# unicorn / emerging overlaps, hit rate, unicorn value and, with a "VC Firm"
+# column, the firm leaderboard for portfolios; stage mix, lead %, early /
+# growth exposure, follow-on rate and time between rounds for rounds exports.
+# Files are spread over a process pool, largest first; each worker loads the
+# static unicorn datasets and name index once, in its initializer. A file that
+# fails is reported with its error instead of stopping the batch.
+#
+#     python batch.py uploads/ --output reports/2025-Q2
+#     python batch.py "funds/*/portfolio*.csv" "funds/*/rounds*.csv" --format csv --workers 8 --years 2018 2024
+#
+# Output:
+#     <output>/report.parquet              one row per file with every metric (and status / error)
+#     <output>/<file name>/<table>.parquet  that file's tables: overlaps, matches, leaderboard, stages, …
+
+import argparse
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+from leaderboard import FirmLeaderboard, find_firm_column, unicorn_valuations
+from rounds import ROUNDS_COLUMNS, read_rounds
+from unicorn_index import VALUATION_COLUMN, get_unicorn_index, load_static_datasets
+from uploads import (
+    EARLY_STAGE_ROUNDS, POSSIBLE_NAME_COLUMNS, find_name_column, find_website_column, match_portfolio,
+    normalize_columns,
+)
+
+FORMATS = ["parquet", "csv"]
+DAYS_PER_MONTH = 30.44
+REPORT_COLUMNS = [
+    "File", "Kind", "Status", "Rows",
+    # Portfolios
+    "Portfolio Companies", "Unicorns", "Unicorn Hit Rate %", "Emerging Unicorns", "Emerging Overlap %",
+    "Unicorn Value ($B)", "VC Firms",
+    # Investment rounds
+    "First Year", "Last Year", "Total Investments", "Companies", "Lead Investment %", "Early Stage Exposure %",
+    "Growth Stage Exposure %", "Follow-On Investment Rate %", "Median Months Between Rounds",
+    "Tables", "Seconds",
+]
+COUNT_COLUMNS = ["Rows", "Portfolio Companies", "Unicorns", "Emerging Unicorns", "VC Firms", "First Year",
+                 "Last Year", "Total Investments", "Companies"]
+
+
+def discover(patterns, exclude=None):
+    """CSV paths from files, directories (searched recursively) and glob patterns, each once, in order."""
+    excluded = os.path.abspath(exclude) + os.sep if exclude else None
+    paths = {}
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = sorted(glob.glob(os.path.join(pattern, "**", "*.csv"), recursive=True))
+        else:
+            matches = sorted(glob.glob(pattern, recursive=True)) or ([pattern] if os.path.isfile(pattern) else [])
+        for path in matches:
+            full = os.path.abspath(path)
+            # Skip earlier reports written inside an input directory
+            if os.path.isfile(path) and not (excluded and full.startswith(excluded)):
+                paths.setdefault(full, path)
+    return list(paths.values())
+
+
+def classify(path):
+    # "rounds", "portfolio" or None, from the header alone
+    columns = set(pd.read_csv(path, nrows=0).columns.str.lower().str.strip())
+    if "funding round" in columns:
+        return "rounds"
+    if columns & set(POSSIBLE_NAME_COLUMNS):
+        return "portfolio"
+    return None
+
+
+def _percent(part, whole):
+    return part / whole * 100 if whole > 0 else 0.0
+
+
+def analyze_portfolio(path, fuzzy_threshold=None):
+    """Unicorn overlap metrics and tables of one portfolio CSV."""
+    df_unicorns, _ = load_static_datasets()
+    unicorn_index = get_unicorn_index()
+    df = normalize_columns(pd.read_csv(path))
+    names = df[find_name_column(df)]
+    website_column = find_website_column(df)
+    websites = df[website_column] if website_column else None
+
+    matches_unicorns = match_portfolio(unicorn_index.unicorns, names, websites, fuzzy_threshold)
+    matches_emerging = match_portfolio(unicorn_index.emerging, names, websites, fuzzy_threshold)
+    unicorns, emerging = set(matches_unicorns["match"]), set(matches_emerging["match"])
+    unicorn_name = find_name_column(df_unicorns)
+    valuations = unicorn_valuations(df_unicorns, unicorn_name)
+
+    # Same hit rate as the analyzer page: distinct unicorns over named rows
+    companies = int(names.notna().sum())
+    metrics = {
+        "Rows": len(df),
+        "Portfolio Companies": companies,
+        "Unicorns": len(unicorns),
+        "Unicorn Hit Rate %": _percent(len(unicorns), companies),
+        "Emerging Unicorns": len(emerging),
+        "Emerging Overlap %": _percent(len(emerging), companies),
+        "Unicorn Value ($B)": float(valuations.reindex(list(unicorns)).sum()),
+    }
+
+    overlaps = df_unicorns.loc[df_unicorns[unicorn_name].isin(unicorns), [unicorn_name, VALUATION_COLUMN]]
+    confidence = matches_unicorns.groupby("match")["confidence"].max()
+    overlaps = overlaps.assign(**{"Match Confidence": overlaps[unicorn_name].map(confidence).round(2)})
+    tables = {
+        "unicorn_overlaps": overlaps.sort_values(VALUATION_COLUMN, ascending=False),
+        "emerging_overlaps": pd.DataFrame({"Company Name": sorted(emerging)}),
+        # Every matched row with how it matched, for checking by hand
+        "matches": pd.concat([matches_unicorns.assign(list="unicorns"), matches_emerging.assign(list="emerging")]),
+    }
+    firm_column = find_firm_column(df)
+    if firm_column:
+        leaderboard = FirmLeaderboard(df[firm_column], names, websites).scores(
+            unicorn_index, valuations, fuzzy_threshold
+        )
+        metrics["VC Firms"] = len(leaderboard)
+        tables["leaderboard"] = leaderboard
+    return metrics, tables
+
+
+def analyze_rounds(path, years=None):
+    """Stage, lead and follow-on metrics and tables of one investment-rounds CSV (all years by default)."""
+    summary = read_rounds(path)
+    missing = summary.missing(ROUNDS_COLUMNS)
+    if missing:
+        raise ValueError(f"missing columns: {', '.join(missing)}")
+    year_range = summary.year_range()
+    if year_range is None:
+        raise ValueError("no valid 'Announced Date' values")
+    first_year, last_year = years or year_range
+
+    selected = summary.cube.select(first_year, last_year)
+    total = len(selected)
+    companies = selected.company_count()
+    stage_counts = selected.stage_counts()
+    early = int(stage_counts[stage_counts.index.str.lower().isin(EARLY_STAGE_ROUNDS)].sum())
+    follow_on = selected.follow_on_table(min_count=2).reset_index()
+    timing = summary.follow_on.between(first_year, last_year)
+    metrics = {
+        "Rows": len(summary),
+        "First Year": first_year,
+        "Last Year": last_year,
+        "Total Investments": total,
+        "Companies": companies,
+        "Lead Investment %": _percent(selected.lead_count(), total),
+        "Early Stage Exposure %": _percent(early, total),
+        "Growth Stage Exposure %": 100 - _percent(early, total) if total > 0 else 0.0,
+        "Follow-On Investment Rate %": _percent(len(follow_on), companies),
+        "Median Months Between Rounds": timing.median_days_between_rounds() / DAYS_PER_MONTH,
+    }
+    tables = {
+        "stages": pd.DataFrame({
+            "Investment Stage": stage_counts.index,
+            "Total Count": stage_counts.to_numpy(),
+            "Percentage": stage_counts.to_numpy() / total * 100 if total > 0 else 0.0,
+        }),
+        "follow_on": follow_on,
+        "transitions": timing.transition_matrix().reset_index(),
+        "months_to_stage": (timing.median_days_to_stage() / DAYS_PER_MONTH)
+        .rename("Median Months From Previous Round").reset_index(),
+    }
+    return metrics, tables
+
+
+def write_tables(tables, directory, fmt="parquet"):
+    os.makedirs(directory, exist_ok=True)
+    for name, df in tables.items():
+        path = os.path.join(directory, f"{name}.{fmt}")
+        if fmt == "parquet":
+            df.to_parquet(path, index=False)
+        else:
+            df.to_csv(path, index=False)
+
+
+def _init_worker():
+    # Static datasets and name index, loaded once per worker process
+    load_static_datasets()
+    get_unicorn_index()
+
+
+def analyze_file(task):
+    """Report row of one file; its tables are written by the worker itself."""
+    path, directory, fmt, fuzzy_threshold, years = task
+    started = time.perf_counter()
+    row = {"File": path, "Kind": None, "Status": "ok"}
+    try:
+        row["Kind"] = classify(path)
+        if row["Kind"] == "portfolio":
+            metrics, tables = analyze_portfolio(path, fuzzy_threshold)
+        elif row["Kind"] == "rounds":
+            metrics, tables = analyze_rounds(path, years)
+        else:
+            raise ValueError("no company name or funding round column")
+        row.update(metrics)
+        write_tables(tables, directory, fmt)
+        row["Tables"] = directory
+    except (OSError, ValueError, KeyError) as e:     # unreadable CSVs raise pandas' ParserError (a ValueError)
+        row["Status"] = f"error: {e}"
+    row["Seconds"] = round(time.perf_counter() - started, 3)
+    return row
+
+
+def _table_directories(paths, output):
+    # One directory per file, named after it: "fund-a.csv" → "fund-a", a second "fund-a.csv" → "fund-a-2"
+    seen, directories = {}, []
+    for path in paths:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        seen[stem] = seen.get(stem, 0) + 1
+        directories.append(os.path.join(output, stem if seen[stem] == 1 else f"{stem}-{seen[stem]}"))
+    return directories
+
+
+def _size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def run_batch(paths, output, fmt="parquet", workers=None, fuzzy_threshold=None, years=None, progress=None):
+    """Analyze ``paths`` across ``workers`` processes; writes and returns the consolidated report."""
+    tasks = [(path, directory, fmt, fuzzy_threshold, years)
+             for path, directory in zip(paths, _table_directories(paths, output))]
+    # Largest files first, so a big export isn't the last one started
+    tasks.sort(key=lambda task: -_size(task[0]))
+
+    rows = []
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    if workers <= 1:
+        _init_worker()
+        for task in tasks:
+            rows.append(analyze_file(task))
+            if progress:
+                progress(rows[-1])
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            for future in as_completed([pool.submit(analyze_file, task) for task in tasks]):
+                rows.append(future.result())
+                if progress:
+                    progress(rows[-1])
+
+    position = {path: i for i, path in enumerate(paths)}
+    rows.sort(key=lambda row: position[row["File"]])
+    report = pd.DataFrame(rows).reindex(columns=REPORT_COLUMNS)
+    # Blank, not NaN floats, where a metric doesn't apply to a file's kind
+    report[COUNT_COLUMNS] = report[COUNT_COLUMNS].astype("Int64")
+    os.makedirs(output, exist_ok=True)
+    path = os.path.join(output, f"report.{fmt}")
+    if fmt == "parquet":
+        report.to_parquet(path, index=False)
+    else:
+        report.to_csv(path, index=False)
+    return report
+
+
+def _describe(row):
+    name = os.path.basename(row["File"])
+    if row["Status"] != "ok":
+        return f"{name}: {row['Status']}"
+    if row["Kind"] == "portfolio":
+        return (f"{name}: {row['Portfolio Companies']} companies, {row['Unicorns']} unicorns "
+                f"({row['Unicorn Hit Rate %']:.2f}%), {row['Emerging Unicorns']} emerging ({row['Seconds']:.1f}s)")
+    return (f"{name}: {row['Total Investments']} investments {row['First Year']}–{row['Last Year']}, "
+            f"{row['Lead Investment %']:.1f}% lead, {row['Follow-On Investment Rate %']:.1f}% follow-on "
+            f"({row['Seconds']:.1f}s)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analyze many portfolio and investment-rounds CSVs at once.")
+    parser.add_argument("inputs", nargs="+", help="CSV files, directories (searched recursively) or glob patterns")
+    parser.add_argument("--output", default="batch-report", help="directory for the report and per-file tables")
+    parser.add_argument("--format", choices=FORMATS, default="parquet")
+    parser.add_argument("--workers", type=int, help="processes (default: one per CPU)")
+    parser.add_argument("--fuzzy", type=float, metavar="THRESHOLD",
+                        help="also match names spelled differently, at this confidence (e.g. 0.85)")
+    parser.add_argument("--years", type=int, nargs=2, metavar=("FIRST", "LAST"),
+                        help="year range of the rounds analysis (default: every year in each file)")
+    args = parser.parse_args(argv)
+
+    paths = discover(args.inputs, exclude=args.output)
+    if not paths:
+        parser.error("no CSV files found")
+    report = run_batch(paths, args.output, args.format, args.workers, args.fuzzy, args.years,
+                       progress=lambda row: print(_describe(row), flush=True))
+    failed = int((report["Status"] != "ok").sum())
+    print(f"{len(report) - failed} of {len(report)} files analyzed → {os.path.join(args.output, 'report.' + args.format)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+# benchmarks/bench_analyzer.py
+
+import io
+import os
+import tempfile
+
+import datasets
+from harness import benchmark
+
+import batch
+from follow_on import FollowOn
+from investor_graph import InvestorGraph
+from leaderboard import FirmLeaderboard, unicorn_valuations
+from rounds import clean_funding_round, read_rounds
+from sql_engine import SqlEngine
+from unicorn_index import NameIndex, UnicornIndex
+from uploads import EARLY_STAGE_ROUNDS, find_overlaps
+
+ROWS = [1_000, 10_000, 100_000, 1_000_000, 5_000_000]
+QUICK_ROWS = [1_000, 10_000, 100_000]
+
+
+@benchmark("analyzer", rows=ROWS, quick={"rows": QUICK_ROWS})
+def unicorn_overlap(rows):
+    reference = datasets.unicorn_reference()
+    uploaded = datasets.portfolio(rows, reference)
+    index = NameIndex(reference["organization name"])
+    return lambda: find_overlaps(index, uploaded["organization name"])
+
+
+@benchmark("analyzer", rows=ROWS, quick={"rows": QUICK_ROWS})
+def unicorn_fuzzy_overlap(rows):
+    reference = datasets.unicorn_reference()
+    uploaded = datasets.portfolio(rows, reference)
+    index = NameIndex(reference["organization name"])
+    index.fuzzy(["warmup"])          # trigram index is built once, outside the timed call
+    return lambda: find_overlaps(index, uploaded["organization name"], fuzzy_threshold=0.85)
+
+
+@benchmark("analyzer", rows=ROWS, quick={"rows": QUICK_ROWS})
+def follow_on_groupby(rows):
+    df = datasets.investment_rounds(rows)
+    df["funding round"] = clean_funding_round(df["funding round"])
+    return lambda: FollowOn.from_frame(df).table()
+
+
+@benchmark("analyzer", rows=ROWS, quick={"rows": QUICK_ROWS})
+def stage_counts(rows):
+    df = datasets.investment_rounds(rows)
+
+    def run():
+        rounds = clean_funding_round(df["funding round"])
+        rounds.value_counts()
+        rounds.str.lower().isin(EARLY_STAGE_ROUNDS).sum()
+
+    return run
+
+
+@benchmark("analyzer", rows=ROWS, quick={"rows": QUICK_ROWS})
+def rounds_stream(rows):
+    # Chunked parse + aggregation of the whole export, as the stages upload is read
+    data = datasets.investment_rounds(rows).to_csv(index=False).encode()
+    return lambda: read_rounds(io.BytesIO(data)).follow_on_table()
+
+
+@benchmark("analyzer", rows=ROWS, companies=[None, 1_000_000],
+           quick={"rows": QUICK_ROWS})
+def year_slider(rows, companies):
+    # One slider move: metrics and follow-on table for a year range, from the prebuilt cube.
+    # The export goes through a temp file so peak RSS is the cube's, which grows with years × companies
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "rounds.csv")
+        datasets.investment_rounds(rows, companies=companies).to_csv(path, index=False)
+        cube = read_rounds(path).cube
+
+    def run():
+        selection = cube.select(2015, 2020)
+        len(selection), selection.lead_count(), selection.company_count(), selection.stage_counts()
+        selection.follow_on_table(min_count=2)
+
+    return run
+
+
+@benchmark("analyzer", rows=ROWS, quick={"rows": QUICK_ROWS})
+def stage_transitions(rows):
+    follow_on = read_rounds(io.BytesIO(datasets.investment_rounds(rows).to_csv(index=False).encode())).follow_on
+
+    def run():
+        selection = follow_on.between(2015, 2020)
+        selection.transition_matrix(), selection.median_days_between_rounds(), selection.median_days_to_stage()
+
+    return run
+
+
+@benchmark("analyzer", firms=[10, 300, 1_000], rows=[10_000, 100_000, 1_000_000],
+           quick={"firms": [300], "rows": [10_000, 100_000]})
+def firm_leaderboard(firms, rows):
+    # Matching every distinct company once + the sparse firm × company product
+    reference = datasets.unicorn_reference()
+    uploaded = datasets.firm_portfolios(firms, rows, reference)
+    index = UnicornIndex(reference, reference.head(500))
+    valuations = unicorn_valuations(reference)
+    return lambda: FirmLeaderboard(uploaded["vc firm"], uploaded["organization name"]).scores(index, valuations)
+
+
+@benchmark("analyzer", firms=[10, 300, 1_000], rows=[10_000, 100_000, 1_000_000],
+           quick={"firms": [300], "rows": [10_000, 100_000]})
+def firm_leaderboard_rank(firms, rows):
+    # Re-ranking only (e.g. after a threshold change on cached matches): the sparse product
+    reference = datasets.unicorn_reference()
+    uploaded = datasets.firm_portfolios(firms, rows, reference)
+    board = FirmLeaderboard(uploaded["vc firm"], uploaded["organization name"])
+    metrics = board.company_metrics(UnicornIndex(reference, reference.head(500)), unicorn_valuations(reference))
+    return lambda: board.rank(metrics)
+
+
+@benchmark("analyzer", companies=[1_500, 20_000, 200_000], quick={"companies": [1_500, 20_000]})
+def investor_graph_build(companies):
+    df = datasets.investor_lists(companies)
+    return lambda: InvestorGraph(df["organization name"], df["lead investors include"])
+
+
+@benchmark("analyzer", companies=[1_500, 20_000, 200_000], quick={"companies": [1_500, 20_000]})
+def investor_graph_queries(companies):
+    # Top-k co-investors and a 2-hop neighbourhood of the best-connected investor
+    df = datasets.investor_lists(companies)
+    graph = InvestorGraph(df["organization name"], df["lead investors include"])
+    investor = graph.top_investors(1)["Investor"].iat[0]
+    return lambda: (graph.co_investors(investor, 10), graph.neighbourhood(investor, 2))
+
+
+@benchmark("analyzer", rows=ROWS, quick={"rows": QUICK_ROWS})
+def rounds_sql(rows):
+    # DuckDB engine: load + clean the upload, then one slider move's queries
+    data = datasets.investment_rounds(rows).to_csv(index=False).encode()
+
+    def run():
+        selection = SqlEngine().rounds(io.BytesIO(data)).cube.select(2015, 2020)
+        len(selection), selection.lead_count(), selection.company_count(), selection.stage_counts()
+        selection.follow_on_table(min_count=2)
+
+    return run
+
+
+@benchmark("analyzer", files=[8, 32], workers=[1, 4], quick={"files": [8]})
+def batch_report(files, workers):
+    # Headless CLI: half portfolios (10k rows), half rounds exports (100k rows), end to end
+    directory = tempfile.TemporaryDirectory()
+    reference = datasets.unicorn_reference()
+    portfolio = datasets.portfolio(10_000, reference).to_csv(index=False)
+    rounds = datasets.investment_rounds(100_000).to_csv(index=False)
+    paths = []
+    for i in range(files):
+        paths.append(os.path.join(directory.name, f"fund-{i}.csv"))
+        with open(paths[-1], "w") as f:
+            f.write(portfolio if i % 2 else rounds)
+
+    def run():
+        batch.run_batch(paths, os.path.join(directory.name, "report"), workers=workers)
+        directory    # kept alive until the case ends
+
+    return run
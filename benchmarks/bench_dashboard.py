@@ -0,0 +1,40 @@
+# benchmarks/bench_dashboard.py
+
+import datasets
+from harness import benchmark
+
+import profiling
+from valuations import ValuationHistory, quarter_movers, sort_quarters
+
+
+@benchmark("dashboard", companies=[1_500, 10_000], quarters=[8, 40, 120], quick={"quarters": [8, 40]})
+def quarter_mover_merge(companies, quarters):
+    df_full = datasets.quarterly_valuations(companies, quarters)
+    ordered = sort_quarters(df_full["Quarter"].unique())
+    return lambda: quarter_movers(df_full, ordered[-2], ordered[-1])
+
+
+@benchmark("dashboard", companies=[1_500, 10_000], quarters=[8, 40, 120], quick={"quarters": [8, 40]})
+def valuation_history_build(companies, quarters):
+    df_full = datasets.quarterly_valuations(companies, quarters)
+    return lambda: ValuationHistory.from_frame(df_full)
+
+
+@benchmark("dashboard", companies=[1_500, 10_000], quarters=[8, 40, 120], quick={"quarters": [8, 40]})
+def valuation_history_movers(companies, quarters):
+    history = ValuationHistory.from_frame(datasets.quarterly_valuations(companies, quarters))
+    return lambda: history.movers(history.quarters[-2], history.quarters[-1])
+
+
+@benchmark("dashboard", spans=[1_000, 100_000], quick={"spans": [1_000]})
+def profiling_spans(spans):
+    # Instrumentation overhead: a run of ``spans`` spans, then both exports
+    def profile():
+        profiling.start_run("benchmark")
+        for i in range(spans):
+            with profiling.span("step", rows=i):
+                pass
+        run = profiling.finish_run()
+        profiling.to_jsonl([run])
+        profiling.to_prometheus([run])
+    return profile
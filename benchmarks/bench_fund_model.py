@@ -0,0 +1,36 @@
+# benchmarks/bench_fund_model.py
+
+from dataclasses import replace
+
+from harness import benchmark
+
+from fund_engine import FOLLOW_ON_POLICIES, STAGES, FundModel, FundParams, StageParams, default_stages
+
+
+def _params(deals):
+    # Spread deals over the first three stages
+    stages = default_stages()
+    per_stage = [deals - 2 * (deals // 3), deals // 3, deals // 3]
+    for stage, n in zip(STAGES[:3], per_stage):
+        stages[stage] = StageParams(deals=n, loss_ratio=0.8, ticket_size=stages[stage].ticket_size / 10)
+    return FundParams(stages=stages)
+
+
+@benchmark("fund_model", deals=[10, 100, 1000], trials=[1, 1_000, 100_000], quick={"trials": [1, 1_000]})
+def simulate_trials(deals, trials):
+    model = FundModel(_params(deals))
+    return lambda: model.simulate_trials(trials, seed=0)
+
+
+@benchmark("fund_model", deals=[10, 100, 1000])
+def simulate_single_draw(deals):
+    model = FundModel(_params(deals))
+    return lambda: model.simulate(seed=0)
+
+
+@benchmark("fund_model", policy=FOLLOW_ON_POLICIES, deals=[1_000, 10_000], trials=[2_000, 100_000],
+           quick={"deals": [10_000], "trials": [2_000]})
+def reserve_allocation(policy, deals, trials):
+    # Ordered policies walk every follow-on call; at 10k deals a chunk holds only ~130 trials
+    model = FundModel(replace(_params(deals), follow_on_policy=policy))
+    return lambda: model.simulate_trials(trials, seed=0)
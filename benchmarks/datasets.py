@@ -0,0 +1,101 @@
+# benchmarks/datasets.py
+#
+# Synthetic single- and multi-firm portfolios, investment-rounds exports and
+# quarterly valuation snapshots for the benchmarks. Company names come from Faker; large frames
+# sample a bounded name pool with NumPy so generation stays fast at 5M rows.
+
+import numpy as np
+import pandas as pd
+from faker import Faker
+
+FUNDING_ROUNDS = [
+    "Pre-Seed Round", "Seed Round", "Series A", "Series B", "Series C",
+    "Series D", "Series E", "Venture Round", "Convertible Note",
+]
+MAX_NAME_POOL = 50_000
+
+
+def company_names(n, seed=0):
+    fake = Faker()
+    Faker.seed(seed)
+    names, seen = [], set()
+    while len(names) < n:
+        name = fake.company()
+        if name in seen:
+            name = f"{name} {len(names)}"
+        seen.add(name)
+        names.append(name)
+    return names
+
+
+def unicorn_reference(n=2_000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "organization name": company_names(n, seed),
+        "post_money_valuation_(in b)": np.round(rng.lognormal(1.0, 0.8, n) + 1, 2),
+    })
+
+
+def portfolio(rows, reference, hit_rate=0.05, seed=1):
+    # Upload with ``hit_rate`` of its rows drawn from the reference names
+    rng = np.random.default_rng(seed)
+    pool = np.array(company_names(min(rows, MAX_NAME_POOL), seed + 1), dtype=object)
+    names = pool[rng.integers(0, len(pool), rows)]
+    hits = rng.random(rows) < hit_rate
+    ref_names = reference["organization name"].to_numpy()
+    names[hits] = ref_names[rng.integers(0, len(ref_names), hits.sum())]
+    return pd.DataFrame({"organization name": names})
+
+
+def firm_portfolios(firms, rows, reference, hit_rate=0.05, seed=4):
+    # Multi-firm upload: portfolio rows spread over ``firms`` "VC Firm" values
+    rng = np.random.default_rng(seed)
+    df = portfolio(rows, reference, hit_rate, seed)
+    df["vc firm"] = np.array([f"Firm {i}" for i in range(firms)], dtype=object)[rng.integers(0, firms, rows)]
+    return df
+
+
+def investor_lists(companies, investors=2_000, per_company=5, seed=5):
+    # Unicorn-style rows with a comma-joined, Zipf-weighted investor list each
+    rng = np.random.default_rng(seed)
+    pool = np.array([f"Capital Partners {i}" for i in range(investors)], dtype=object)
+    weights = 1 / np.arange(1, investors + 1)
+    picks = rng.choice(investors, (companies, per_company), p=weights / weights.sum())
+    return pd.DataFrame({
+        "organization name": [f"Company {i}" for i in range(companies)],
+        "lead investors include": [", ".join(pool[row]) for row in picks],
+    })
+
+
+def investment_rounds(rows, seed=2, companies=None):
+    # ``companies`` overrides the bounded name pool; names past MAX_NAME_POOL are "Company {i}"
+    rng = np.random.default_rng(seed)
+    if companies is None:
+        companies = min(max(rows // 3, 1), MAX_NAME_POOL)
+    names = company_names(min(companies, MAX_NAME_POOL), seed)
+    names += [f"Company {i}" for i in range(len(names), companies)]
+    pool = np.array(names, dtype=object)
+    orgs = pool[rng.integers(0, len(pool), rows)]
+    rounds = np.array(FUNDING_ROUNDS, dtype=object)[rng.integers(0, len(FUNDING_ROUNDS), rows)]
+    days = rng.integers(0, 15 * 365, rows)
+    return pd.DataFrame({
+        "announced date": pd.Timestamp("2010-01-01") + pd.to_timedelta(days, unit="D"),
+        "organization name": orgs,
+        "funding round": rounds + " - " + orgs,
+        "lead investor": np.where(rng.random(rows) < 0.3, "Yes", "No"),
+    })
+
+
+def quarterly_valuations(companies, quarters, seed=3):
+    rng = np.random.default_rng(seed)
+    names = company_names(min(companies, MAX_NAME_POOL), seed)
+    names += [f"Company {i}" for i in range(len(names), companies)]
+    labels = [f"Q{q % 4 + 1} {2000 + q // 4}" for q in range(quarters)]
+    values = rng.lognormal(1.0, 0.8, (quarters, companies)).cumprod(axis=0) ** 0.1
+    present = rng.random((quarters, companies)) < 0.9
+    q_idx, c_idx = np.nonzero(present)
+    return pd.DataFrame({
+        "Company": np.array(names, dtype=object)[c_idx],
+        "Quarter": np.array(labels, dtype=object)[q_idx],
+        "Post Money Value": values[q_idx, c_idx],
+    })
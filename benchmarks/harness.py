@@ -0,0 +1,78 @@
+# benchmarks/harness.py
+#
+# Minimal asv-style harness: benchmark functions register a parameter grid,
+# do their setup and return a zero-argument callable that is timed. Every
+# case runs in a fresh spawned process so peak RSS belongs to that case alone.
+
+import itertools
+import multiprocessing
+import resource
+import statistics
+import sys
+import time
+import traceback
+from dataclasses import dataclass
+
+REGISTRY = []
+
+
+@dataclass
+class Benchmark:
+    group: str
+    name: str
+    func: object
+    params: dict      # {param: [values, …]}
+    quick: dict       # reduced grid for --quick runs
+
+    def cases(self, quick=False):
+        grid = {**self.params, **self.quick} if quick else self.params
+        names = list(grid)
+        for combo in itertools.product(*(grid[n] for n in names)):
+            yield dict(zip(names, combo))
+
+
+def benchmark(group, quick=None, **params):
+    """Register ``func(**case) -> callable``; the returned callable is timed."""
+    def wrap(func):
+        REGISTRY.append(Benchmark(group, func.__name__, func, params, quick or {}))
+        return func
+    return wrap
+
+
+def _max_rss_mb():
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def _run_case(module, name, case, repeat, queue):
+    try:
+        __import__(module)
+        bench = next(b for b in REGISTRY if b.func.__module__ == module and b.name == name)
+        fn = bench.func(**case)
+        setup_rss = _max_rss_mb()
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+        queue.put({
+            "min_s": min(times),
+            "median_s": statistics.median(times),
+            "setup_rss_mb": setup_rss,
+            "peak_rss_mb": _max_rss_mb(),
+        })
+    except Exception:
+        queue.put({"error": traceback.format_exc(limit=3)})
+
+
+def run_case(bench, case, repeat=3, timeout=None):
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    proc = ctx.Process(target=_run_case, args=(bench.func.__module__, bench.name, case, repeat, queue))
+    proc.start()
+    proc.join(timeout)
+    if proc.is_alive():
+        proc.terminate()
+        return {"error": f"timeout after {timeout}s"}
+    return queue.get() if not queue.empty() else {"error": f"exit code {proc.exitcode}"}
@@ -0,0 +1,67 @@
+# benchmarks/run.py
+#
+# Time the fund model, analyzer and dashboard hot paths.
+#
+#     python benchmarks/run.py                  # full grid
+#     python benchmarks/run.py --quick -k fund  # small sizes, fund_model only
+#     python benchmarks/run.py --output bench.jsonl
+#
+# Each case reports min/median wall time over --repeat runs and the peak RSS
+# of the isolated process that ran it. Results append to --output as JSON lines.
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [HERE, os.path.dirname(HERE)]
+
+from harness import REGISTRY, run_case  # noqa: E402
+
+BENCH_MODULES = ["bench_fund_model", "bench_analyzer", "bench_dashboard"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run Formula Venture benchmarks.")
+    parser.add_argument("-k", "--filter", default="", help="only run benchmarks whose group/name contains this")
+    parser.add_argument("--quick", action="store_true", help="use the reduced parameter grids")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=600, help="seconds per case")
+    parser.add_argument("--output", help="append results as JSON lines to this file")
+    args = parser.parse_args(argv)
+
+    for module in BENCH_MODULES:
+        __import__(module)
+
+    run_id = time.strftime("%Y-%m-%dT%H:%M:%S")
+    out = open(args.output, "a") if args.output else None
+    print(f"{'benchmark':<60} {'min (s)':>10} {'median (s)':>11} {'peak RSS (MB)':>14}")
+    try:
+        for bench in REGISTRY:
+            label = f"{bench.group}.{bench.name}"
+            if args.filter not in label:
+                continue
+            for case in bench.cases(args.quick):
+                result = run_case(bench, case, args.repeat, args.timeout)
+                case_label = f"{label}[{', '.join(f'{k}={v}' for k, v in case.items())}]"
+                if "error" in result:
+                    print(f"{case_label:<60} ERROR {result['error'].strip().splitlines()[-1]}")
+                else:
+                    print(f"{case_label:<60} {result['min_s']:>10.4f} {result['median_s']:>11.4f} "
+                          f"{result['peak_rss_mb']:>14.1f}")
+                if out:
+                    out.write(json.dumps({
+                        "run": run_id, "python": platform.python_version(), "group": bench.group,
+                        "benchmark": bench.name, "params": case, **result,
+                    }) + "\n")
+                    out.flush()
+    finally:
+        if out:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+# data_sources.py
+#
+# Cached, offline-capable feeds for the dashboard's Google Sheets.
+# Each feed is fetched over HTTP into an on-disk Parquet cache with its
+# ETag / Last-Modified headers. Within the TTL the cache is served as is;
+# after it, the cached copy is served immediately while a background thread
+# revalidates it with a conditional GET (stale-while-revalidate). With no
+# cache and no network, a feed falls back to the CSVs bundled with the repo.
+#
+#     result = load_feed("unicorns")
+#     result.data, result.status      # status: cache | stale | network | fallback
+#
+# FEED_CACHE_DIR and FEED_CACHE_TTL (seconds) configure the cache; the
+# UNICORN_SHEET_URL / UNICORN_DETAILS_URL variables point the feeds elsewhere,
+# e.g. at a local HTTP server in tests.
+
+import io
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from hashlib import sha256
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import requests
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR_ENV = "FEED_CACHE_DIR"
+TTL_ENV = "FEED_CACHE_TTL"
+DEFAULT_CACHE_DIR = os.path.join(BASE_DIR, ".cache", "feeds")
+DEFAULT_TTL_SECONDS = 6 * 60 * 60
+FETCH_TIMEOUT_SECONDS = 10
+
+SHEET_URL = (
+    "https://docs.google.com/spreadsheets/d/e/"
+    "2PACX-1vQZDRRKispN6WmiiOKW0G1TBVt21_I-6QbO-rSbiCJrT-rU_UnVohI87LzzTDSPfdUcomDVcb61mJhb/"
+    "pub?gid=2128528272&single=true&output=csv"
+)
+ADDITIONAL_SHEET_URL = (
+    "https://docs.google.com/spreadsheets/d/e/"
+    "2PACX-1vQZDRRKispN6WmiiOKW0G1TBVt21_I-6QbO-rSbiCJrT-rU_UnVohI87LzzTDSPfdUcomDVcb61mJhb/"
+    "pub?gid=1650893883&single=true&output=csv"
+)
+
+# Quarter the bundled "June 25 - All Unicorns.csv" snapshot stands in for
+FALLBACK_QUARTER = "Q2 2025"
+
+
+# — Bundled fallbacks —
+def _bundled_unicorns():
+    df = pd.read_csv(os.path.join(BASE_DIR, "June 25 - All Unicorns.csv"), on_bad_lines="skip")
+    df = df.rename(columns={"Organization Name": "Company", "Post_Money_Valuation_(in B)": "Post Money Value"})
+    df["Quarter"] = FALLBACK_QUARTER
+    df["Total Equity Funding"] = float("nan")
+    return df
+
+
+def _bundled_details():
+    # Same Crunchbase export layout as the details sheet
+    return pd.read_csv(os.path.join(BASE_DIR, "Emerging_Unicorn_List-June_3rd_2025.csv"), on_bad_lines="skip")
+
+
+@dataclass(frozen=True)
+class Feed:
+    name: str
+    url: str
+    fallback: object = None          # callable returning a DataFrame when nothing else is available
+
+
+FEEDS = {
+    "unicorns": Feed("unicorns", os.environ.get("UNICORN_SHEET_URL") or SHEET_URL, _bundled_unicorns),
+    "unicorn_details": Feed("unicorn_details", os.environ.get("UNICORN_DETAILS_URL") or ADDITIONAL_SHEET_URL,
+                            _bundled_details),
+}
+
+
+@dataclass
+class FeedResult:
+    data: pd.DataFrame
+    status: str                      # cache | stale | network | fallback
+    fetched_at: float = None         # epoch seconds of the last successful fetch
+
+
+# — Cache —
+def _write_parquet(df, path):
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed-type sheet columns: store them as text
+        df = df.apply(lambda col: col.astype("string") if col.dtype == object else col)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    os.close(fd)
+    try:
+        pq.write_table(table, tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _write_json(meta, path):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(meta, f)
+    os.replace(tmp, path)
+
+
+class FeedCache:
+    """On-disk Parquet cache of HTTP CSV feeds with TTL and background revalidation."""
+
+    def __init__(self, directory=None, ttl=None, session=None, timeout=FETCH_TIMEOUT_SECONDS):
+        self.directory = directory or os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR
+        self.ttl = float(ttl if ttl is not None else os.environ.get(TTL_ENV) or DEFAULT_TTL_SECONDS)
+        self.session = session or requests.Session()
+        self.timeout = timeout
+        self._memory = {}            # key → (parquet mtime, DataFrame)
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="feed-refresh")
+
+    def _paths(self, feed):
+        key = f"{feed.name}-{sha256(feed.url.encode()).hexdigest()[:12]}"
+        return os.path.join(self.directory, f"{key}.parquet"), os.path.join(self.directory, f"{key}.json")
+
+    def _read_meta(self, feed):
+        try:
+            with open(self._paths(feed)[1]) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _read_data(self, feed):
+        path = self._paths(feed)[0]
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        cached = self._memory.get(path)
+        if cached is None or cached[0] != mtime:
+            try:
+                cached = (mtime, pd.read_parquet(path))
+            except (OSError, pa.ArrowInvalid):
+                return None
+            self._memory[path] = cached
+        return cached[1]
+
+    def fetch(self, feed, meta=None):
+        """Conditional GET into the cache. Returns the new DataFrame, or None if unchanged."""
+        headers = {}
+        if meta and meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta and meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        response = self.session.get(feed.url, headers=headers, timeout=self.timeout)
+        data_path, meta_path = self._paths(feed)
+        if response.status_code == 304 and meta:
+            _write_json({**meta, "fetched_at": time.time()}, meta_path)
+            return None
+        response.raise_for_status()
+        df = pd.read_csv(io.BytesIO(response.content))
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            _write_parquet(df, data_path)
+            _write_json({
+                "url": feed.url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "fetched_at": time.time(),
+            }, meta_path)
+        except OSError as e:
+            logger.warning("Could not cache %s: %s", feed.name, e)
+        return df
+
+    def _revalidate(self, feed):
+        try:
+            self.fetch(feed, self._read_meta(feed))
+        except (requests.RequestException, OSError, ValueError, pd.errors.ParserError) as e:
+            logger.warning("Background refresh of %s failed: %s", feed.name, e)
+        finally:
+            with self._lock:
+                self._refreshing.discard(feed.name)
+
+    def refresh_in_background(self, feed):
+        # One revalidation per feed in flight at a time
+        with self._lock:
+            if feed.name in self._refreshing:
+                return None
+            self._refreshing.add(feed.name)
+        return self._executor.submit(self._revalidate, feed)
+
+    def load(self, feed):
+        meta = self._read_meta(feed)
+        data = self._read_data(feed) if meta else None
+        if data is not None:
+            if time.time() - meta.get("fetched_at", 0) < self.ttl:
+                return FeedResult(data, "cache", meta.get("fetched_at"))
+            self.refresh_in_background(feed)
+            return FeedResult(data, "stale", meta.get("fetched_at"))
+
+        # Cold start: fetch in the foreground, or fall back to the bundled copy
+        try:
+            return FeedResult(self.fetch(feed), "network", time.time())
+        except (requests.RequestException, ValueError, pd.errors.ParserError) as e:
+            if feed.fallback is None:
+                raise
+            logger.warning("Fetching %s failed, using bundled data: %s", feed.name, e)
+            return FeedResult(feed.fallback(), "fallback")
+
+
+@lru_cache(maxsize=1)
+def get_feed_cache():
+    return FeedCache()
+
+
+def load_feed(name, cache=None):
+    cache = get_feed_cache() if cache is None else cache
+    return cache.load(FEEDS[name])
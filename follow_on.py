@@ -0,0 +1,151 @@
+# follow_on.py
+#
+# Vectorized follow-on analytics over investment rounds.
+# Rounds are held as integer company and stage codes sorted by company, then
+# date, so every per-company aggregate is a reduceat over the group
+# boundaries: round counts with np.add.reduceat, the set of distinct stages as
+# a bitmask with np.bitwise_or.reduceat. "Seed Round, Series A" strings are
+# only built for the rows a table actually shows.
+#
+#     follow_on = FollowOn.from_frame(df_rounds)
+#     follow_on.table(["Stripe", "OpenAI"])
+#     follow_on.transition_matrix(), follow_on.median_days_between_rounds()
+
+import numpy as np
+import pandas as pd
+
+# Day code of rounds without a (parseable) announced date
+NO_DATE = np.iinfo(np.int32).min
+
+
+def stage_bitsets(stage, starts, n_stages):
+    # OR of 1 << stage over each group, one uint64 word per 64 stages
+    words = max(1, -(-n_stages // 64))
+    bitsets = np.zeros((len(starts), words), dtype=np.uint64)
+    if not len(starts):
+        return bitsets
+    bit = np.left_shift(np.uint64(1), (stage % 64).astype(np.uint64))
+    for word in range(words):
+        bitsets[:, word] = np.bitwise_or.reduceat(np.where(stage // 64 == word, bit, np.uint64(0)), starts)
+    return bitsets
+
+
+def decode_stages(bitsets, stages):
+    # Bitset rows → "Seed Round, Series A" strings, decoded once per distinct set
+    if not len(bitsets):
+        return np.array([], dtype=object)
+    distinct, inverse = np.unique(bitsets, axis=0, return_inverse=True)
+    bits = np.arange(len(stages))
+    labels = np.array([
+        ", ".join(stages[(row[bits // 64] >> (bits % 64).astype(np.uint64)) & np.uint64(1) == 1])
+        for row in distinct
+    ], dtype=object)
+    return labels[inverse.reshape(-1)]
+
+
+def _group_starts(codes):
+    return np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]]) if len(codes) else np.array([], dtype=np.int64)
+
+
+class FollowOn:
+    """Rounds of a set of companies, encoded and sorted for per-company reductions."""
+
+    def __init__(self, companies, stages, company, stage, day=None):
+        # companies/stages: names; company/stage: codes per round (company -1 = unnamed, dropped);
+        # day: days since 1970-01-01 per round, NO_DATE when unknown
+        company = np.asarray(company, dtype=np.int64)
+        day = np.full(len(company), NO_DATE, dtype=np.int64) if day is None else np.asarray(day, dtype=np.int64)
+        named = company >= 0
+        company, stage, day = company[named], np.asarray(stage, dtype=np.int64)[named], day[named]
+
+        # Stage codes in alphabetical order, so bitsets decode to sorted stage lists
+        stages = np.asarray(stages, dtype=object)
+        alphabetical = np.argsort(stages.astype(str), kind="stable")
+        rank = np.empty(len(stages), dtype=np.int64)
+        rank[alphabetical] = np.arange(len(stages))
+        # Same-day rounds of a company in stage order, so transitions don't depend on row order
+        order = np.lexsort((rank[stage], day, company))
+        self._init_sorted(np.asarray(companies, dtype=object), stages[alphabetical],
+                          company[order], rank[stage[order]], day[order])
+
+    def _init_sorted(self, companies, stages, company, stage, day):
+        self.companies, self.stages = companies, stages
+        self.company, self.stage, self.day = company, stage, day
+        self.starts = _group_starts(company)
+
+    @classmethod
+    def from_frame(cls, df_rounds):
+        # From "organization name" / "funding round" (cleaned) and optional "announced date" columns
+        company, companies = pd.factorize(df_rounds["organization name"])
+        stage, stages = pd.factorize(df_rounds["funding round"].astype(object).fillna("nan"))
+        day = None
+        if "announced date" in df_rounds.columns:
+            dates = pd.to_datetime(df_rounds["announced date"], errors="coerce")
+            day = np.where(dates.isna(), NO_DATE, dates.to_numpy(dtype="datetime64[D]").astype(np.int64))
+        return cls(companies, stages, company, stage, day)
+
+    def restrict(self, mask):
+        """Rounds where ``mask`` (per sorted round) is set; keeps the sort, no re-encoding."""
+        follow_on = FollowOn.__new__(FollowOn)
+        follow_on._init_sorted(self.companies, self.stages, self.company[mask], self.stage[mask], self.day[mask])
+        return follow_on
+
+    def between(self, first_year, last_year):
+        # Dated rounds announced in [first_year, last_year]
+        lo = (np.datetime64(f"{first_year}-01-01") - np.datetime64("1970-01-01")).astype(np.int64)
+        hi = (np.datetime64(f"{last_year + 1}-01-01") - np.datetime64("1970-01-01")).astype(np.int64)
+        return self.restrict((self.day >= lo) & (self.day < hi))
+
+    # — Per company —
+    def counts(self):
+        # Rounds per company, as (company codes, counts)
+        return self.company[self.starts], np.diff(np.r_[self.starts, len(self.company)])
+
+    def table(self, companies=None, min_count=1):
+        """Investment Count and Investment Stages per organization.
+
+        Only the rows returned (``companies`` by name, and ``min_count`` or more rounds) are decoded.
+        """
+        codes, counts = self.counts()
+        rows = np.flatnonzero(counts >= min_count)
+        if companies is not None:
+            wanted = pd.Index(self.companies).get_indexer(pd.unique(pd.Series(companies, dtype=object).dropna()))
+            rows = rows[np.isin(codes[rows], wanted[wanted >= 0])]
+        bitsets = stage_bitsets(self.stage, self.starts, len(self.stages))[rows]
+        table = pd.DataFrame({
+            "Investment Count": counts[rows].astype(np.int64),
+            "Investment Stages": decode_stages(bitsets, self.stages),
+        }, index=pd.Index(self.companies[codes[rows]], name="organization name"))
+        return table.sort_index()
+
+    # — Between rounds —
+    def _consecutive(self):
+        # Index pairs (i, i + 1) of a company's consecutive dated rounds
+        dated = self.day != NO_DATE
+        same = (self.company[1:] == self.company[:-1]) & dated[1:] & dated[:-1]
+        first = np.flatnonzero(same)
+        return first, first + 1
+
+    def transition_matrix(self):
+        """Counts of stage → next stage over consecutive dated rounds of each company."""
+        first, second = self._consecutive()
+        n = len(self.stages)
+        matrix = np.bincount(self.stage[first] * n + self.stage[second], minlength=n * n).reshape(n, n)
+        used = (matrix.sum(axis=0) + matrix.sum(axis=1)) > 0
+        return pd.DataFrame(matrix[np.ix_(used, used)],
+                            index=pd.Index(self.stages[used], name="From Stage"),
+                            columns=pd.Index(self.stages[used], name="To Stage"))
+
+    def days_between_rounds(self):
+        first, second = self._consecutive()
+        return self.day[second] - self.day[first]
+
+    def median_days_between_rounds(self):
+        gaps = self.days_between_rounds()
+        return float(np.median(gaps)) if len(gaps) else float("nan")
+
+    def median_days_to_stage(self):
+        # Median days from the previous round, by the stage reached
+        first, second = self._consecutive()
+        gaps = pd.Series(self.day[second] - self.day[first])
+        return gaps.groupby(self.stages[self.stage[second]]).median().rename("Median Days").rename_axis("Stage")
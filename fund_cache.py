@@ -0,0 +1,186 @@
+# fund_cache.py
+#
+# Memoized fund model results keyed by a canonical hash of FundParams + seed.
+# An in-memory LRU sits in front of an optional on-disk pickle store, so a
+# reopened scenario is served instantly and always gives the same output.
+# The LRU is bounded by the bytes its results hold as well as by entry count:
+# trial results kept with their deal tables run to ~100 MB each.
+#
+#     result = cached_simulate(params, seed=42)
+#     trials = cached_simulate_trials(params, 10_000, seed=42)
+#
+# Set FUND_MODEL_CACHE_DIR to persist results across processes.
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from fund_cashflows import simulate_cash_flows
+from fund_engine import FundModel
+from fund_stats import stream_trials
+
+CACHE_DIR_ENV = "FUND_MODEL_CACHE_DIR"
+DEFAULT_MAX_ENTRIES = 128
+DEFAULT_MAX_BYTES = 512 * 1024 ** 2
+
+
+def params_hash(params, seed, **extra):
+    # Canonical JSON: sorted keys, floats normalised so 5 and 5.0 hash alike
+    def canon(value):
+        if isinstance(value, dict):
+            return {str(k): canon(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [canon(v) for v in value]
+        if isinstance(value, bool) or value is None or isinstance(value, str):
+            return value
+        return repr(float(value))
+
+    payload = {"params": canon(params.to_dict()), "seed": seed, "extra": canon(extra)}
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+def result_nbytes(value):
+    # Bytes held by the arrays and frames inside a result (dataclasses and plain objects walked)
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return int(np.sum(value.memory_usage(deep=True)))
+    if isinstance(value, dict):
+        return sum(result_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(result_nbytes(v) for v in value)
+    if hasattr(value, "__dict__"):
+        return result_nbytes(vars(value))
+    return 0
+
+
+class ResultCache:
+    """LRU of simulation results with an optional directory-backed second tier.
+
+    The in-memory tier holds at most ``max_entries`` results and ``max_bytes``
+    of their arrays; a result larger than ``max_bytes`` alone is only stored on disk.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def get(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+        if self.directory and os.path.exists(self._path(key)):
+            try:
+                with open(self._path(key), "rb") as f:
+                    value = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                value = None
+            if value is not None:
+                self._remember(key, value)
+                with self._lock:
+                    self.hits += 1
+                return value
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, value):
+        self._remember(key, value)
+        if self.directory:
+            # Write-then-rename so concurrent readers never see a partial file
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(key))
+
+    def _remember(self, key, value):
+        size = result_nbytes(value)
+        with self._lock:
+            self._forget(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = value
+            self._sizes[key] = size
+            self.nbytes += size
+            while len(self._entries) > self.max_entries or self.nbytes > self.max_bytes:
+                self._forget(next(iter(self._entries)))
+
+    def _forget(self, key):
+        # Caller holds the lock
+        if key in self._entries:
+            del self._entries[key]
+            self.nbytes -= self._sizes.pop(key)
+
+    def get_or_compute(self, key, compute):
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.nbytes = 0
+            self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+RESULT_CACHE = ResultCache(directory=os.environ.get(CACHE_DIR_ENV) or None)
+
+
+def cached_simulate(params, seed, cache=None):
+    if seed is None:
+        return FundModel(params).simulate(seed)
+    cache = RESULT_CACHE if cache is None else cache
+    key = params_hash(params, seed, kind="simulate")
+    return cache.get_or_compute(key, lambda: FundModel(params).simulate(seed))
+
+
+def cached_simulate_trials(params, trials, seed, cache=None, **kwargs):
+    if seed is None:
+        return FundModel(params).simulate_trials(trials, seed, **kwargs)
+    cache = RESULT_CACHE if cache is None else cache
+    key = params_hash(params, seed, kind="simulate_trials", trials=trials, **kwargs)
+    return cache.get_or_compute(key, lambda: FundModel(params).simulate_trials(trials, seed, **kwargs))
+
+
+def cached_simulate_cash_flows(params, trials, seed, cache=None, **kwargs):
+    if seed is None:
+        return simulate_cash_flows(params, trials, seed, **kwargs)
+    cache = RESULT_CACHE if cache is None else cache
+    key = params_hash(params, seed, kind="simulate_cash_flows", trials=trials, **kwargs)
+    return cache.get_or_compute(key, lambda: simulate_cash_flows(params, trials, seed, **kwargs))
+
+
+def cached_stream_trials(params, trials, seed, cache=None, **kwargs):
+    if seed is None:
+        return stream_trials(params, trials, seed, workers=None, **kwargs)
+    cache = RESULT_CACHE if cache is None else cache
+    key = params_hash(params, seed, kind="stream_trials", trials=trials, **kwargs)
+    return cache.get_or_compute(key, lambda: stream_trials(params, trials, seed, workers=None, **kwargs))
@@ -0,0 +1,170 @@
+# fund_cashflows.py
+#
+# Quarterly cash-flow simulation for the Fund Model Simulator.
+# Schedules initial checks over the investment period, follow-ons round by
+# round, management fees every quarter and exits by entry stage, then reports
+# IRR, DPI over time and J-curve percentile bands across all trials.
+#
+# IRR is solved for every trial at once by vectorized bisection on the NPV,
+# so thousands of trials never fall back to a per-trial optimizer call.
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from fund_engine import DEFAULT_CHUNK_ELEMENTS, STAGES, FundModel
+
+QUARTERS_PER_YEAR = 4
+INVESTMENT_PERIOD_YEARS = 3
+ROUND_GAP_QUARTERS = (5, 8)      # quarters between follow-on rounds, inclusive
+EXIT_JITTER_YEARS = 1.5
+# Typical holding period from entry to exit
+YEARS_TO_EXIT_BY_STAGE = {
+    "Pre-seed": 8.0, "Seed": 7.0, "Series A": 6.0,
+    "Series B": 5.0, "Series C": 4.0, "Series D": 3.0, "Series E+": 2.0
+}
+
+
+# — IRR —
+# Quarterly rates scanned to bracket each trial's IRR before bisection
+IRR_RATE_GRID = np.concatenate([np.linspace(-0.5, 0.5, 41), [0.75, 1.0, 2.0, 4.0]])
+
+
+def irr(cash_flows, periods_per_year=QUARTERS_PER_YEAR, iterations=50):
+    """Annualised IRR of each row of ``cash_flows`` (trials × periods).
+
+    NPV is scanned over IRR_RATE_GRID; where it changes sign more than once
+    (fees after the last exit) the root closest to 0% is taken. Rows without a
+    sign change return NaN.
+    """
+    cf = np.atleast_2d(np.asarray(cash_flows, dtype=float))
+    t = np.arange(cf.shape[1])
+
+    def npv(rate):
+        return (cf * np.exp(-np.log1p(rate)[:, None] * t)).sum(axis=1)
+
+    n = cf.shape[0]
+    signs = np.stack([np.sign(npv(np.full(n, r))) for r in IRR_RATE_GRID])
+    change = (signs[:-1] != signs[1:]) & (signs[:-1] != 0)
+    mids = np.abs(IRR_RATE_GRID[:-1] + IRR_RATE_GRID[1:])
+    bracket = np.where(change, mids[:, None], np.inf).argmin(axis=0)
+    valid = change.any(axis=0)
+
+    lo, hi = IRR_RATE_GRID[bracket], IRR_RATE_GRID[bracket + 1]
+    s_lo = signs[bracket, np.arange(n)]
+    for _ in range(iterations):
+        mid = (lo + hi) / 2
+        left = np.sign(npv(mid)) == s_lo
+        lo = np.where(left, mid, lo)
+        hi = np.where(left, hi, mid)
+
+    rate = (lo + hi) / 2
+    return np.where(valid, (1 + rate) ** periods_per_year - 1, np.nan)
+
+
+# — Results —
+@dataclass
+class CashFlowResults:
+    """Per-trial quarterly LP cash flows."""
+
+    calls: np.ndarray            # (trials, quarters) checks + fees called
+    distributions: np.ndarray    # (trials, quarters) exits net of carry
+    fund_size: float
+
+    @property
+    def quarters(self):
+        return self.calls.shape[1]
+
+    @property
+    def net_cash_flow(self):
+        return self.distributions - self.calls
+
+    @property
+    def dpi_over_time(self):
+        called = np.cumsum(self.calls, axis=1)
+        paid = np.cumsum(self.distributions, axis=1)
+        return np.divide(paid, called, out=np.zeros_like(paid), where=called > 0)
+
+    @property
+    def j_curve(self):
+        # Cumulative net cash flow as a multiple of commitments
+        return np.cumsum(self.net_cash_flow, axis=1) / self.fund_size
+
+    @property
+    def irr(self):
+        return irr(self.net_cash_flow)
+
+    def bands(self, values, percentiles=(10, 50, 90)):
+        pct = np.nanpercentile(values, percentiles, axis=0)
+        years = np.arange(1, self.quarters + 1) / QUARTERS_PER_YEAR
+        return pd.DataFrame({f"P{p}": row for p, row in zip(percentiles, pct)}, index=pd.Index(years, name="Year"))
+
+    def summary(self, percentiles=(10, 50, 90)):
+        irrs = self.irr
+        finite = irrs[np.isfinite(irrs)]
+        stats = {f"P{p}": float(v) for p, v in zip(percentiles, np.percentile(finite, percentiles))} if len(finite) else {}
+        j = self.j_curve
+        breakeven = _breakeven_quarter(j)
+        breakeven = breakeven[np.isfinite(breakeven)]
+        return {
+            "irr": stats,
+            "irr_undefined": float(1 - len(finite) / len(irrs)) if len(irrs) else 0.0,
+            "trough": float(np.median(j.min(axis=1))),
+            "breakeven_share": float(len(breakeven) / len(j)) if len(j) else 0.0,
+            "breakeven_year": float(np.median(breakeven)) / QUARTERS_PER_YEAR if len(breakeven) else float("nan"),
+        }
+
+
+def _breakeven_quarter(j_curve):
+    # First quarter after the trough where cumulative net cash turns non-negative
+    after_trough = np.arange(j_curve.shape[1]) >= j_curve.argmin(axis=1)[:, None]
+    positive = after_trough & (j_curve >= 0)
+    return np.where(positive.any(axis=1), positive.argmax(axis=1) + 1, np.nan)
+
+
+# — Simulation —
+def simulate_cash_flows(params, trials=5_000, seed=None, investment_period_years=INVESTMENT_PERIOD_YEARS,
+                        calibrate_to_target=False, chunk_elements=DEFAULT_CHUNK_ELEMENTS):
+    model = FundModel(params)
+    layout = model.layout
+    quarters = max(1, int(round(params.duration_years * QUARTERS_PER_YEAR)))
+    invest_quarters = max(1, min(quarters, int(round(investment_period_years * QUARTERS_PER_YEAR))))
+    if isinstance(seed, np.random.Generator):
+        timing_rng = seed
+    else:
+        timing_rng = np.random.default_rng(None if seed is None else [seed, 1])
+    years_to_exit = np.array([YEARS_TO_EXIT_BY_STAGE[s] for s in STAGES])[layout.stage_idx]
+    quarterly_fee = params.fund_size_dollars * (params.mgmt_fee_pct / 100) / QUARTERS_PER_YEAR
+
+    calls = np.zeros((trials, quarters))
+    exits = np.zeros((trials, quarters))
+    start = 0
+    for out in model.iter_chunks(trials, seed, calibrate_to_target, chunk_elements):
+        t, n, r = out.round_spent.shape
+        stop = start + t
+
+        entry_q = timing_rng.integers(0, invest_quarters, size=(t, n))
+        gaps = timing_rng.integers(ROUND_GAP_QUARTERS[0], ROUND_GAP_QUARTERS[1] + 1, size=(t, n, r))
+        round_q = np.minimum(entry_q[:, :, None] + np.cumsum(gaps, axis=2), quarters - 1)
+        hold = years_to_exit + timing_rng.uniform(-EXIT_JITTER_YEARS, EXIT_JITTER_YEARS, size=(t, n))
+        exit_q = entry_q + np.maximum(1, np.round(hold * QUARTERS_PER_YEAR)).astype(int)
+        last_round_q = np.where(out.round_spent > 0, round_q, -1).max(axis=2)
+        exit_q = np.minimum(np.maximum(exit_q, last_round_q + 1), quarters - 1)   # unexited at fund end
+
+        row = np.arange(t)[:, None] * quarters
+        size = t * quarters
+        chunk_calls = np.bincount((row + entry_q).ravel(), np.broadcast_to(layout.ticket, (t, n)).ravel(), size)
+        chunk_calls += np.bincount((row[:, :, None] + round_q).ravel(), out.round_spent.ravel(), size)
+        calls[start:stop] = chunk_calls.reshape(t, quarters)
+        exits[start:stop] = np.bincount((row + exit_q).ravel(), out.fair.ravel(), size).reshape(t, quarters)
+        start = stop
+
+    calls += quarterly_fee
+
+    # European waterfall: carry on cumulative exits above fund size, paid as earned
+    carry_rate = params.carry_pct / 100
+    cum_carry = carry_rate * np.maximum(np.cumsum(exits, axis=1) - params.fund_size_dollars, 0.0)
+    carry = np.diff(cum_carry, axis=1, prepend=0.0)
+
+    return CashFlowResults(calls=calls, distributions=exits - carry, fund_size=float(params.fund_size_dollars))
@@ -0,0 +1,651 @@
+# fund_engine.py
+#
+# Streamlit-free core of the Fund Model Simulator.
+# Typed parameters, the single-draw deal table behind fund_model.run(), and a
+# vectorized Monte Carlo engine that runs N trials at once as
+# (trials × deals × rounds) arrays and reports TVPI / DPI / MOIC distributions.
+#
+#     from fund_engine import FundParams, StageParams, simulate
+#     params = FundParams(stages={"Seed": StageParams(deals=20, ticket_size=5e6)})
+#     result = simulate(params, seed=7)
+
+from dataclasses import asdict, dataclass, field
+
+import numpy as np
+import pandas as pd
+
+# — Stages & Dilution Factors —
+STAGES = ["Pre-seed", "Seed", "Series A", "Series B", "Series C", "Series D", "Series E+"]
+EXIT_DILUTION_FACTORS = {
+    "Pre-seed": 0.30, "Seed": 0.39, "Series A": 0.52,
+    "Series B": 0.67, "Series C": 0.79, "Series D": 0.92, "Series E+": 1.00
+}
+# Typical exit valuations (in dollars) used to seed non-unicorn outcomes
+BASE_VALUATION_BY_STAGE = {
+    "Pre-seed":  50e6,
+    "Seed":     150e6,
+    "Series A": 300e6,
+    "Series B": 600e6,
+    "Series C": 1_200e6,
+    "Series D": 3_000e6,
+    "Series E+": 10_000e6,
+}
+
+# Default Ticket Sizes
+DEFAULT_TICKET_SIZES = {
+    "Pre-seed": 2_500_000, "Seed": 5_000_000, "Series A": 15_000_000,
+    "Series B": 25_000_000, "Series C": 35_000_000,
+    "Series D": 50_000_000, "Series E+": 75_000_000
+}
+
+# Nested Follow-On Multiplier Ranges
+FOLLOW_ON_MULTIPLIERS = {
+    "Pre-seed": {
+        "Seed":     (1.5, 3.0), "Series A": (1.2, 2.5),
+        "Series B": (1.0, 2.0), "Series C": (0.8, 1.5)
+    },
+    "Seed": {
+        "Series A": (1.0, 3.0), "Series B": (0.8, 2.0),
+        "Series C": (0.7, 1.5), "Series D": (0.5, 1.2)
+    },
+    "Series A": {
+        "Series B": (1.0, 2.0), "Series C": (0.8, 1.5),
+        "Series D": (0.7, 1.2)
+    },
+    "Series B": {
+        "Series C": (0.8, 1.5), "Series D": (0.7, 1.2),
+        "Series E+": (0.5, 1.0)
+    },
+    "Series C": {
+        "Series D": (0.7, 1.2), "Series E+": (0.5, 1.0)
+    },
+    "Series D": {
+        "Series E+": (0.5, 1.0)
+    },
+    "Series E+": {}
+}
+DEFAULT_FOLLOW_ON_MULTIPLIER = (1.0, 1.5)
+
+MAX_FOLLOW_ONS = 3
+MOIC_CAP = 150
+UNICORN_MIN_MULTIPLE = 3    # unicorn = 3× typical non-uni base
+UNICORN_MAX_MULTIPLE = 10
+
+# Follow-on reserve allocation policies
+#   chronological  – calls are met in round order (every company's first
+#                    follow-on, then every second, …) until the reserve runs dry
+#   company_order  – calls are met company by company in deal-table order
+#   winners_first  – winners' calls first (chronologically), then the rest
+#   pro_rata       – every call is funded at the same fraction when oversubscribed
+FOLLOW_ON_POLICIES = ["chronological", "company_order", "winners_first", "pro_rata"]
+
+# Upper bound on trials × deals × rounds elements held in memory per chunk
+DEFAULT_CHUNK_ELEMENTS = 4_000_000
+# Follow-on calls an ordered reserve allocation tries to settle in one step
+ALLOCATION_BLOCK = 64
+
+
+# — Parameters —
+@dataclass(frozen=True)
+class StageParams:
+    deals: int = 0
+    loss_ratio: float = 0.90
+    ticket_size: float = 0.0
+    ownership_min: float = 0.10
+    ownership_max: float = 0.25
+
+
+def default_stages():
+    return {s: StageParams(ticket_size=DEFAULT_TICKET_SIZES[s]) for s in STAGES}
+
+
+@dataclass(frozen=True)
+class FundParams:
+    """Fund Assumptions, Follow-On Settings and Stage Breakdown of the sidebar.
+
+    Percent inputs (fees, carry) are in percent; rates and probabilities are
+    fractions, matching what fund_model.run() hands to the math.
+    """
+
+    fund_size_dollars: float = 100_000_000
+    mgmt_fee_pct: float = 2.0
+    duration_years: int = 10
+    carry_pct: float = 28.0
+    target_net_tvpi: float = 5.5
+    unicorn_capture_rate: float = 0.07
+    power_law_strength: float = 0.5
+    follow_on_reserve_pct: float = 0.20
+    winner_follow_on_prob: float = 0.7
+    follow_on_policy: str = "chronological"
+    stages: dict = field(default_factory=default_stages)
+
+    @property
+    def loser_follow_on_prob(self):
+        return 1.0 - self.winner_follow_on_prob
+
+    @property
+    def total_portfolio_companies(self):
+        return sum(int(s.deals) for s in self.stages.values())
+
+    def to_dict(self):
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data):
+        data = dict(data)
+        stages = data.pop("stages", None)
+        if stages is not None:
+            data["stages"] = {
+                s: v if isinstance(v, StageParams) else StageParams(**v) for s, v in stages.items()
+            }
+        return cls(**data)
+
+
+# — Core Fund Metrics —
+@dataclass(frozen=True)
+class FundMetrics:
+    fund_size: float
+    total_fees: float
+    net_return: float
+    required_gross_return: float
+    required_multiple: float
+    total_carry: float
+    follow_on_reserve: float
+    initial_investable_pool: float
+
+
+def fund_metrics(params):
+    carry_rate            = params.carry_pct / 100
+    total_fees            = params.fund_size_dollars * (params.mgmt_fee_pct / 100) * params.duration_years
+    investable_capital    = params.fund_size_dollars    # full fund used for return math
+    net_return            = params.fund_size_dollars * params.target_net_tvpi
+    required_gross        = (net_return - carry_rate * investable_capital + total_fees) / (1 - carry_rate)
+    required_multiple     = required_gross / investable_capital if investable_capital else 0
+    profit                = required_gross - investable_capital
+    return FundMetrics(
+        fund_size=investable_capital,
+        total_fees=total_fees,
+        net_return=net_return,
+        required_gross_return=required_gross,
+        required_multiple=required_multiple,
+        total_carry=carry_rate * profit,
+        follow_on_reserve=params.fund_size_dollars * params.follow_on_reserve_pct,
+        initial_investable_pool=params.fund_size_dollars * (1 - params.follow_on_reserve_pct),
+    )
+
+
+def net_distributions(gross_value, params):
+    # Inverse of the required gross return: carry on profit above fund size, less fees
+    carry_rate = params.carry_pct / 100
+    total_fees = params.fund_size_dollars * (params.mgmt_fee_pct / 100) * params.duration_years
+    profit = np.maximum(gross_value - params.fund_size_dollars, 0.0)
+    return gross_value - carry_rate * profit - total_fees
+
+
+# — Deal Layout —
+@dataclass
+class DealLayout:
+    """Static per-deal and per-round arrays shared by every trial."""
+
+    stage_idx: np.ndarray        # (deals,) int8 index into STAGES
+    ticket: np.ndarray           # (deals,) initial check
+    own_lo: np.ndarray           # (deals,) min entry ownership
+    own_hi: np.ndarray           # (deals,) max entry ownership
+    is_winner: np.ndarray        # (deals,) bool
+    round_valid: np.ndarray      # (deals, rounds) bool – a next stage exists
+    round_stage: np.ndarray      # (deals, rounds) int8 stage reached by the round
+    round_mult_lo: np.ndarray    # (deals, rounds) follow-on multiplier bounds
+    round_mult_hi: np.ndarray
+    skip_dilution: np.ndarray    # (deals, rounds) ownership retained when skipping
+
+    @property
+    def num_deals(self):
+        return len(self.stage_idx)
+
+    @property
+    def num_rounds(self):
+        return self.round_valid.shape[1]
+
+    @property
+    def winner_idx(self):
+        return np.flatnonzero(self.is_winner)
+
+
+def build_deal_layout(params, max_follow_ons=MAX_FOLLOW_ONS):
+    # Same ordering as the deal table: stage by stage, winners first within a stage
+    stage_idx, ticket, own_lo, own_hi, is_winner = [], [], [], [], []
+    for s in STAGES:
+        sp = params.stages.get(s)
+        if sp is None or sp.deals <= 0:
+            continue
+        d = int(sp.deals)
+        winners = int(d * (1 - sp.loss_ratio))
+        stage_idx += [STAGES.index(s)] * d
+        ticket += [sp.ticket_size] * d
+        own_lo += [sp.ownership_min] * d
+        own_hi += [sp.ownership_max] * d
+        is_winner += [True] * winners + [False] * (d - winners)
+
+    stage_idx = np.asarray(stage_idx, dtype=np.int8)
+    n = len(stage_idx)
+    dilution = np.array([EXIT_DILUTION_FACTORS[s] for s in STAGES])
+
+    round_valid = np.zeros((n, max_follow_ons), dtype=bool)
+    round_stage = np.zeros((n, max_follow_ons), dtype=np.int8)
+    round_mult_lo = np.ones((n, max_follow_ons))
+    round_mult_hi = np.ones((n, max_follow_ons))
+    skip_dilution = np.ones((n, max_follow_ons))
+    for e in np.unique(stage_idx):
+        rows = stage_idx == e
+        for r in range(max_follow_ons):
+            cur, nxt = e + r, e + r + 1
+            if nxt >= len(STAGES):
+                break
+            lo, hi = FOLLOW_ON_MULTIPLIERS.get(STAGES[e], {}).get(STAGES[nxt], DEFAULT_FOLLOW_ON_MULTIPLIER)
+            round_valid[rows, r] = True
+            round_stage[rows, r] = nxt
+            round_mult_lo[rows, r] = lo
+            round_mult_hi[rows, r] = hi
+            skip_dilution[rows, r] = dilution[cur] / dilution[nxt]
+
+    return DealLayout(
+        stage_idx=stage_idx,
+        ticket=np.asarray(ticket, dtype=float),
+        own_lo=np.asarray(own_lo, dtype=float),
+        own_hi=np.asarray(own_hi, dtype=float),
+        is_winner=np.asarray(is_winner, dtype=bool),
+        round_valid=round_valid,
+        round_stage=round_stage,
+        round_mult_lo=round_mult_lo,
+        round_mult_hi=round_mult_hi,
+        skip_dilution=skip_dilution,
+    )
+
+
+# — Results —
+@dataclass
+class SimulationResult:
+    """One simulated portfolio: the fund metrics plus its deal table."""
+
+    params: FundParams
+    metrics: FundMetrics
+    deals: "DealTable"           # single-trial DealTable
+    remaining_follow_on: float
+
+    @property
+    def gross_value(self):
+        return float(self.deals.fair_value.sum(dtype=np.float64))
+
+
+@dataclass
+class TrialResults:
+    """Per-trial fund outcomes, one entry per simulated portfolio."""
+
+    gross_value: np.ndarray      # fair value at exit across the portfolio
+    initial_invested: np.ndarray
+    follow_on_invested: np.ndarray
+    net_value: np.ndarray        # distributions to LPs after carry and fees
+    fund_size: float
+    total_fees: float
+    target_net_tvpi: float
+    deals: "DealTable" = None    # per-trial deal tables when kept for drill-down
+
+    @property
+    def trials(self):
+        return len(self.gross_value)
+
+    @property
+    def invested(self):
+        return self.initial_invested + self.follow_on_invested
+
+    @property
+    def gross_tvpi(self):
+        return self.gross_value / self.fund_size
+
+    @property
+    def net_tvpi(self):
+        return self.net_value / self.fund_size
+
+    @property
+    def dpi(self):
+        # All exits are realised at fund end: distributions over capital called
+        paid_in = self.invested + self.total_fees
+        return np.divide(self.net_value, paid_in, out=np.zeros_like(self.net_value), where=paid_in > 0)
+
+    @property
+    def moic(self):
+        invested = self.invested
+        return np.divide(self.gross_value, invested, out=np.zeros_like(self.gross_value), where=invested > 0)
+
+    def summary(self, percentiles=(10, 50, 90)):
+        out = {}
+        for name in ("net_tvpi", "gross_tvpi", "dpi", "moic"):
+            values = getattr(self, name)
+            stats = {f"P{p}": float(v) for p, v in zip(percentiles, np.percentile(values, percentiles))}
+            stats["mean"] = float(values.mean())
+            out[name] = stats
+        out["prob_target"] = float((self.net_tvpi >= self.target_net_tvpi).mean())
+        return out
+
+
+# — Simulation —
+@dataclass
+class ChunkOutcome:
+    """Per-deal outcomes for one chunk of trials."""
+
+    entry_own: np.ndarray        # (trials, deals)
+    exit_own: np.ndarray
+    valuations: np.ndarray
+    fair: np.ndarray
+    funded: np.ndarray           # (trials, deals, rounds) fraction of each call met
+    round_spent: np.ndarray      # (trials, deals, rounds) follow-on dollars per round
+    remaining_reserve: np.ndarray  # (trials,)
+
+    @property
+    def trials(self):
+        return self.fair.shape[0]
+
+    @property
+    def follow_on_spent(self):
+        return self.round_spent.sum(axis=2)
+
+
+# — Deal Table —
+# Stage sequence label for every bitmask over STAGES ("Seed > Series B", …)
+STAGE_SEQUENCE_LABELS = np.array([
+    " > ".join(s for i, s in enumerate(STAGES) if mask >> i & 1) for mask in range(1 << len(STAGES))
+], dtype=object)
+
+DEAL_TABLE_COLUMNS = [
+    "Stage Sequence", "Initial Ticket Size", "Follow-On Spent",
+    "Fair Value at Exit", "Valuation",
+    "Ownership at Entry", "Ownership at Exit", "MOIC"
+]
+
+
+@dataclass
+class DealTable:
+    """Struct-of-arrays deal table for one or many trials.
+
+    Per-deal constants are stored once; per-trial columns are float32
+    (trials × deals) and the stage sequence is a uint8 bitmask over STAGES.
+    Rows only become a DataFrame (and strings) through ``to_frame``.
+    """
+
+    entry_stage: np.ndarray      # (deals,) int8
+    initial_ticket: np.ndarray   # (deals,) float32
+    stage_mask: np.ndarray       # (trials, deals) uint8
+    follow_on_spent: np.ndarray  # (trials, deals) float32
+    fair_value: np.ndarray
+    valuation: np.ndarray
+    entry_own: np.ndarray
+    exit_own: np.ndarray
+
+    @classmethod
+    def from_outcome(cls, layout, out):
+        funded_bits = np.where(out.funded > 0, np.left_shift(1, layout.round_stage.astype(np.uint8)), 0)
+        mask = np.left_shift(1, layout.stage_idx.astype(np.uint8)) | np.bitwise_or.reduce(funded_bits, axis=2)
+        return cls(
+            entry_stage=layout.stage_idx,
+            initial_ticket=layout.ticket.astype(np.float32),
+            stage_mask=mask.astype(np.uint8),
+            follow_on_spent=out.follow_on_spent.astype(np.float32),
+            fair_value=out.fair.astype(np.float32),
+            valuation=out.valuations.astype(np.float32),
+            entry_own=out.entry_own.astype(np.float32),
+            exit_own=out.exit_own.astype(np.float32),
+        )
+
+    @classmethod
+    def concat(cls, tables):
+        first = tables[0]
+        stacked = {
+            name: np.concatenate([getattr(t, name) for t in tables])
+            for name in ("stage_mask", "follow_on_spent", "fair_value", "valuation", "entry_own", "exit_own")
+        }
+        return cls(entry_stage=first.entry_stage, initial_ticket=first.initial_ticket, **stacked)
+
+    @property
+    def trials(self):
+        return self.stage_mask.shape[0]
+
+    @property
+    def num_deals(self):
+        return self.stage_mask.shape[1]
+
+    @property
+    def nbytes(self):
+        return sum(getattr(self, f).nbytes for f in self.__dataclass_fields__)
+
+    def moic(self, trial=0, rows=slice(None)):
+        invested = self.initial_ticket[rows] + self.follow_on_spent[trial, rows]
+        fair = self.fair_value[trial, rows]
+        return np.divide(fair, invested, out=np.zeros_like(fair), where=invested > 0)
+
+    def stage_sequences(self, trial=0, rows=slice(None)):
+        return STAGE_SEQUENCE_LABELS[self.stage_mask[trial, rows]]
+
+    def to_frame(self, trial=0, rows=slice(None)):
+        # Materialise only the requested rows of one trial
+        index = np.arange(self.num_deals)[rows]
+        return pd.DataFrame({
+            "Stage Sequence":      self.stage_sequences(trial, rows),
+            "Initial Ticket Size": self.initial_ticket[rows],
+            "Follow-On Spent":     self.follow_on_spent[trial, rows],
+            "Fair Value at Exit":  self.fair_value[trial, rows],
+            "Valuation":           self.valuation[trial, rows],
+            "Ownership at Entry":  self.entry_own[trial, rows],
+            "Ownership at Exit":   self.exit_own[trial, rows],
+            "MOIC":                self.moic(trial, rows),
+        }, index=index)
+
+
+def _allocation_order(layout, policy):
+    # Flat (deal, round) call order shared by every trial
+    d_idx, r_idx = np.meshgrid(np.arange(layout.num_deals), np.arange(layout.num_rounds), indexing="ij")
+    d_idx, r_idx = d_idx.ravel(), r_idx.ravel()
+    if policy == "company_order":
+        keys = (r_idx, d_idx)
+    elif policy == "chronological":
+        keys = (d_idx, r_idx)
+    elif policy == "winners_first":
+        keys = (d_idx, r_idx, ~layout.is_winner[d_idx])
+    else:
+        raise ValueError(f"Unknown follow-on policy: {policy}")
+    return np.lexsort(keys)       # last key is the primary sort key
+
+
+def allocate_reserve(amounts, wants, reserve, layout, policy="chronological"):
+    """Fraction of each (trial, deal, round) follow-on call met from ``reserve``.
+
+    Ordered policies walk the calls in policy order and fund each one that
+    still fits in what is left of the reserve, skipping those that do not (a
+    later, smaller call can still be met). ``pro_rata`` scales every call by
+    reserve / requested when the reserve is oversubscribed.
+    """
+    trials = amounts.shape[0]
+    requested = np.where(wants, amounts, 0.0)
+    if policy == "pro_rata":
+        total = requested.reshape(trials, -1).sum(axis=1)
+        fraction = np.minimum(1.0, np.divide(reserve, total, out=np.ones_like(total), where=total > 0))
+        return np.where(wants, fraction[:, None, None], 0.0)
+
+    # Greedy skip: one pass over the calls in policy order, vectorized across
+    # trials. Calls are laid out (calls, trials) so each step reads contiguous
+    # rows; unwanted calls request 0, always "fit" and are masked out at the end.
+    order = _allocation_order(layout, policy)
+    order = order[layout.round_valid.ravel()[order]]
+    calls = np.ascontiguousarray(requested.reshape(trials, -1)[:, order].T)
+    met = np.empty(calls.shape, dtype=bool)
+    remaining = np.full(trials, float(reserve))
+    for lo in range(0, len(calls), ALLOCATION_BLOCK):
+        block, hit = calls[lo:lo + ALLOCATION_BLOCK], met[lo:lo + ALLOCATION_BLOCK]
+        # Whole blocks settle at once while the reserve covers all of them in every
+        # trial, or (once it has run dry) covers none of their calls in any trial
+        spent = block.sum(axis=0)
+        if (spent <= remaining).all():
+            hit[:] = True
+            remaining -= spent
+        elif (np.where(block > 0, block, np.inf).min(axis=0) > remaining).all():
+            np.equal(block, 0.0, out=hit)
+        else:
+            for amount, ok in zip(block, hit):
+                np.less_equal(amount, remaining, out=ok)
+                remaining -= amount * ok
+    funded = np.zeros((trials, requested[0].size))
+    funded[:, order] = met.T
+    return np.where(wants, funded.reshape(amounts.shape), 0.0)
+
+
+def _simulate_chunk(params, layout, trials, rng, required_gross=None):
+    n = layout.num_deals
+    rounds = layout.num_rounds
+    stage_base = np.array([BASE_VALUATION_BY_STAGE[s] for s in STAGES])
+    dilution = np.array([EXIT_DILUTION_FACTORS[s] for s in STAGES])
+    deal_base = stage_base[layout.stage_idx]
+
+    # Entry ownership & dilution
+    entry_own = layout.own_lo + rng.random((trials, n)) * (layout.own_hi - layout.own_lo)
+    diluted = entry_own * dilution[layout.stage_idx]
+
+    # Unicorn & non-unicorn valuations among winners
+    valuations = np.zeros((trials, n))
+    winner_idx = layout.winner_idx
+    num_winners = len(winner_idx)
+    if num_winners:
+        num_uni = min(max(1, int(params.unicorn_capture_rate * n)), num_winners)
+        perm = np.argsort(rng.random((trials, num_winners)), axis=1)
+        uni_pos = winner_idx[perm[:, :num_uni]]
+        non_pos = winner_idx[perm[:, num_uni:]]
+
+        a = 2.0 - 1.5 * params.power_law_strength
+        base = rng.pareto(a, size=(trials, num_uni)) + 1
+        scaled = base / base.sum(axis=1, keepdims=True)
+        min_v = deal_base[uni_pos] * UNICORN_MIN_MULTIPLE
+        max_v = deal_base[uni_pos] * UNICORN_MAX_MULTIPLE
+        np.put_along_axis(valuations, uni_pos, np.clip(scaled * (max_v - min_v) + min_v, min_v, max_v), axis=1)
+
+        if non_pos.shape[1]:
+            # Dirichlet(1, …, 1) via normalised exponentials
+            weights = rng.standard_exponential(non_pos.shape)
+            weights /= weights.sum(axis=1, keepdims=True)
+            np.put_along_axis(valuations, non_pos, weights * deal_base[non_pos], axis=1)
+
+    # Cap MOIC at MOIC_CAP on the diluted stake
+    raw_fair = valuations * diluted
+    cap = MOIC_CAP * layout.ticket
+    capped = layout.is_winner & (raw_fair > cap)
+    valuations = np.where(capped, cap / np.where(capped, diluted, 1.0), valuations)
+
+    if required_gross is not None and num_winners:
+        # Rescale winners so every trial's diluted fair value hits the target
+        winner_fair = np.minimum(raw_fair, cap)[:, winner_idx].sum(axis=1)
+        scale = np.divide(required_gross, winner_fair, out=np.ones_like(winner_fair), where=winner_fair > 0)
+        valuations *= scale[:, None]
+
+    # Follow-on decisions and amounts drawn up front
+    prob = np.where(layout.is_winner, params.winner_follow_on_prob, params.loser_follow_on_prob)
+    wants = layout.round_valid & (rng.random((trials, n, rounds)) < prob[:, None])
+    amounts = layout.ticket[:, None] * (
+        layout.round_mult_lo + rng.random((trials, n, rounds)) * (layout.round_mult_hi - layout.round_mult_lo)
+    )
+    amounts = np.where(wants, amounts, 0.0)
+
+    reserve = params.fund_size_dollars * params.follow_on_reserve_pct
+    funded = allocate_reserve(amounts, wants, reserve, layout, params.follow_on_policy)
+
+    # Skipped (or unfunded) rounds dilute; funded rounds keep pro-rata
+    retained = np.where(layout.round_valid, funded + (1.0 - funded) * layout.skip_dilution, 1.0).prod(axis=2)
+    exit_own = np.minimum(entry_own * retained, entry_own)
+    round_spent = amounts * funded
+    valuations = np.where(layout.is_winner, valuations, 0.0)
+
+    return ChunkOutcome(
+        entry_own=entry_own,
+        exit_own=exit_own,
+        valuations=valuations,
+        fair=valuations * exit_own,
+        funded=funded,
+        round_spent=round_spent,
+        remaining_reserve=np.maximum(reserve - round_spent.sum(axis=(1, 2)), 0.0),
+    )
+
+
+class FundModel:
+    """Fund model bound to one set of parameters.
+
+    ``simulate`` reproduces the single-portfolio deal table shown on the page
+    (winners rescaled to hit the target); ``simulate_trials`` runs the
+    vectorized multi-trial engine.
+    """
+
+    def __init__(self, params):
+        self.params = params
+        self.layout = build_deal_layout(params)
+        self.metrics = fund_metrics(params)
+
+    def simulate(self, seed=None):
+        rng = np.random.default_rng(seed)
+        out = _simulate_chunk(self.params, self.layout, 1, rng, required_gross=self.metrics.required_gross_return)
+        return SimulationResult(
+            params=self.params,
+            metrics=self.metrics,
+            deals=DealTable.from_outcome(self.layout, out),
+            remaining_follow_on=float(out.remaining_reserve[0]),
+        )
+
+    def iter_chunks(self, trials, seed=None, calibrate_to_target=False, chunk_elements=DEFAULT_CHUNK_ELEMENTS):
+        """Yield ChunkOutcome blocks covering ``trials`` trials in order."""
+        rng = np.random.default_rng(seed)
+        required_gross = self.metrics.required_gross_return if calibrate_to_target else None
+        chunk = max(1, chunk_elements // max(1, self.layout.num_deals * self.layout.num_rounds))
+        for start in range(0, trials, chunk):
+            yield _simulate_chunk(self.params, self.layout, min(chunk, trials - start), rng, required_gross)
+
+    def simulate_trials(self, trials=10_000, seed=None, calibrate_to_target=False,
+                        chunk_elements=DEFAULT_CHUNK_ELEMENTS, keep_deals=False):
+        """Run ``trials`` independent portfolios and return their TrialResults.
+
+        With ``calibrate_to_target`` each trial rescales winner valuations so the
+        gross return matches the target, as the single draw does; otherwise
+        outcomes are forward draws and ``prob_target`` is meaningful.
+        ``keep_deals`` also returns every trial's DealTable for drill-down.
+        """
+        layout = self.layout
+        gross = np.empty(trials)
+        follow_on = np.empty(trials)
+        tables = []
+        start = 0
+        for out in self.iter_chunks(trials, seed, calibrate_to_target, chunk_elements):
+            stop = start + out.trials
+            gross[start:stop] = out.fair.sum(axis=1)
+            follow_on[start:stop] = out.follow_on_spent.sum(axis=1)
+            if keep_deals:
+                tables.append(DealTable.from_outcome(layout, out))
+            start = stop
+
+        return self._trial_results(gross, follow_on, DealTable.concat(tables) if tables else None)
+
+    def results_for_chunk(self, out):
+        """TrialResults for the trials of one ChunkOutcome."""
+        return self._trial_results(out.fair.sum(axis=1), out.follow_on_spent.sum(axis=1))
+
+    def _trial_results(self, gross, follow_on, deals=None):
+        params = self.params
+        return TrialResults(
+            gross_value=gross,
+            initial_invested=np.full(len(gross), self.layout.ticket.sum()),
+            follow_on_invested=follow_on,
+            net_value=net_distributions(gross, params),
+            fund_size=float(params.fund_size_dollars),
+            total_fees=float(self.metrics.total_fees),
+            target_net_tvpi=float(params.target_net_tvpi),
+            deals=deals,
+        )
+
+def simulate(params, seed=None):
+    return FundModel(params).simulate(seed)
+
+
+def simulate_trials(params, trials=10_000, seed=None, **kwargs):
+    return FundModel(params).simulate_trials(trials, seed, **kwargs)
@@ -1,4 +1,15 @@
 import streamlit as st
+from fund_engine import (
+    STAGES, EXIT_DILUTION_FACTORS, DEFAULT_TICKET_SIZES, FOLLOW_ON_POLICIES,
+    FundParams, StageParams, fund_metrics,
+)
+from fund_cache import (
+    RESULT_CACHE, cached_simulate, cached_simulate_cash_flows, cached_simulate_trials, cached_stream_trials,
+)
+from fund_solver import solve
+from fund_stats import STREAMING_THRESHOLD
+from fund_sweep import SWEEPABLE_PARAMS, grid, heatmap, latin_hypercube, run_sweep
+from profiling import cached_span, span
 def run():
     # Continue with your usual imports
     import locale
@@ -50,59 +61,8 @@ def run():
         </style>
     """, unsafe_allow_html=True)
 
-    # Stages & Dilution Factors
-    stages = ["Pre-seed", "Seed", "Series A", "Series B", "Series C", "Series D", "Series E+"]
-    exit_dilution_factors = {
-        "Pre-seed": 0.30, "Seed": 0.39, "Series A": 0.52,
-        "Series B": 0.67, "Series C": 0.79, "Series D": 0.92, "Series E+": 1.00
-    }
-    # Typical exit valuations (in dollars) used to seed non-unicorn outcomes
-    base_valuation_by_stage = {
-        "Pre-seed":  50e6,
-        "Seed":     150e6,
-        "Series A": 300e6,
-        "Series B": 600e6,
-        "Series C": 1_200e6,
-        "Series D": 3_000e6,
-        "Series E+": 10_000e6,
-    }
-
-    # Default Ticket Sizes
-    default_ticket_sizes = {
-        "Pre-seed": 2_500_000, "Seed": 5_000_000, "Series A": 15_000_000,
-        "Series B": 25_000_000, "Series C": 35_000_000,
-        "Series D": 50_000_000, "Series E+": 75_000_000
-    }
-
-    # Nested Follow-On Multiplier Ranges
-    follow_on_multipliers = {
-        "Pre-seed": {
-            "Seed":     (1.5, 3.0), "Series A": (1.2, 2.5),
-            "Series B": (1.0, 2.0), "Series C": (0.8, 1.5)
-        },
-        "Seed": {
-            "Series A": (1.0, 3.0), "Series B": (0.8, 2.0),
-            "Series C": (0.7, 1.5), "Series D": (0.5, 1.2)
-        },
-        "Series A": {
-            "Series B": (1.0, 2.0), "Series C": (0.8, 1.5),
-            "Series D": (0.7, 1.2)
-        },
-        "Series B": {
-            "Series C": (0.8, 1.5), "Series D": (0.7, 1.2),
-            "Series E+": (0.5, 1.0)
-        },
-        "Series C": {
-            "Series D": (0.7, 1.2), "Series E+": (0.5, 1.0)
-        },
-        "Series D": {
-            "Series E+": (0.5, 1.0)
-        },
-        "Series E+": {}
-    }
-
     # — Sidebar Inputs —
-    stage_inputs = {}
+    stage_params = {}
     with st.sidebar:
         st.header("Fund Assumptions")
         fund_size_dollars    = st.number_input("Fund Size ($)", value=100_000_000, step=1_000_000, format="%d")
@@ -111,6 +71,8 @@ def run():
         carry_pct            = st.number_input("Carry (%)", value=28.0, step=0.5)
         target_net_tvpi      = st.number_input("Targeted Net Return (TVPI)", value=5.5, step=0.1)
         unicorn_capture_rate = st.number_input("Unicorn Capture Rate (%)", value=7.0, step=0.5) / 100
+        seed                 = st.number_input("Random Seed", value=42, min_value=0, step=1, format="%d",
+                                               help="Same inputs and seed always give the same deal table.")
         # in your st.sidebar, after unicorn_capture_rate:
         if "power_law_strength" not in st.session_state:
             # initialize with a default
@@ -126,36 +88,54 @@ def run():
         power_law_strength = st.session_state.power_law_strength
         st.markdown(f"**Power Law Strength:** {power_law_strength:.2f}")
         st.header("Follow-On Settings")
-        follow_on_reserve_pct = st.number_input("Follow-On Reserve (% of Fund Size)", value=20.0, step=1.0) / 100
+        follow_on_reserve_pct = st.number_input("Follow-On Reserve (% of Fund Size)", value=20.0, step=1.0,
+                                                key="follow_on_reserve") / 100
         winner_follow_on_prob = st.slider("Follow-On Chance if Winner", 0.0, 1.0, 0.7, 0.05)
         loser_follow_on_prob  = 1.0 - winner_follow_on_prob
         st.slider("Follow-On Chance if Loser", 0.0, 1.0, loser_follow_on_prob, 0.05, disabled=True)
+        follow_on_policy = st.selectbox(
+            "Reserve Allocation", FOLLOW_ON_POLICIES,
+            format_func=lambda p: p.replace("_", " ").title(),
+            help="Order in which follow-on calls draw on the reserve when it cannot cover them all.",
+        )
 
 
         st.header("Stage Breakdown")
-        for stage in stages:
+        for stage in STAGES:
             with st.expander(f"{stage} Settings"):
                 num_deals     = st.number_input(f"# {stage} Deals", value=0, step=1, format="%d", key=f"{stage}_deals")
                 loss_ratio    = st.number_input(f"Loss Ratio (%) - {stage}", value=90.0, step=1.0, key=f"{stage}_loss") / 100
                 ticket_size   = st.number_input(f"Initial Ticket Size ($) - {stage}",
-                                                value=default_ticket_sizes[stage], step=1_000_000, format="%d", key=f"{stage}_ticket")
+                                                value=DEFAULT_TICKET_SIZES[stage], step=1_000_000, format="%d", key=f"{stage}_ticket")
                 ownership_min = st.number_input(f"Min Ownership (%) - {stage}", value=10.0, step=0.5, key=f"{stage}_own_min") / 100
                 ownership_max = st.number_input(f"Max Ownership (%) - {stage}", value=25.0, step=0.5, key=f"{stage}_own_max") / 100
 
-                stage_inputs[stage] = {
-                    "deals":           num_deals,
-                    "loss_ratio":      loss_ratio,
-                    "ticket_size":     ticket_size,
-                    "ownership_bounds": (ownership_min, ownership_max),
-                    "exit_dilution":   exit_dilution_factors[stage]
-                }
-    total_portfolio_companies = sum(data["deals"] for data in stage_inputs.values())
-
-    # — Rates & Pools —
-    mgmt_fee_rate             = mgmt_fee_pct / 100
-    carry_rate                = carry_pct / 100
-    initial_investable_pool   = fund_size_dollars * (1 - follow_on_reserve_pct)
-    follow_on_reserve_capital = fund_size_dollars * follow_on_reserve_pct
+                stage_params[stage] = StageParams(
+                    deals=int(num_deals),
+                    loss_ratio=loss_ratio,
+                    ticket_size=ticket_size,
+                    ownership_min=ownership_min,
+                    ownership_max=ownership_max,
+                )
+
+    params = FundParams(
+        fund_size_dollars=fund_size_dollars,
+        mgmt_fee_pct=mgmt_fee_pct,
+        duration_years=duration_years,
+        carry_pct=carry_pct,
+        target_net_tvpi=target_net_tvpi,
+        unicorn_capture_rate=unicorn_capture_rate,
+        power_law_strength=power_law_strength,
+        follow_on_reserve_pct=follow_on_reserve_pct,
+        winner_follow_on_prob=winner_follow_on_prob,
+        follow_on_policy=follow_on_policy,
+        stages=stage_params,
+    )
+    seed    = int(seed)
+    metrics = fund_metrics(params)
+    # The deal-by-deal simulation, including the follow-on reserve loop
+    with cached_span("simulate fund", lambda: RESULT_CACHE.misses, rows=params.total_portfolio_companies):
+        result = cached_simulate(params, seed)
 
     # — Formatting Helpers —
     def label_large_number(num):
@@ -167,195 +147,28 @@ def run():
     def format_large_dollar_amount(num):
         return f"${label_large_number(num)}"
 
-    # — Core Fund Metrics —
-    total_fees            = fund_size_dollars * mgmt_fee_rate * duration_years
-    investable_capital    = fund_size_dollars    # full fund used for return math
-    net_return            = fund_size_dollars * target_net_tvpi
-    required_gross_return = (net_return - carry_rate * investable_capital + total_fees) / (1 - carry_rate)
-    required_multiple     = required_gross_return / investable_capital if investable_capital else 0
-    profit                = required_gross_return - investable_capital
-    total_carry           = carry_rate * profit
-
-    # — Build Stage Valuation Data —
-    stage_valuation_data = {}
-    for s, data in stage_inputs.items():
-        d = data["deals"]
-        if d > 0:
-            stage_valuation_data[s] = {
-                "deals":        d,
-                "ticket":       data["ticket_size"],
-                "loss_ratio":   data["loss_ratio"],
-                "min_own":      data["ownership_bounds"][0],
-                "max_own":      data["ownership_bounds"][1],
-                "exit_dilution": data["exit_dilution"]
-            }
-
-    # — Simulate Entry Ownership & Dilution —
-    all_scaled_ownerships  = []
-    all_diluted_ownerships = []
-    valuation_stage_map   = []
-    for stage, d in stage_valuation_data.items():
-        lo, hi   = d["min_own"], d["max_own"]
-        uniforms = np.random.rand(d["deals"])
-        scaled   = uniforms * (hi - lo) + lo
-        diluted  = scaled * d["exit_dilution"]
-
-        winners = int(d["deals"] * (1 - d["loss_ratio"]))
-        valuation_stage_map += [(stage, i, True)  for i in range(winners)]
-        valuation_stage_map += [(stage, i, False) for i in range(winners, d["deals"])]
-
-        all_scaled_ownerships.extend(scaled)
-        all_diluted_ownerships.extend(diluted)
-
-    num_entries    = len(valuation_stage_map)
-    winner_indices = [i for i, (_,_,w) in enumerate(valuation_stage_map) if w]
-
-    # — Unicorn & Non-Unicorn Valuations —
-    raw_valuations  = np.zeros(num_entries)
-    num_uni_desired = max(1, int(unicorn_capture_rate * num_entries))
-    num_uni_allowed = min(num_uni_desired, len(winner_indices))
-    uni_idx         = np.random.choice(winner_indices, num_uni_allowed, replace=False)
-    non_uni_idx     = list(set(winner_indices) - set(uni_idx))
-
-    if num_uni_allowed > 0:
-        a         = 2.0 - 1.5 * power_law_strength
-        base      = np.random.pareto(a, size=num_uni_allowed) + 1
-        scaled    = base / base.sum()
-        minV = base_valuation_by_stage[stage] * 3   # unicorn = 3× typical non-uni base
-        maxV = base_valuation_by_stage[stage] * 10
-        vals      = np.clip(scaled * (maxV - minV) + minV, minV, maxV)
-        raw_valuations[uni_idx] = vals
-
-    if non_uni_idx:
-        weights = np.random.dirichlet(np.ones(len(non_uni_idx)))
-        for j, idx in enumerate(non_uni_idx):
-            stage = valuation_stage_map[idx][0]
-            base  = base_valuation_by_stage.get(stage, 1e9)
-            raw_valuations[idx] = weights[j] * base
-
-    raw_exit_ownerships = np.array(all_diluted_ownerships)
-    raw_fair = raw_valuations * raw_exit_ownerships
-
-    # Cap MOIC at 150x
-    for i in winner_indices:
-        tix = stage_inputs[valuation_stage_map[i][0]]["ticket_size"]
-        moic = raw_fair[i] / tix if tix else 0
-        if moic > 150:
-            raw_fair[i]       = 150 * tix
-            raw_valuations[i] = raw_fair[i] / raw_exit_ownerships[i]
-
-    # Scale to hit fund targets
-    scaleA = required_gross_return / raw_fair[winner_indices].sum()
-    raw_valuations[winner_indices] *= scaleA
-    all_valuations = raw_valuations.copy()
-
-    # — Follow-On Simulation & Deal Table (fixed) —
-    max_follow_ons = 3
-    order = stages[:]
-
-    initial_check_invested   = 0
-    follow_on_check_invested = 0
-    rows = []
-
-    for idx, (entry_stage, _, is_winner) in enumerate(valuation_stage_map):
-        ticket    = stage_inputs[entry_stage]["ticket_size"]
-        entry_own = all_scaled_ownerships[idx]
-        exit_own  = entry_own
-        seq       = [entry_stage]
-        initial_check_invested += ticket
-
-        company_follow_on_spent = 0
-        cur     = order.index(entry_stage)
-        follows = 0
-
-        while follows < max_follow_ons and cur + 1 < len(order):
-            nxt  = order[cur + 1]
-            prob = winner_follow_on_prob if is_winner else loser_follow_on_prob
-
-            if np.random.rand() < prob:
-                # TRY to follow-on
-                lo, hi = follow_on_multipliers.get(entry_stage, {}).get(nxt, (1.0, 1.5))
-                amt    = ticket * np.random.uniform(lo, hi)
-
-                if follow_on_reserve_capital >= amt:
-                    # SPEND the money and record the stage
-                    follow_on_reserve_capital  -= amt
-                    follow_on_check_invested   += amt
-                    company_follow_on_spent    += amt
-                    seq.append(nxt)
-                    # pro-rata → no dilution
-                else:
-                    # reserve EMPTY: treat as skip
-                    dilution_factor = (
-                        exit_dilution_factors[order[cur]]
-                        / exit_dilution_factors[nxt]
-                    )
-                    exit_own *= dilution_factor
-
-            else:
-                # SKIP follow-on → apply dilution
-                dilution_factor = (
-                    exit_dilution_factors[order[cur]]
-                    / exit_dilution_factors[nxt]
-                )
-                exit_own *= dilution_factor
-
-            cur     += 1
-            follows += 1
-
-        # cap at pro-rata
-        exit_own = min(exit_own, entry_own)
-
-        # compute final metrics
-        if is_winner:
-            val  = all_valuations[idx]
-            fair = val * exit_own
-            total_invested = ticket + company_follow_on_spent
-            moic = fair / total_invested if total_invested > 0 else 0
-        else:
-            val = fair = moic = 0.0
-
-
-        rows.append([
-            " > ".join(seq),
-            ticket,
-            company_follow_on_spent,
-            fair,
-            val,
-            entry_own,
-            exit_own,
-            moic
-        ])
-
-
     # — Render Outputs —
     st.header("Key Fund Metrics")
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        st.metric("Fund Size", format_large_dollar_amount(investable_capital))
-        st.metric("Required Gross Return", format_large_dollar_amount(required_gross_return))
-        st.metric("Total Portfolio Companies", f"{total_portfolio_companies}")
+        st.metric("Fund Size", format_large_dollar_amount(metrics.fund_size))
+        st.metric("Required Gross Return", format_large_dollar_amount(metrics.required_gross_return))
+        st.metric("Total Portfolio Companies", f"{params.total_portfolio_companies}")
 
     with col2:
-        st.metric("Total Management Fees", format_large_dollar_amount(total_fees))
-        st.metric("Gross Return Multiple", f"{required_multiple:.2f}x")
-        st.metric("Follow-On Reserve", format_large_dollar_amount(follow_on_reserve_pct * fund_size_dollars))
+        st.metric("Total Management Fees", format_large_dollar_amount(metrics.total_fees))
+        st.metric("Gross Return Multiple", f"{metrics.required_multiple:.2f}x")
+        st.metric("Follow-On Reserve", format_large_dollar_amount(metrics.follow_on_reserve))
 
     with col3:
-        st.metric("Total Carry", format_large_dollar_amount(total_carry))
-        st.metric("Net Return", format_large_dollar_amount(net_return))
-        st.metric("Remaining Follow-On", format_large_dollar_amount(follow_on_reserve_capital))
+        st.metric("Total Carry", format_large_dollar_amount(metrics.total_carry))
+        st.metric("Net Return", format_large_dollar_amount(metrics.net_return))
+        st.metric("Remaining Follow-On", format_large_dollar_amount(result.remaining_follow_on))
 
     style_metric_cards(border_left_color="#06e3fd")
 
-    st.header("Stage Contributions – Deal Table")
-    df = pd.DataFrame(rows, columns=[
-        "Stage Sequence", "Initial Ticket Size", "Follow-On Spent",
-        "Fair Value at Exit", "Valuation",
-        "Ownership at Entry", "Ownership at Exit", "MOIC"
-    ])
-    styled = df.style.format({
+    deal_formats = {
         "Initial Ticket Size": lambda x: format_large_dollar_amount(x),
         "Follow-On Spent":     lambda x: format_large_dollar_amount(x),
         "Fair Value at Exit":  lambda x: format_large_dollar_amount(x),
@@ -363,12 +176,199 @@ def run():
         "Ownership at Entry":  lambda x: f"{x*100:.1f}%",
         "Ownership at Exit":   lambda x: f"{x*100:.1f}%",
         "MOIC":                lambda x: f"{x:.2f}x"
-    })
-    st.dataframe(styled, use_container_width=True)
+    }
+
+    def show_deal_table(deals, trial=0, key="deals"):
+        # Only the visible page of rows is materialised and formatted
+        rows_per_page = 50
+        pages = max(1, -(-deals.num_deals // rows_per_page))
+        page = 1
+        if pages > 1:
+            page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1, step=1,
+                                   key=f"{key}_page")
+        start = (int(page) - 1) * rows_per_page
+        visible = deals.to_frame(trial, slice(start, start + rows_per_page))
+        st.dataframe(visible.style.format(deal_formats), use_container_width=True)
+
+    st.header("Stage Contributions – Deal Table")
+    with span("deal table"):
+        show_deal_table(result.deals)
 
     st.header("Dilution Reference Table")
     dilution_df = pd.DataFrame({
-        "Entry Stage": list(exit_dilution_factors.keys()),
-        "Retained % of Entry Ownership": list(exit_dilution_factors.values())
+        "Entry Stage": list(EXIT_DILUTION_FACTORS.keys()),
+        "Retained % of Entry Ownership": list(EXIT_DILUTION_FACTORS.values())
     }).set_index("Entry Stage")
     st.dataframe(dilution_df)
+
+    # — Monte Carlo Distribution —
+    st.header("Monte Carlo Distribution")
+    mc_col1, mc_col2 = st.columns(2)
+    with mc_col1:
+        num_trials = st.number_input("Number of Trials", value=10_000, min_value=100, max_value=50_000_000,
+                                     step=1_000, format="%d",
+                                     help=f"Runs above {STREAMING_THRESHOLD:,} trials are aggregated in bounded "
+                                          "memory across all CPU cores.")
+    with mc_col2:
+        calibrate = st.checkbox("Rescale winners to hit target (as in the deal table)", value=False)
+
+    if params.total_portfolio_companies == 0:
+        st.info("Add deals in the Stage Breakdown to simulate a distribution.")
+        return
+
+    streaming = int(num_trials) > STREAMING_THRESHOLD
+    if streaming:
+        with st.spinner(f"Streaming {int(num_trials):,} trials…"):
+            with cached_span("stream trials", lambda: RESULT_CACHE.misses, rows=int(num_trials)):
+                results = cached_stream_trials(params, int(num_trials), seed, calibrate_to_target=calibrate)
+        summary = results.summary()
+        hist_centers, hist_counts = results.trial_stats["net_tvpi"].histogram(bins=40)
+    else:
+        keep_deals = int(num_trials) * params.total_portfolio_companies <= 5_000_000
+        with cached_span("simulate trials", lambda: RESULT_CACHE.misses, rows=int(num_trials), keep_deals=keep_deals):
+            results = cached_simulate_trials(params, int(num_trials), seed, calibrate_to_target=calibrate,
+                                             keep_deals=keep_deals)
+        summary = results.summary()
+        hist_counts, edges = np.histogram(results.net_tvpi, bins=40)
+        hist_centers = (edges[:-1] + edges[1:]) / 2
+
+    st.metric(f"P(Net TVPI ≥ {target_net_tvpi:.1f}x)", f"{summary['prob_target'] * 100:.1f}%")
+    dist_df = pd.DataFrame({
+        "Net TVPI":   summary["net_tvpi"],
+        "Gross TVPI": summary["gross_tvpi"],
+        "DPI":        summary["dpi"],
+        "MOIC":       summary["moic"],
+    }).T
+    st.dataframe(dist_df.style.format("{:.2f}x"), use_container_width=True)
+
+    hist_df = pd.DataFrame({"Net TVPI": np.round(hist_centers, 2), "Trials": hist_counts})
+    st.bar_chart(hist_df.set_index("Net TVPI"))
+
+    if streaming:
+        st.subheader("Per-Stage Contribution")
+        contrib_df = pd.DataFrame(summary["stage_contribution"]).T.rename(columns={
+            "mean_value": "Mean Fair Value", "mean_share": "Mean Share of Gross", "moic": "Pooled MOIC",
+        })
+        st.dataframe(contrib_df.style.format({
+            "Mean Fair Value":     lambda x: format_large_dollar_amount(x),
+            "Mean Share of Gross": lambda x: f"{x*100:.1f}%",
+            "Pooled MOIC":         lambda x: f"{x:.2f}x",
+        }), use_container_width=True)
+
+    if not streaming and results.deals is not None:
+        with st.expander("Drill into a trial"):
+            order = np.argsort(results.net_tvpi)
+            pct = st.slider("Trial Percentile (by Net TVPI)", 0, 100, 50)
+            trial = int(order[min(len(order) - 1, int(pct / 100 * len(order)))])
+            st.write(f"Trial #{trial}: Net TVPI {results.net_tvpi[trial]:.2f}x, "
+                     f"deal tables held in {results.deals.nbytes / 1e6:.1f} MB")
+            show_deal_table(results.deals, trial, key="drill")
+
+    # — Cash Flows & J-Curve —
+    st.header("Cash Flows & J-Curve")
+    cf_col1, cf_col2 = st.columns(2)
+    cf_trials = cf_col1.number_input("Cash-Flow Trials", value=5_000, min_value=100, max_value=200_000,
+                                     step=1_000, format="%d")
+    investment_period = cf_col2.number_input("Investment Period (years)", value=3.0, min_value=0.25,
+                                             max_value=float(duration_years), step=0.5)
+    with cached_span("cash flows", lambda: RESULT_CACHE.misses, rows=int(cf_trials)):
+        flows = cached_simulate_cash_flows(params, int(cf_trials), seed, investment_period_years=investment_period,
+                                           calibrate_to_target=calibrate)
+        cf_summary = flows.summary()
+
+    irr_col1, irr_col2, irr_col3, irr_col4 = st.columns(4)
+    for col, p in zip((irr_col1, irr_col2, irr_col3), ("P10", "P50", "P90")):
+        col.metric(f"Net IRR {p}", f"{cf_summary['irr'][p] * 100:.1f}%" if p in cf_summary["irr"] else "—")
+    irr_col4.metric("Median J-Curve Trough", f"{cf_summary['trough']:.2f}x",
+                    help="Lowest cumulative net cash flow as a multiple of fund size.")
+
+    st.subheader("J-Curve (cumulative net cash flow / fund size)")
+    st.line_chart(flows.bands(flows.j_curve))
+    st.subheader("DPI Over Time")
+    st.line_chart(flows.bands(flows.dpi_over_time))
+
+    # — Scenario Sweep —
+    st.header("Scenario Sweep")
+    with st.expander("Sweep two parameters across all CPU cores"):
+        sweepable = SWEEPABLE_PARAMS + [
+            f"{s}.{f}" for s in STAGES if params.stages[s].deals > 0 for f in ("loss_ratio", "ticket_size")
+        ]
+        sx_col, sy_col = st.columns(2)
+        with sx_col:
+            x_param = st.selectbox("X Parameter", sweepable, index=0)
+            x_lo, x_hi = st.columns(2)
+            x_min = x_lo.number_input("X Min", value=0.02, key="sweep_x_min", format="%g")
+            x_max = x_hi.number_input("X Max", value=0.15, key="sweep_x_max", format="%g")
+        with sy_col:
+            y_param = st.selectbox("Y Parameter", sweepable, index=1)
+            y_lo, y_hi = st.columns(2)
+            y_min = y_lo.number_input("Y Min", value=0.0, key="sweep_y_min", format="%g")
+            y_max = y_hi.number_input("Y Max", value=1.0, key="sweep_y_max", format="%g")
+
+        s_col1, s_col2, s_col3 = st.columns(3)
+        sampling   = s_col1.radio("Sampling", ["Grid", "Latin Hypercube"], horizontal=True)
+        points     = s_col2.number_input("Points per Axis / Samples", value=6, min_value=2, step=1)
+        sweep_trials = s_col3.number_input("Trials per Config", value=2_000, min_value=100, step=500, format="%d")
+
+        if x_param == y_param:
+            st.warning("Pick two different parameters to sweep.")
+        elif st.button("Run Sweep"):
+            if sampling == "Grid":
+                configs = grid({
+                    x_param: np.linspace(x_min, x_max, int(points)),
+                    y_param: np.linspace(y_min, y_max, int(points)),
+                })
+                bins = None
+            else:
+                configs = latin_hypercube({x_param: (x_min, x_max), y_param: (y_min, y_max)}, int(points) ** 2, seed=seed)
+                bins = int(points)
+            with st.spinner(f"Simulating {len(configs)} configurations…"), span("scenario sweep", rows=len(configs)):
+                sweep_df = run_sweep(params, configs, trials=int(sweep_trials), seed=seed,
+                                     calibrate_to_target=calibrate)
+            with span("sweep heatmap"):
+                st.pyplot(heatmap(sweep_df, x_param, y_param, "net_tvpi_P50", bins=bins))
+            st.dataframe(sweep_df, use_container_width=True)
+
+    # — Goal Seek —
+    st.header("Goal Seek")
+    with st.expander(f"Find the deal mix that maximises P(Net TVPI ≥ {target_net_tvpi:.1f}x)"):
+        searched = st.multiselect(
+            "Stages to Search", STAGES,
+            default=[s for s in STAGES if params.stages[s].deals > 0],
+        )
+        g_col1, g_col2 = st.columns(2)
+        solve_trials = g_col1.number_input("Trials per Candidate", value=2_000, min_value=200, step=500, format="%d")
+        time_limit   = g_col2.number_input("Time Limit (s)", value=10.0, min_value=1.0, step=1.0)
+
+        if st.button("Solve", disabled=not searched):
+            with st.spinner("Searching portfolio constructions…"), span("goal seek"):
+                try:
+                    st.session_state.goal_seek = solve(
+                        params, stages=searched, trials=int(solve_trials), seed=seed, time_limit=time_limit,
+                        warm_start=st.session_state.get("goal_seek"),
+                    )
+                except ValueError as e:
+                    # Over budget before the search starts: nothing to offer for the sidebar
+                    st.session_state.goal_seek = None
+                    st.error(f"🚨 {e}. Search those stages too, or lower their deal counts.")
+
+        solution = st.session_state.get("goal_seek")
+        if solution is not None:
+            g_col3, g_col4, g_col5 = st.columns(3)
+            g_col3.metric("P(Target)", f"{solution.prob_target * 100:.1f}%")
+            g_col4.metric("Median Net TVPI", f"{solution.median_net_tvpi:.2f}x")
+            g_col5.metric("Candidates Evaluated", f"{solution.evaluations}",
+                          help=f"Stopped: {solution.stop_reason} after {solution.elapsed:.1f}s")
+            best_df = pd.DataFrame({
+                "Stage": [s for s in STAGES if solution.params.stages[s].deals > 0],
+                "# Deals": [solution.params.stages[s].deals for s in STAGES if solution.params.stages[s].deals > 0],
+            })
+            st.dataframe(best_df, use_container_width=True)
+            st.write(f"Follow-On Reserve: {solution.params.follow_on_reserve_pct * 100:.0f}%")
+
+            def apply_solution():
+                for s in STAGES:
+                    st.session_state[f"{s}_deals"] = int(solution.params.stages[s].deals)
+                st.session_state.follow_on_reserve = solution.params.follow_on_reserve_pct * 100
+
+            st.button("Apply to Sidebar", on_click=apply_solution)
@@ -0,0 +1,187 @@
+# fund_solver.py
+#
+# Forward goal-seek for the Fund Model Simulator.
+# Searches deal counts per stage and the follow-on reserve for the portfolio
+# construction that maximises P(net TVPI ≥ target) within the fund budget,
+# using the vectorized engine (uncalibrated, forward draws) in the inner loop.
+#
+# Every candidate is scored on the same seed. Draws only line up exactly
+# between candidates with the same deal counts (the draw arrays change shape
+# with them), so this damps rather than removes noise between neighbours.
+
+import time
+from dataclasses import dataclass, replace
+
+import numpy as np
+import pandas as pd
+
+from fund_engine import STAGES, FundModel
+
+RESERVE_STEP = 0.05
+MAX_RESERVE = 0.50
+# Most of the time limit the final re-evaluation may claim from the search
+FINAL_SHARE = 0.25
+
+
+@dataclass
+class SolveResult:
+    params: object               # best FundParams found
+    prob_target: float
+    median_net_tvpi: float
+    summary: dict                # TrialResults.summary() at the final trial count
+    history: pd.DataFrame        # one row per evaluated candidate
+    evaluations: int
+    elapsed: float
+    stop_reason: str
+
+
+def initial_cost(params, stages=None):
+    # Initial tickets of ``stages`` (default: every stage, searched or not)
+    return sum(stage.deals * stage.ticket_size for s, stage in params.stages.items() if stages is None or s in stages)
+
+
+def _with_candidate(params, deals, reserve):
+    stages = dict(params.stages)
+    for s, n in deals.items():
+        stages[s] = replace(stages[s], deals=int(n))
+    return replace(params, stages=stages, follow_on_reserve_pct=float(reserve))
+
+
+def _fill_budget(params, stages, reserve):
+    # Spread what the other stages' deals leave of the initial pool evenly across the searched stages
+    others = [s for s in params.stages if s not in stages]
+    pool = max(0.0, params.fund_size_dollars * (1 - reserve) - initial_cost(params, others))
+    per_stage = pool / len(stages)
+    return {s: int(per_stage // params.stages[s].ticket_size) if params.stages[s].ticket_size else 0 for s in stages}
+
+
+def _neighbours(deals, reserve, step):
+    stages = list(deals)
+    for s in stages:
+        for delta in (step, -step):
+            if deals[s] + delta >= 0:
+                yield {**deals, s: deals[s] + delta}, reserve
+    # Move deals between stages at a roughly constant budget
+    for a in stages:
+        for b in stages:
+            if a != b and deals[a] >= step:
+                yield {**deals, a: deals[a] - step, b: deals[b] + step}, reserve
+    for delta in (RESERVE_STEP, -RESERVE_STEP):
+        r = round(reserve + delta, 4)
+        if 0.0 <= r <= MAX_RESERVE:
+            yield dict(deals), r
+
+
+def solve(params, stages=None, trials=2_000, final_trials=20_000, seed=0, time_limit=10.0,
+          patience=3, tol=0.002, max_iterations=200, warm_start=None):
+    """Local search over deal counts and reserve, maximising P(net TVPI ≥ target).
+
+    ``warm_start`` may be a previous SolveResult or FundParams to start from; by
+    default the search starts from ``params`` itself (or an even split of the
+    budget if it has no deals). The search stops early once ``patience`` moves
+    in a row gain less than ``tol`` in P(target), at a local optimum, after
+    ``max_iterations`` moves, or once ``time_limit`` seconds less the expected
+    cost of the final ``final_trials`` re-evaluation (at most FINAL_SHARE of the
+    limit) have passed; the final trial count is scaled down to fit what is left.
+
+    Raises ValueError when the stages not searched already spend the initial
+    pool, so that no construction of the searched stages fits the budget.
+    """
+    started = time.perf_counter()
+    stages = list(stages or [s for s in STAGES if params.stages[s].deals > 0] or ["Seed", "Series A"])
+
+    start = warm_start.params if isinstance(warm_start, SolveResult) else (warm_start or params)
+    reserve = float(start.follow_on_reserve_pct)
+    deals = {s: int(start.stages[s].deals) for s in stages}
+    if not any(deals.values()):
+        deals = _fill_budget(params, stages, reserve)
+
+    cache = {}
+    history = []
+    simulated = [0.0, 0]                # seconds and deal-trials simulated, for the cost per deal-trial
+
+    def per_trial(deals):
+        return simulated[0] / simulated[1] * max(1, sum(deals.values())) if simulated[1] else 0.0
+
+    def out_of_time():
+        final_cost = min(per_trial(deals) * final_trials, FINAL_SHARE * time_limit)
+        return time.perf_counter() - started > time_limit - final_cost
+
+    def evaluate(deals, reserve):
+        key = (tuple(deals[s] for s in stages), reserve)
+        if key in cache:
+            return cache[key]
+        candidate = _with_candidate(params, deals, reserve)
+        if initial_cost(candidate) > candidate.fund_size_dollars * (1 - reserve) or not any(deals.values()):
+            score = None
+        else:
+            sim_started = time.perf_counter()
+            results = FundModel(candidate).simulate_trials(trials, seed=seed)
+            simulated[0] += time.perf_counter() - sim_started
+            simulated[1] += trials * max(1, sum(deals.values()))
+            score = (
+                float((results.net_tvpi >= params.target_net_tvpi).mean()),
+                float(np.median(results.net_tvpi)),
+            )
+            history.append({**deals, "follow_on_reserve_pct": reserve,
+                            "prob_target": score[0], "median_net_tvpi": score[1]})
+        cache[key] = score
+        return score
+
+    best = evaluate(deals, reserve)
+    if best is None:
+        # Warm start over budget: restart from an even split
+        deals = _fill_budget(params, stages, reserve)
+        best = evaluate(deals, reserve)
+    if best is None:
+        others = [s for s in params.stages if s not in stages]
+        raise ValueError(
+            f"The deals of the stages not searched cost ${initial_cost(params, others):,.0f}, leaving no room for "
+            f"{', '.join(stages)} in the ${params.fund_size_dollars * (1 - reserve):,.0f} initial pool"
+        )
+
+    step = max(1, max(deals.values()) // 4)
+    stale = 0
+    stop_reason = "max_iterations"
+    for _ in range(max_iterations):
+        improved = None
+        for cand_deals, cand_reserve in _neighbours(deals, reserve, step):
+            if out_of_time():
+                break
+            score = evaluate(cand_deals, cand_reserve)
+            if score is not None and score > best:
+                improved = score
+                deals, reserve = cand_deals, cand_reserve
+                break                       # first improvement: restart from the new point
+        if out_of_time():
+            stop_reason = "time_limit"
+            break
+        if improved is None:
+            if step > 1:
+                step = max(1, step // 2)    # refine before giving up
+                continue
+            stop_reason = "local_optimum"
+            break
+        stale = stale + 1 if improved[0] - best[0] < tol else 0
+        best = improved
+        if stale >= patience:
+            stop_reason = "converged"
+            break
+
+    best_params = _with_candidate(params, deals, reserve)
+    remaining = time_limit - (time.perf_counter() - started)
+    if per_trial(deals) * final_trials > remaining:
+        # Big runs cost up to ~20% more per trial than the search's small ones
+        final_trials = max(trials, int(0.8 * remaining / per_trial(deals)))
+    final = FundModel(best_params).simulate_trials(final_trials, seed=None if seed is None else seed + 1)
+    summary = final.summary()
+    return SolveResult(
+        params=best_params,
+        prob_target=summary["prob_target"],
+        median_net_tvpi=summary["net_tvpi"]["P50"],
+        summary=summary,
+        history=pd.DataFrame(history),
+        evaluations=len(history),
+        elapsed=time.perf_counter() - started,
+        stop_reason=stop_reason,
+    )
@@ -0,0 +1,210 @@
+# fund_stats.py
+#
+# Bounded-memory aggregation for very large fund model runs.
+# The simulation is fed chunk by chunk into fixed-bin histograms plus running
+# moments, so 10M+ trials never hold per-trial or per-deal outcomes in RAM.
+# Aggregators merge exactly, across chunks and across worker processes.
+#
+#     agg = stream_trials(params, 10_000_000, seed=7, workers=8)
+#     agg.summary()["net_tvpi"]["P50"]
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from fund_engine import STAGES, FundModel
+
+TRIAL_METRICS = ["net_tvpi", "gross_tvpi", "dpi", "moic"]
+# Bins for multiples: 0.001x-wide linear bins from -1x to 0x (net multiples go
+# negative once fees exceed what a wiped-out portfolio returns; total losses land
+# exactly on 0x), then log-spaced bins of ~0.35% relative width up to 1000x
+MULTIPLE_EDGES = np.concatenate([np.linspace(-1.0, 0.0, 1001), np.geomspace(1e-3, 1e3, 4001)])
+OWNERSHIP_EDGES = np.linspace(0.0, 1.0, 2001)
+DEFAULT_CHUNK_TRIALS = 50_000
+DEFAULT_BLOCK_TRIALS = 250_000
+# Above this many trials the page switches from simulate_trials to streaming
+STREAMING_THRESHOLD = 1_000_000
+
+
+class RunningMoments:
+    """Count, mean, variance, min and max, merged with Chan's update."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float).ravel()
+        if len(values):
+            other = RunningMoments()
+            other.count = len(values)
+            other.mean = float(values.mean())
+            other.m2 = float(((values - other.mean) ** 2).sum())
+            other.min = float(values.min())
+            other.max = float(values.max())
+            self.merge(other)
+
+    def merge(self, other):
+        if not other.count:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def std(self):
+        return float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else 0.0
+
+
+class StreamingStat:
+    """Fixed-bin histogram with under/overflow bins and running moments."""
+
+    def __init__(self, edges):
+        self.edges = np.asarray(edges, dtype=float)
+        self.counts = np.zeros(len(self.edges) + 1, dtype=np.int64)   # [under, bins…, over]
+        self.moments = RunningMoments()
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float).ravel()
+        self.counts += np.bincount(np.searchsorted(self.edges, values, side="right"), minlength=len(self.counts))
+        self.moments.update(values)
+
+    def merge(self, other):
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("Cannot merge histograms with different bin edges")
+        self.counts += other.counts
+        self.moments.merge(other.moments)
+
+    def quantile(self, q):
+        # Interpolate within the bin holding the q-th observation
+        total = self.counts.sum()
+        if not total:
+            return float("nan")
+        target = q * total
+        cum = np.cumsum(self.counts)
+        b = int(np.searchsorted(cum, target, side="left"))
+        if b == 0:
+            return self.moments.min
+        if b == len(self.counts) - 1:
+            return self.moments.max
+        lo, hi = self.edges[b - 1], self.edges[b]
+        before = cum[b - 1]
+        frac = (target - before) / self.counts[b] if self.counts[b] else 0.0
+        return float(min(max(lo + frac * (hi - lo), self.moments.min), self.moments.max))
+
+    def summary(self, percentiles=(10, 50, 90)):
+        stats = {f"P{p}": self.quantile(p / 100) for p in percentiles}
+        stats["mean"] = self.moments.mean
+        stats["std"] = self.moments.std
+        return stats
+
+    def histogram(self, bins=40):
+        # Regroup the populated range into ``bins`` equal-count-of-edges groups
+        populated = np.flatnonzero(self.counts[1:-1])
+        if not len(populated):
+            return np.zeros(0), np.zeros(0, dtype=np.int64)
+        first, last = populated[0], populated[-1] + 1
+        groups = np.array_split(np.arange(first, last), min(bins, last - first))
+        centers = np.array([(self.edges[g[0]] + self.edges[g[-1] + 1]) / 2 for g in groups])
+        counts = np.array([self.counts[1:-1][g].sum() for g in groups])
+        return centers, counts
+
+
+class StreamingAggregator:
+    """Online TVPI / DPI / MOIC, ownership-at-exit and per-stage contribution."""
+
+    def __init__(self, target_net_tvpi):
+        self.target_net_tvpi = target_net_tvpi
+        self.trial_stats = {m: StreamingStat(MULTIPLE_EDGES) for m in TRIAL_METRICS}
+        self.ownership_at_exit = StreamingStat(OWNERSHIP_EDGES)
+        self.hits = 0
+        self.trials = 0
+        self.stage_value = np.zeros(len(STAGES))       # summed fair value by entry stage
+        self.stage_invested = np.zeros(len(STAGES))
+        self.stage_share = [RunningMoments() for _ in STAGES]
+
+    def update(self, model, out):
+        results = model.results_for_chunk(out)
+        for m in TRIAL_METRICS:
+            self.trial_stats[m].update(getattr(results, m))
+        self.hits += int((results.net_tvpi >= self.target_net_tvpi).sum())
+        self.trials += results.trials
+        self.ownership_at_exit.update(out.exit_own)
+
+        stage_idx = model.layout.stage_idx
+        one_hot = np.eye(len(STAGES))[stage_idx]                 # (deals, stages)
+        stage_fair = out.fair @ one_hot
+        invested = model.layout.ticket + out.follow_on_spent
+        self.stage_value += stage_fair.sum(axis=0)
+        self.stage_invested += np.bincount(stage_idx, invested.sum(axis=0), minlength=len(STAGES))
+        gross = stage_fair.sum(axis=1, keepdims=True)
+        share = np.divide(stage_fair, gross, out=np.zeros_like(stage_fair), where=gross > 0)
+        for i in np.unique(stage_idx):
+            self.stage_share[i].update(share[:, i])
+
+    def merge(self, other):
+        for m in TRIAL_METRICS:
+            self.trial_stats[m].merge(other.trial_stats[m])
+        self.ownership_at_exit.merge(other.ownership_at_exit)
+        self.hits += other.hits
+        self.trials += other.trials
+        self.stage_value += other.stage_value
+        self.stage_invested += other.stage_invested
+        for mine, theirs in zip(self.stage_share, other.stage_share):
+            mine.merge(theirs)
+
+    def summary(self, percentiles=(10, 50, 90)):
+        out = {m: self.trial_stats[m].summary(percentiles) for m in TRIAL_METRICS}
+        out["prob_target"] = self.hits / self.trials if self.trials else 0.0
+        out["ownership_at_exit"] = self.ownership_at_exit.summary(percentiles)
+        out["stage_contribution"] = {
+            s: {
+                "mean_value": float(self.stage_value[i] / self.trials),
+                "mean_share": float(self.stage_share[i].mean),
+                "moic": float(self.stage_value[i] / self.stage_invested[i]),
+            }
+            for i, s in enumerate(STAGES) if self.stage_invested[i] > 0 and self.trials
+        }
+        return out
+
+
+# — Driving the simulation —
+def _stream_block(args):
+    params, trials, seed_seq, chunk_trials, calibrate = args
+    model = FundModel(params)
+    agg = StreamingAggregator(params.target_net_tvpi)
+    chunk_elements = chunk_trials * max(1, model.layout.num_deals * model.layout.num_rounds)
+    for out in model.iter_chunks(trials, np.random.default_rng(seed_seq), calibrate, chunk_elements):
+        agg.update(model, out)
+    return agg
+
+
+def stream_trials(params, trials, seed=None, chunk_trials=DEFAULT_CHUNK_TRIALS, workers=1,
+                  block_trials=DEFAULT_BLOCK_TRIALS, calibrate_to_target=False):
+    """Aggregate ``trials`` trials in bounded memory, optionally across processes.
+
+    Trials are split into fixed blocks, each seeded from SeedSequence(seed), so
+    the result does not depend on the number of workers.
+    """
+    sizes = [min(block_trials, trials - start) for start in range(0, trials, block_trials)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(params, n, s, chunk_trials, calibrate_to_target) for n, s in zip(sizes, seeds)]
+
+    total = StreamingAggregator(params.target_net_tvpi)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) <= 1:
+        for part in map(_stream_block, tasks):
+            total.merge(part)
+        return total
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for part in pool.map(_stream_block, tasks):
+            total.merge(part)
+    return total
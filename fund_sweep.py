@@ -0,0 +1,130 @@
+# fund_sweep.py
+#
+# Scenario sweeps over the Fund Model Simulator inputs.
+# Builds a Cartesian grid or Latin-hypercube sample of FundParams overrides,
+# fans the configurations out to a process pool and returns a tidy table of
+# TVPI / DPI / MOIC summaries, one row per configuration.
+#
+# Parameter names are FundParams fields ("unicorn_capture_rate",
+# "power_law_strength", "follow_on_reserve_pct", …) or "<Stage>.<field>" for
+# per-stage settings ("Seed.loss_ratio", "Series A.ticket_size").
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+
+from fund_engine import FundModel, FundParams, StageParams
+
+SWEEPABLE_PARAMS = [
+    "unicorn_capture_rate", "power_law_strength", "follow_on_reserve_pct",
+    "winner_follow_on_prob", "target_net_tvpi",
+]
+STAGE_SWEEPABLE_FIELDS = ["deals", "loss_ratio", "ticket_size", "ownership_min", "ownership_max"]
+SUMMARY_METRICS = ["net_tvpi", "gross_tvpi", "dpi", "moic"]
+
+
+# — Configurations —
+def apply_overrides(params, overrides):
+    fund_fields, stage_fields = {}, {}
+    for name, value in overrides.items():
+        if "." in name:
+            stage, attr = name.rsplit(".", 1)
+            if attr not in STAGE_SWEEPABLE_FIELDS:
+                raise ValueError(f"Unknown stage parameter: {name}")
+            stage_fields.setdefault(stage, {})[attr] = int(round(value)) if attr == "deals" else float(value)
+        else:
+            if not hasattr(params, name) or name == "stages":
+                raise ValueError(f"Unknown fund parameter: {name}")
+            fund_fields[name] = float(value)
+
+    if stage_fields:
+        stages = dict(params.stages)
+        for stage, fields in stage_fields.items():
+            stages[stage] = replace(stages.get(stage, StageParams()), **fields)
+        fund_fields["stages"] = stages
+    return replace(params, **fund_fields)
+
+
+def grid(axes):
+    # Cartesian product of {param: [values, …]}
+    names = list(axes)
+    return [dict(zip(names, combo)) for combo in itertools.product(*(axes[n] for n in names))]
+
+
+def latin_hypercube(ranges, samples, seed=None):
+    # One stratum per sample along every {param: (lo, hi)} axis
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for name, (lo, hi) in ranges.items():
+        u = (rng.permutation(samples) + rng.random(samples)) / samples
+        columns[name] = lo + u * (hi - lo)
+    return [{n: float(columns[n][i]) for n in ranges} for i in range(samples)]
+
+
+# — Execution —
+def _run_config(args):
+    params_dict, overrides, trials, seed_seq, calibrate = args
+    params = apply_overrides(FundParams.from_dict(params_dict), overrides)
+    results = FundModel(params).simulate_trials(
+        trials, seed=np.random.default_rng(seed_seq), calibrate_to_target=calibrate
+    )
+    summary = results.summary()
+    row = dict(overrides)
+    for metric in SUMMARY_METRICS:
+        for stat, value in summary[metric].items():
+            row[f"{metric}_{stat}"] = value
+    row["prob_target"] = summary["prob_target"]
+    return row
+
+
+def run_sweep(base_params, configs, trials=2_000, seed=None, workers=None, calibrate_to_target=False):
+    """Simulate every override dict in ``configs`` and return one row per config.
+
+    Each configuration gets its own child of ``SeedSequence(seed)``, so results
+    are identical whatever the worker count or completion order.
+    """
+    seeds = np.random.SeedSequence(seed).spawn(len(configs))
+    base = base_params.to_dict()
+    tasks = [(base, cfg, trials, s, calibrate_to_target) for cfg, s in zip(configs, seeds)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) <= 1:
+        rows = [_run_config(t) for t in tasks]
+    else:
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rows = list(pool.map(_run_config, tasks, chunksize=chunksize))
+    return pd.DataFrame(rows)
+
+
+# — Heatmaps —
+def heatmap(results, x, y, value="net_tvpi_P50", bins=None, ax=None):
+    import matplotlib.pyplot as plt
+
+    # Latin-hypercube samples are continuous: bin them onto a grid first
+    data = results[[x, y, value]].copy()
+    if bins:
+        for col in (x, y):
+            data[col] = pd.cut(data[col], bins).apply(lambda iv: iv.mid).astype(float)
+    table = data.pivot_table(index=y, columns=x, values=value, aggfunc="median").sort_index(ascending=False)
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(8, 6))
+    else:
+        fig = ax.figure
+    im = ax.imshow(table.values, cmap="viridis", aspect="auto")
+    ax.set_xticks(range(len(table.columns)))
+    ax.set_xticklabels([f"{v:.3g}" for v in table.columns], rotation=45, ha="right")
+    ax.set_yticks(range(len(table.index)))
+    ax.set_yticklabels([f"{v:.3g}" for v in table.index])
+    for i in range(table.shape[0]):
+        for j in range(table.shape[1]):
+            ax.text(j, i, f"{table.values[i, j]:.2f}", ha="center", va="center", color="white", fontsize=8)
+    ax.set_xlabel(x)
+    ax.set_ylabel(y)
+    ax.set_title(value)
+    fig.colorbar(im, ax=ax)
+    return fig
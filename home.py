@@ -0,0 +1,171 @@
+# home.py
+#
+# Dashboard home page: unicorn tracker, valuation trends and movers between quarters.
+
+import streamlit as st
+import pandas as pd
+
+from data_sources import load_feed
+from profiling import span
+from valuations import ValuationHistory
+
+
+def run():
+    # ————————— Home Page Header —————————
+    st.markdown(
+        "<h1 style='text-align: center;'>🏁 Welcome to Formula Venture Dashboard</h1>",
+        unsafe_allow_html=True,
+    )
+    st.write("Use the sidebar to navigate between modules.")
+
+    # ───────────── 1) Load & Merge Unicorn Data ──────────────────────────────
+    # Google Sheets feeds, served from the local feed cache (see data_sources.py)
+    def load_data(df):
+        df = df.copy()
+        df["Post Money Value"] = pd.to_numeric(df["Post Money Value"], errors="coerce")
+        df["Total Equity Funding"] = pd.to_numeric(df["Total Equity Funding"], errors="coerce")
+        df["Quarter"] = df["Quarter"].astype(str)
+        df["Company"] = df["Company"].astype(str)
+        return df
+
+    def load_additional_data(df_extra):
+        df_extra = df_extra.rename(columns={"Organization Name": "Company"})
+        df_extra["Company"] = df_extra["Company"].astype(str)
+        return df_extra
+
+    with span("load feeds") as timing:
+        feed = load_feed("unicorns")
+        feed_extra = load_feed("unicorn_details")
+        timing.attrs["status"] = f"{feed.status}/{feed_extra.status}"    # cache | stale | network | fallback
+        timing.rows = len(feed.data)
+    if "fallback" in (feed.status, feed_extra.status):
+        st.warning("⚠️ Google Sheets are unreachable — showing the bundled June 2025 unicorn list.")
+    elif "stale" in (feed.status, feed_extra.status):
+        st.caption("Showing cached data while it refreshes in the background.")
+
+    @st.cache_resource(max_entries=2)
+    def build_unicorn_data(_df, _df_extra, version):
+        # Merged records + valuation history, rebuilt only when a feed refreshes
+        df_full = pd.merge(load_data(_df), load_additional_data(_df_extra), on="Company", how="left")
+        return df_full, ValuationHistory.from_frame(df_full)
+
+    with span("merge feeds") as timing:
+        df_full, history = build_unicorn_data(
+            feed.data, feed_extra.data, (feed.status, feed.fetched_at, feed_extra.status, feed_extra.fetched_at)
+        )
+        timing.rows = len(df_full)
+    st.write("ℹ️ df_full shape:", df_full.shape)
+
+    # ───────────── 2) Formatting helpers ──────────────────────────────────────
+    def format_billions(val):
+        if pd.isnull(val):
+            return "—"
+        return f"${val:.1f}B"
+
+    def format_multiple(val):
+        if pd.isnull(val) or val == float("inf") or val == 0:
+            return "—"
+        return f"{val:.2f}x"
+
+    # ───────────── 3) Unicorn Tracker & Analyzer UI ──────────────────────────
+    st.title("🦄 Unicorns Tracker & Analyzer")
+
+    # --- Quarter Selection ---
+    quarters = history.quarters
+    quarter = st.selectbox("Select Quarter", quarters, index=len(quarters) - 1)
+    filtered = history.quarter_rows(df_full, quarter)
+
+    # --- Summary Metrics ---
+    st.header(f"Unicorns for {quarter}")
+    col1, col2 = st.columns(2)
+    col1.metric("Total Unicorns", len(filtered))
+    col2.metric("Total Valuation", format_billions(filtered["Post Money Value"].sum()))
+
+    # --- Main Unicorn Table (Expanded Columns) ---
+    main_table = filtered[[
+        "Company", "Post Money Value", "Total Funding Amount", "Last Equity Funding Type",
+        "Top 5 Investors", "Industries", "Country", "Continent",
+        "Headquarters Location", "Number of Employees", "Funding Status",
+        "Number of Funding Rounds", "Monthly Visits"
+    ]].copy()
+
+    main_table = main_table.sort_values("Post Money Value", ascending=False)
+    main_table["Post Money Value"] = main_table["Post Money Value"].apply(format_billions)
+    main_table["Total Funding Amount"] = main_table["Total Funding Amount"].apply(
+        lambda x: format_billions(x / 1e9) if pd.notnull(x) else "—"
+    )
+    main_table["Monthly Visits"] = main_table["Monthly Visits"].apply(
+        lambda x: f"{int(str(x).replace(',', '')):,}" if pd.notnull(x) and str(x).replace(",", "").isdigit() else "—"
+    )
+
+    st.dataframe(main_table, height=400, width=1000)
+
+    # --- Valuation Trend Chart ---
+    st.header("Valuation Trend for a Unicorn (Q4 2024 → Q2 2025)")
+    companies = sorted(history.company_index)
+    company_choice = st.selectbox("Select Company", companies)
+
+    desired_quarters = ["Q4 2024", "Q1 2025", "Q2 2025"]
+    trend = history.trend(company_choice, desired_quarters)
+
+    if trend.empty:
+        st.info("No data available for this unicorn in Q4 2024 to Q2 2025.")
+    else:
+        chart_data = trend.rename("Post Money Value")
+        chart_data.index = pd.CategoricalIndex(chart_data.index, categories=desired_quarters, ordered=True, name="Quarter")
+        st.line_chart(chart_data)
+
+    # --- Risers & Fallers Between Quarters ---
+    st.header("All Movers Between Quarters")
+    q1, q2 = st.columns(2)
+    quarter1 = q1.selectbox("Compare From", quarters, index=max(0, len(quarters) - 2), key="q1")
+    quarter2 = q2.selectbox("Compare To", quarters, index=len(quarters) - 1, key="q2")
+    if quarter1 == quarter2:
+        # e.g. offline, with only the bundled single-quarter list
+        st.info("Select two different quarters to compare.")
+        st.stop()
+
+    comp = history.movers(quarter1, quarter2)
+
+    risers = comp[comp["Change_$B"] > 0].sort_values("Change_$B", ascending=False).copy()
+    fallers = comp[comp["Change_$B"] < 0].sort_values("Change_$B").copy()
+
+    for group in [risers, fallers]:
+        group["Value_From_fmt"] = group["Value_From"].apply(format_billions)
+        group["Value_To_fmt"] = group["Value_To"].apply(format_billions)
+        group["Change_$B_fmt"] = group["Change_$B"].apply(format_billions)
+        group["Multiple_fmt"] = group["Multiple"].apply(format_multiple)
+
+    if not risers.empty:
+        st.subheader(f"All Risers ({quarter1} → {quarter2})")
+        st.dataframe(
+            risers[["Company", "Value_From_fmt", "Value_To_fmt", "Change_$B_fmt", "Multiple_fmt"]].rename(
+                columns={
+                    "Value_From_fmt": f"Valuation {quarter1}",
+                    "Value_To_fmt": f"Valuation {quarter2}",
+                    "Change_$B_fmt": "Change ($B)",
+                    "Multiple_fmt": "Multiple",
+                }
+            ),
+            height=400,
+            width=1000,
+        )
+    else:
+        st.info("No risers between selected quarters.")
+
+    if not fallers.empty:
+        st.subheader(f"All Fallers ({quarter1} → {quarter2})")
+        st.dataframe(
+            fallers[["Company", "Value_From_fmt", "Value_To_fmt", "Change_$B_fmt", "Multiple_fmt"]].rename(
+                columns={
+                    "Value_From_fmt": f"Valuation {quarter1}",
+                    "Value_To_fmt": f"Valuation {quarter2}",
+                    "Change_$B_fmt": "Change ($B)",
+                    "Multiple_fmt": "Multiple",
+                }
+            ),
+            height=400,
+            width=1000,
+        )
+    else:
+        st.info("No fallers between selected quarters.")
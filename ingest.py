@@ -0,0 +1,235 @@
+# ingest.py
+#
+# Incremental ingestion of quarterly CB unicorn reports.
+# A new snapshot CSV is mapped onto the master_unicorns.csv columns, matched
+# to stable company ids by normalized name, and only the rows that are new or
+# changed for its quarter are appended to a Parquet store partitioned by
+# quarter. Adding a quarter reads that quarter's partition and the company
+# dictionary only, never the rest of the history.
+#
+#     python ingest.py "June 25 - All Unicorns.csv"
+#     python ingest.py report.csv --quarter "Q3 2025" --store data-clean/history
+#
+# Layout:
+#     <store>/companies/part-00000.parquet      company_id, name key, name, first quarter
+#     <store>/quarter=2025-Q2/part-00000.parquet  one file per ingested delta
+
+import argparse
+import glob
+import os
+import re
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from unicorn_index import MASTER_UNICORNS_CSV, name_keys
+from valuations import quarter_key
+
+DEFAULT_STORE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data-clean", "history")
+
+NAME_COLUMN = "Organization Name"
+VALUATION_COLUMN = "Post_Money_Valuation_(in B)"
+MASTER_COLUMNS = [NAME_COLUMN, VALUATION_COLUMN, "Lead Investors Include", "Country", "Continent", "Industry"]
+VALUE_COLUMNS = MASTER_COLUMNS[1:]
+# Older CB report headers → master_unicorns.csv headers
+COLUMN_ALIASES = {
+    "select investors": "Lead Investors Include",
+    "lead investors": "Lead Investors Include",
+    "company": NAME_COLUMN,
+    "valuation ($b)": VALUATION_COLUMN,
+    "post money value": VALUATION_COLUMN,
+}
+MONTHS = {m: i + 1 for i, m in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"]
+)}
+
+
+# — Quarters —
+def partition_name(quarter):
+    # "Q2 2025" → "quarter=2025-Q2", so partitions sort chronologically
+    year, q = quarter_key(quarter)
+    return f"quarter={year}-Q{q}"
+
+
+def infer_quarter(path):
+    """Quarter from a report file name: "June 25 - …", "December 2024 - …", "7-02-2024-…"."""
+    name = os.path.basename(path).lower()
+    match = re.search(r"\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*[\s_-]+(?:\d{1,2}(?:st|nd|rd|th)[\s_-]+)?(\d{4}|\d{2})\b", name)
+    if match:
+        month, year = MONTHS[match.group(1)], int(match.group(2))
+    else:
+        match = re.search(r"\b(\d{1,2})-(\d{1,2})-(\d{4})\b", name)
+        if not match:
+            return None
+        month, year = int(match.group(1)), int(match.group(3))
+    year = year + 2000 if year < 100 else year
+    return f"Q{(month - 1) // 3 + 1} {year}"
+
+
+# — Schema —
+def _continent_by_country():
+    master = pd.read_csv(MASTER_UNICORNS_CSV, on_bad_lines="skip")
+    return master.groupby("Country")["Continent"].agg(lambda s: s.mode().iat[0]).to_dict()
+
+
+def normalize_snapshot(df):
+    """Map a raw CB report onto the master_unicorns.csv columns."""
+    df = df.rename(columns=lambda c: c.strip())
+    df = df.rename(columns={c: COLUMN_ALIASES[c.lower()] for c in df.columns if c.lower() in COLUMN_ALIASES})
+    if NAME_COLUMN not in df.columns or VALUATION_COLUMN not in df.columns:
+        raise ValueError(f"Snapshot needs '{NAME_COLUMN}' and '{VALUATION_COLUMN}' columns")
+    df[VALUATION_COLUMN] = pd.to_numeric(
+        df[VALUATION_COLUMN].astype(str).str.replace(r"[$,B\s]", "", regex=True), errors="coerce"
+    )
+    if "Continent" not in df.columns and "Country" in df.columns:
+        df["Continent"] = df["Country"].map(_continent_by_country())
+    for col in MASTER_COLUMNS:
+        if col not in df.columns:
+            df[col] = None
+    df = df[MASTER_COLUMNS]
+    df = df[df[NAME_COLUMN].notna() & (df[NAME_COLUMN].astype(str).str.strip() != "")].copy()
+    df[NAME_COLUMN] = df[NAME_COLUMN].astype(str).str.strip()
+    for col in ["Lead Investors Include", "Country", "Continent", "Industry"]:
+        df[col] = df[col].astype(object).where(df[col].notna(), None)
+    return df
+
+
+def read_snapshot(path):
+    # Some reports are semicolon-separated
+    return pd.read_csv(path, sep=None, engine="python", on_bad_lines="skip")
+
+
+# — Store —
+def _write_part(df, directory):
+    os.makedirs(directory, exist_ok=True)
+    part = len(glob.glob(os.path.join(directory, "part-*.parquet")))
+    path = os.path.join(directory, f"part-{part:05d}.parquet")
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    os.close(fd)
+    df.to_parquet(tmp, index=False)
+    os.replace(tmp, path)
+    return path
+
+
+def _read_parts(directory):
+    parts = sorted(glob.glob(os.path.join(directory, "part-*.parquet")))
+    if not parts:
+        return None
+    return pd.concat([pd.read_parquet(p) for p in parts], ignore_index=True)
+
+
+def read_companies(store):
+    companies = _read_parts(os.path.join(store, "companies"))
+    if companies is None:
+        return pd.DataFrame({"company_id": pd.Series(dtype=np.int64), "name key": [], NAME_COLUMN: [],
+                             "first quarter": []})
+    return companies
+
+
+def read_quarter(store, quarter):
+    """Latest record per company for one quarter (later deltas win)."""
+    df = _read_parts(os.path.join(store, partition_name(quarter)))
+    if df is None:
+        return pd.DataFrame(columns=["company_id", *MASTER_COLUMNS, "Quarter"])
+    return df.drop_duplicates("company_id", keep="last").reset_index(drop=True)
+
+
+def stored_quarters(store):
+    names = [os.path.basename(p) for p in glob.glob(os.path.join(store, "quarter=*"))]
+    quarters = [f"Q{n.split('-Q')[1]} {n.split('=')[1].split('-')[0]}" for n in names]
+    return sorted(quarters, key=quarter_key)
+
+
+def read_store(store=DEFAULT_STORE, quarters=None):
+    quarters = stored_quarters(store) if quarters is None else quarters
+    frames = [read_quarter(store, q) for q in quarters]
+    frames = [f for f in frames if len(f)]
+    if not frames:
+        return pd.DataFrame(columns=["company_id", *MASTER_COLUMNS, "Quarter"])
+    return pd.concat(frames, ignore_index=True)
+
+
+def history_frame(store=DEFAULT_STORE):
+    # Company / Quarter / Post Money Value, ready for ValuationHistory.from_frame().
+    # Companies are named as first ingested, so respellings stay one row.
+    df = read_store(store)
+    names = read_companies(store).set_index("company_id")[NAME_COLUMN]
+    return pd.DataFrame({
+        "Company": df["company_id"].map(names).to_numpy(),
+        "Quarter": df["Quarter"].to_numpy(),
+        "Post Money Value": df[VALUATION_COLUMN].to_numpy(),
+    })
+
+
+def _same(a, b):
+    # Column-wise equality that treats two missing values as equal
+    return (a == b) | (pd.isna(a) & pd.isna(b))
+
+
+def ingest(df, quarter, store=DEFAULT_STORE):
+    """Append the new and changed rows of ``df`` (raw report) for ``quarter``.
+
+    Returns counts of rows read, new, updated, unchanged and duplicates.
+    """
+    quarter_key(quarter)                                 # validate "Qn YYYY"
+    snapshot = normalize_snapshot(df)
+    rows = len(snapshot)
+    snapshot["name key"] = name_keys(snapshot[NAME_COLUMN]).to_numpy()
+    # Reports are sorted by valuation, so the first row per company is kept
+    snapshot = snapshot.drop_duplicates("name key", keep="first")
+    duplicates = rows - len(snapshot)
+
+    # Stable ids: existing companies by name key, new ones appended to the dictionary
+    companies = read_companies(store)
+    ids = dict(zip(companies["name key"], companies["company_id"]))
+    unseen = snapshot.loc[~snapshot["name key"].isin(ids), ["name key", NAME_COLUMN]]
+    if len(unseen):
+        start = int(companies["company_id"].max()) + 1 if len(companies) else 0
+        new_companies = unseen.assign(company_id=np.arange(start, start + len(unseen), dtype=np.int64),
+                                      **{"first quarter": quarter})
+        _write_part(new_companies[["company_id", "name key", NAME_COLUMN, "first quarter"]],
+                    os.path.join(store, "companies"))
+        ids.update(zip(new_companies["name key"], new_companies["company_id"]))
+    snapshot["company_id"] = snapshot["name key"].map(ids).astype(np.int64)
+
+    # Delta against what this quarter already holds
+    existing = read_quarter(store, quarter).set_index("company_id")
+    known = snapshot["company_id"].isin(existing.index)
+    changed = pd.Series(False, index=snapshot.index)
+    if known.any():
+        current = existing.loc[snapshot.loc[known, "company_id"], VALUE_COLUMNS].set_index(snapshot.index[known])
+        same = np.logical_and.reduce([_same(snapshot.loc[known, c], current[c]) for c in VALUE_COLUMNS])
+        changed[known] = ~same
+    delta = snapshot[~known | changed]
+    if len(delta):
+        _write_part(delta.assign(Quarter=quarter)[["company_id", *MASTER_COLUMNS, "Quarter"]],
+                    os.path.join(store, partition_name(quarter)))
+    return {
+        "quarter": quarter,
+        "rows": rows,
+        "new": int((~known).sum()),
+        "updated": int(changed.sum()),
+        "unchanged": int(known.sum() - changed.sum()),
+        "duplicates": duplicates,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Append a quarterly unicorn report to the history store.")
+    parser.add_argument("snapshots", nargs="+", help="report CSV(s)")
+    parser.add_argument("--quarter", help='quarter label, e.g. "Q2 2025" (default: from the file name)')
+    parser.add_argument("--store", default=DEFAULT_STORE)
+    args = parser.parse_args(argv)
+
+    for path in args.snapshots:
+        quarter = args.quarter or infer_quarter(path)
+        if quarter is None:
+            parser.error(f"cannot infer the quarter of {path!r}; pass --quarter")
+        stats = ingest(read_snapshot(path), quarter, args.store)
+        print(f"{stats['quarter']}: {stats['rows']} rows → {stats['new']} new, {stats['updated']} updated, "
+              f"{stats['unchanged']} unchanged, {stats['duplicates']} duplicates ({os.path.basename(path)})")
+
+
+if __name__ == "__main__":
+    main()
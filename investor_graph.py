@@ -0,0 +1,169 @@
+# investor_graph.py
+#
+# Co-investment graph of the investors behind the unicorn datasets.
+# The comma-joined investor columns ("Lead Investors Include" in
+# master_unicorns.csv, "Top 5 Investors" in emerging_unicorns.csv, "Select
+# Investors" in the July 2024 report) are split once into an interned investor
+# dictionary and a sparse company × investor matrix B. The co-investment
+# adjacency is Bᵀ·B without its diagonal: entry (i, j) is the number of
+# companies investors i and j both backed. Each adjacency row is stored
+# heaviest first, so top-k co-investors is a slice, and k-hop neighbourhoods
+# are a breadth-first walk over the CSR rows.
+#
+#     graph = get_investor_graph("unicorns")
+#     graph.co_investors("Sequoia Capital", k=10)
+#     graph.neighbourhood("Sequoia Capital", hops=2)
+
+import os
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from ingest import read_snapshot
+from unicorn_index import load_static_datasets, normalize_names
+
+INVESTOR_COLUMNS = {
+    "unicorns": "lead investors include",
+    "emerging": "top 5 investors",
+    "2024": "select investors",
+}
+REPORT_2024_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), "7-02-2024-Unicrons_Data.csv")
+
+
+# Pieces made only of these are the end of the previous name ("Tiger Global Management, LLC")
+LEGAL_SUFFIXES = [
+    "inc", "incorporated", "llc", "l l c", "llp", "lp", "l p", "ltd", "limited", "corp", "corporation", "co",
+    "gmbh", "ag", "sa", "nv", "bv", "plc", "pte", "pty",
+]
+_LEGAL_SUFFIX_RE = r"(?:(?:" + "|".join(LEGAL_SUFFIXES) + r")\s*)+"
+
+
+def split_investors(values):
+    """(row, investor name) pairs from comma-joined investor strings.
+
+    A piece that is only a legal suffix is joined back onto the name before it:
+
+    >>> split_investors(["Tiger Global Management, LLC, Sequoia Capital", "LTD."])[1].tolist()
+    ['Tiger Global Management, LLC', 'Sequoia Capital', 'LTD.']
+    """
+    exploded = pd.Series(values, dtype=object).reset_index(drop=True).str.split(",").explode()
+    names = exploded.str.strip()
+    keep = (names.notna() & (names != "")).to_numpy(dtype=bool)
+    rows, names = exploded.index.to_numpy()[keep], names[keep]
+    keys = names.str.lower().str.replace(r"[^a-z0-9]+", " ", regex=True).str.strip()
+    suffix = keys.str.fullmatch(_LEGAL_SUFFIX_RE).to_numpy(dtype=bool)
+    # A name starts at every piece that isn't a suffix, and at the first piece of each row
+    starts = ~suffix | np.r_[True, rows[1:] != rows[:-1]]
+    names = names.to_numpy(dtype=object)
+    if starts.all():
+        return rows, names
+    joined = pd.Series(names).groupby(np.cumsum(starts) - 1).agg(", ".join)
+    return rows[starts], joined.to_numpy(dtype=object)
+
+
+class InvestorGraph:
+    """Interned investors, their portfolios and the weighted co-investment adjacency.
+
+    >>> graph = InvestorGraph(["Ramp", "Rippling"], ["Tiger Global Management, LLC", "Tiger Global Management"])
+    >>> len(graph), graph.portfolio("Tiger Global Management").tolist()
+    (1, ['Ramp', 'Rippling'])
+    """
+
+    def __init__(self, companies, investors):
+        self.companies = np.asarray(pd.Series(companies, dtype=object), dtype=object)
+        rows, names = split_investors(investors)
+        # Spellings that normalize alike ("Tiger Global Management, LLC") are one investor,
+        # shown under the first spelling seen
+        investor, keys = pd.factorize(normalize_names(names).to_numpy(dtype=object))
+        self.ids = {key: i for i, key in enumerate(keys)}
+        self.names = pd.Series(names).groupby(investor).first().to_numpy(dtype=object)
+
+        companies_by_investor = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, investor)), shape=(len(self.companies), len(keys))
+        )
+        companies_by_investor.sum_duplicates()
+        companies_by_investor.data[:] = 1
+        self.portfolios = companies_by_investor.T.tocsr()          # investor × company
+        self.portfolios.sort_indices()
+        self.portfolio_sizes = np.diff(self.portfolios.indptr)
+
+        adjacency = (self.portfolios @ companies_by_investor).tocsr()
+        adjacency.setdiag(0)                     # every investor has a diagonal entry already
+        adjacency.eliminate_zeros()
+        # Heaviest co-investor first within each row, ties to the larger portfolio
+        row = np.repeat(np.arange(adjacency.shape[0]), np.diff(adjacency.indptr))
+        order = np.lexsort((-self.portfolio_sizes[adjacency.indices], -adjacency.data, row))
+        adjacency.indices, adjacency.data = adjacency.indices[order], adjacency.data[order]
+        adjacency.has_sorted_indices = False
+        self.adjacency = adjacency
+        self.by_size = np.argsort(-self.portfolio_sizes, kind="stable")
+
+    def __len__(self):
+        return len(self.names)
+
+    def lookup(self, name):
+        """Investor id of ``name`` (any spelling that normalizes to a known investor)."""
+        investor = self.ids.get(normalize_names([name]).iat[0])
+        if investor is None:
+            raise KeyError(f"Unknown investor: {name!r}")
+        return investor
+
+    def _frame(self, ids, **columns):
+        return pd.DataFrame({"Investor": self.names[ids], **columns,
+                             "Portfolio Companies": self.portfolio_sizes[ids]})
+
+    def top_investors(self, k=20):
+        # Investors backing the most companies
+        return self._frame(self.by_size[:k])
+
+    def portfolio(self, name):
+        investor = self.lookup(name)
+        start, end = self.portfolios.indptr[investor:investor + 2]
+        return self.companies[self.portfolios.indices[start:end]]
+
+    def co_investors(self, name, k=10):
+        """The ``k`` investors sharing the most companies with ``name``."""
+        investor = self.lookup(name)
+        start = self.adjacency.indptr[investor]
+        end = min(start + k, self.adjacency.indptr[investor + 1])
+        return self._frame(self.adjacency.indices[start:end],
+                           **{"Shared Companies": self.adjacency.data[start:end]})
+
+    def shared_companies(self, name, other):
+        a = self.portfolios[self.lookup(name)].indices
+        b = self.portfolios[self.lookup(other)].indices
+        return self.companies[np.intersect1d(a, b, assume_unique=True)]
+
+    def neighbourhood(self, name, hops=2):
+        """Investors within ``hops`` co-investment steps of ``name``, nearest first."""
+        investor = self.lookup(name)
+        distance = np.full(len(self), -1, dtype=np.int64)
+        distance[investor] = 0
+        frontier = np.array([investor])
+        for hop in range(1, hops + 1):
+            if not len(frontier):
+                break
+            reached = np.unique(self.adjacency[frontier].indices)
+            frontier = reached[distance[reached] < 0]
+            distance[frontier] = hop
+        ids = np.flatnonzero(distance > 0)
+        ids = ids[np.lexsort((-self.portfolio_sizes[ids], distance[ids]))]
+        return self._frame(ids, Hops=distance[ids])
+
+
+def build_investor_graph(df, investor_column, name_column="organization name"):
+    return InvestorGraph(df[name_column], df[investor_column])
+
+
+@lru_cache(maxsize=len(INVESTOR_COLUMNS))
+def get_investor_graph(dataset="unicorns"):
+    # Built once per process from the static unicorn / emerging datasets or the July 2024 report
+    if dataset == "2024":
+        df = read_snapshot(REPORT_2024_CSV)
+        df.columns = df.columns.str.lower().str.strip()
+    else:
+        df_unicorns, df_emerging = load_static_datasets()
+        df = df_unicorns if dataset == "unicorns" else df_emerging
+    return build_investor_graph(df, INVESTOR_COLUMNS[dataset])
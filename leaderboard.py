@@ -0,0 +1,87 @@
+# leaderboard.py
+#
+# Unicorn hit rates for many VC firms at once.
+# A multi-firm upload (company rows tagged with a "VC Firm" column, like the
+# CB "RV-held VC firms's investments" report) becomes a sparse firm × company
+# incidence matrix. Each distinct company is matched against the unicorn and
+# emerging indexes once; every firm's metrics then come out of one sparse
+# product with a company × [1, unicorn, emerging, valuation] matrix.
+#
+#     board = FirmLeaderboard(df["vc firm"], df["organization name"], df["website"])
+#     board.scores(get_unicorn_index(), unicorn_valuations(df_unicorns))
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from unicorn_index import VALUATION_COLUMN
+
+POSSIBLE_FIRM_COLUMNS = ["vc firm", "firm", "investor name", "vc"]
+
+
+def find_firm_column(df):
+    return next((col for col in df.columns if col in POSSIBLE_FIRM_COLUMNS), None)
+
+
+def unicorn_valuations(df_unicorns, name_column="organization name"):
+    # Canonical unicorn name → post-money valuation (in B)
+    return df_unicorns.groupby(name_column, observed=True)[VALUATION_COLUMN].max()
+
+
+class FirmLeaderboard:
+    """Firm × company incidence of a multi-firm portfolio upload."""
+
+    def __init__(self, firms, names, websites=None):
+        rows = pd.DataFrame({
+            "firm": pd.Series(firms, dtype=object).reset_index(drop=True),
+            "name": pd.Series(names, dtype=object).reset_index(drop=True),
+            "website": None if websites is None else pd.Series(websites, dtype=object).reset_index(drop=True),
+        }).dropna(subset=["firm", "name"])
+        firm, firms = pd.factorize(rows["firm"].astype(str).str.strip(), sort=True)
+        company, companies = pd.factorize(rows["name"])
+        self.firms = np.asarray(firms, dtype=object)
+        self.companies = pd.Series(companies, dtype=object)
+        # First website seen per company, for domain matching
+        self.websites = (
+            pd.Series(rows["website"].to_numpy(), index=company).groupby(level=0).first()
+            .reindex(range(len(companies))).reset_index(drop=True)
+            if websites is not None else None
+        )
+        # A company listed twice under one firm counts once
+        self.incidence = sparse.csr_matrix(
+            (np.ones(len(firm), dtype=np.float64), (firm, company)), shape=(len(firms), len(companies))
+        )
+        self.incidence.sum_duplicates()
+        self.incidence.data[:] = 1.0
+
+    def company_metrics(self, unicorn_index, valuations, fuzzy_threshold=None):
+        """Per company: [1, is unicorn, is emerging, unicorn valuation in B]."""
+        unicorn = unicorn_index.unicorns.match(self.companies, self.websites, fuzzy_threshold)["match"]
+        emerging = unicorn_index.emerging.match(self.companies, self.websites, fuzzy_threshold)["match"]
+        return np.column_stack([
+            np.ones(len(self.companies)),
+            unicorn.notna().to_numpy(dtype=np.float64),
+            emerging.notna().to_numpy(dtype=np.float64),
+            unicorn.map(valuations).fillna(0.0).to_numpy(dtype=np.float64),
+        ])
+
+    def rank(self, metrics):
+        # One sparse (firms × companies) @ (companies × 4) product for every firm
+        companies, unicorns, emerging, value = (self.incidence @ metrics).T
+        with np.errstate(divide="ignore", invalid="ignore"):
+            board = pd.DataFrame({
+                "VC Firm": self.firms,
+                "Portfolio Companies": companies.astype(np.int64),
+                "Unicorns": unicorns.astype(np.int64),
+                "Unicorn Hit Rate %": np.where(companies > 0, unicorns / companies * 100, 0.0),
+                "Emerging Unicorns": emerging.astype(np.int64),
+                "Emerging Overlap %": np.where(companies > 0, emerging / companies * 100, 0.0),
+                "Unicorn Value ($B)": value,
+                "Valuation-Weighted Hit Rate ($B per company)": np.where(companies > 0, value / companies, 0.0),
+            })
+        return board.sort_values(["Unicorn Hit Rate %", "Unicorn Value ($B)"], ascending=False, kind="stable") \
+            .reset_index(drop=True)
+
+    def scores(self, unicorn_index, valuations, fuzzy_threshold=None):
+        """Leaderboard of every firm, best hit rate first."""
+        return self.rank(self.company_metrics(unicorn_index, valuations, fuzzy_threshold))
@@ -0,0 +1,96 @@
+# page_registry.py
+#
+# Lazily imported dashboard pages.
+# Each page names its module and the heavy libraries it needs; nothing is
+# imported until the page is first visited. Every import is timed: the first
+# visit records the cold cost (and how many modules it loaded), later visits
+# the per-rerun cost of the cached import, and the dashboard records the
+# total time of each script run. costs() gathers them for the sidebar, and
+# cold imports are also logged for the container logs.
+#
+#     registry = PageRegistry([Page("🏠 Home", "home"), Page("📊 Charts", "charts", ("matplotlib.pyplot",))])
+#     registry.run(label)
+
+import importlib
+import logging
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Page:
+    label: str
+    module: str
+    dependencies: tuple = ()         # heavy imports loaded (and timed) with the page
+    entry: str = "run"
+
+
+@dataclass
+class ImportCost:
+    first_seconds: float = None      # cold import of the dependencies and the page module
+    modules_loaded: int = 0
+    dependencies: dict = field(default_factory=dict)   # name → cold import seconds
+    last_seconds: float = None       # import on the latest visit (a sys.modules hit once warm)
+    last_run_seconds: float = None   # whole script run of the latest visit
+    visits: int = 0
+
+
+class PageRegistry:
+    """Pages by sidebar label, imported on first visit."""
+
+    def __init__(self, pages):
+        self.pages = {page.label: page for page in pages}
+        self.import_costs = {label: ImportCost() for label in self.pages}
+        self._lock = threading.Lock()     # sessions rerun on their own threads
+
+    @property
+    def labels(self):
+        return list(self.pages)
+
+    def load(self, label):
+        """The page's entry point, importing its module and dependencies if needed."""
+        page, cost = self.pages[label], self.import_costs[label]
+        with self._lock:
+            modules_before = len(sys.modules)
+            start = time.perf_counter()
+            dependencies = {}
+            for name in page.dependencies:
+                dependency_start = time.perf_counter()
+                importlib.import_module(name)
+                dependencies[name] = time.perf_counter() - dependency_start
+            module = importlib.import_module(page.module)
+            elapsed = time.perf_counter() - start
+            if cost.first_seconds is None:
+                cost.first_seconds, cost.dependencies = elapsed, dependencies
+                cost.modules_loaded = len(sys.modules) - modules_before
+                logger.info("Imported page %r in %.0f ms (%d modules)", label, elapsed * 1000, cost.modules_loaded)
+            cost.last_seconds = elapsed
+            cost.visits += 1
+        return getattr(module, page.entry)
+
+    def run(self, label):
+        return self.load(label)()
+
+    def record_run(self, label, seconds):
+        self.import_costs[label].last_run_seconds = seconds
+
+    def costs(self):
+        # One row per page, in milliseconds; pages not visited yet have no timings
+        import pandas as pd     # not at module level, so it is charged to the first page that needs it
+
+        def ms(seconds):
+            return None if seconds is None else round(seconds * 1000, 1)
+
+        return pd.DataFrame([{
+            "Page": label,
+            "Cold Import (ms)": ms(cost.first_seconds),
+            "Modules Loaded": cost.modules_loaded if cost.first_seconds is not None else None,
+            "Slowest Dependency": max(cost.dependencies, key=cost.dependencies.get) if cost.dependencies else None,
+            "Rerun Import (ms)": ms(cost.last_seconds),
+            "Last Run (ms)": ms(cost.last_run_seconds),
+            "Visits": cost.visits,
+        } for label, cost in self.import_costs.items()])
@@ -0,0 +1,244 @@
+# profiling.py
+#
+# Lightweight spans for the dashboard's hot paths.
+# A run is one Streamlit script execution; spans opened during it record wall
+# time, an optional row count, the change in resident memory and free-form
+# attributes (e.g. cache=hit|miss), nested by depth. Runs live on the script
+# thread (each session reruns on its own thread), so concurrent sessions never
+# mix their spans; outside a run, span() records nothing and costs next to
+# nothing, so library code and benchmarks can be left instrumented.
+# Finished runs are kept in a bounded in-process history and can be exported
+# as JSON lines or in the Prometheus text format.
+#
+#     profiling.start_run("🦄 Unicorn Analyzer")
+#     with span("read upload") as s:
+#         df = pd.read_csv(uploaded_file)
+#         s.rows = len(df)
+#     profiling.finish_run()
+#
+# Set PROFILE_LOG to a file path to append every finished run to it as JSON lines.
+
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+PROFILE_LOG_ENV = "PROFILE_LOG"
+HISTORY_RUNS = 500
+
+_local = threading.local()
+_history = deque(maxlen=HISTORY_RUNS)
+_history_lock = threading.Lock()
+
+try:
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):
+    _PAGE_SIZE = None
+
+
+def resident_memory():
+    # Resident set size in bytes (Linux /proc); None where it is not available
+    if _PAGE_SIZE is None:
+        return None
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+@dataclass
+class Span:
+    name: str
+    depth: int = 0
+    start: float = 0.0               # seconds since the run started
+    seconds: float = 0.0
+    rows: int = None
+    memory_delta: int = None         # bytes of resident memory gained (negative when freed)
+    attrs: dict = field(default_factory=dict)
+
+
+@dataclass
+class Run:
+    page: str = None
+    started_at: float = field(default_factory=time.time)
+    seconds: float = None
+    spans: list = field(default_factory=list)
+    run_id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+
+
+def start_run(page=None, started=None):
+    """Begin recording spans on this thread; ``started`` is a perf_counter() taken earlier, if any."""
+    _local.run = Run(page)
+    _local.started = time.perf_counter() if started is None else started
+    _local.depth = 0
+    return _local.run
+
+
+def current_run():
+    return getattr(_local, "run", None)
+
+
+def finish_run():
+    """Stop recording on this thread, keep the run in the history and return it."""
+    run = current_run()
+    if run is None:
+        return None
+    run.seconds = time.perf_counter() - _local.started
+    _local.run = None
+    with _history_lock:
+        _history.append(run)
+    path = os.environ.get(PROFILE_LOG_ENV)
+    if path:
+        with _history_lock, open(path, "a", encoding="utf-8") as f:
+            f.write(to_jsonl([run]))
+    return run
+
+
+def history():
+    with _history_lock:
+        return list(_history)
+
+
+@contextmanager
+def span(name, rows=None, **attrs):
+    run = current_run()
+    record = Span(name, rows=rows, attrs=attrs)
+    if run is None:
+        yield record
+        return
+    record.depth = _local.depth
+    run.spans.append(record)         # in start order; depth gives the nesting
+    _local.depth += 1
+    memory_before = resident_memory()
+    start = time.perf_counter()
+    record.start = start - _local.started
+    try:
+        yield record
+    finally:
+        record.seconds = time.perf_counter() - start
+        memory_after = resident_memory()
+        if memory_before is not None and memory_after is not None:
+            record.memory_delta = memory_after - memory_before
+        _local.depth -= 1
+
+
+@contextmanager
+def cached_span(name, misses, rows=None, **attrs):
+    """A span tagged cache=hit|miss, from a miss counter read before and after.
+
+    ``misses`` is e.g. ``lambda: load_static_datasets.cache_info().misses`` or ``lambda: RESULT_CACHE.misses``.
+    """
+    before = misses()
+    with span(name, rows, **attrs) as record:
+        yield record
+        record.attrs["cache"] = "miss" if misses() > before else "hit"
+
+
+# — Views —
+def run_table(run):
+    # One row per span of a run, indented by depth
+    import pandas as pd     # not at module level: the dashboard imports this before any page
+
+    return pd.DataFrame([{
+        "Span": "  " * s.depth + s.name,
+        "Start (ms)": round(s.start * 1000, 1),
+        "Time (ms)": round(s.seconds * 1000, 1),
+        "Rows": s.rows,
+        "Memory Δ (MB)": None if s.memory_delta is None else round(s.memory_delta / 1e6, 1),
+        "Details": ", ".join(f"{k}={v}" for k, v in s.attrs.items()),
+    } for s in run.spans], columns=["Span", "Start (ms)", "Time (ms)", "Rows", "Memory Δ (MB)", "Details"])
+
+
+def span_summary(runs):
+    """Calls, total / mean / max time, rows and memory per (page, span) over ``runs``, slowest first."""
+    import pandas as pd
+
+    df = pd.DataFrame([{"Page": run.page, "Span": s.name, "seconds": s.seconds, "rows": s.rows,
+                        "memory": s.memory_delta} for run in runs for s in run.spans],
+                      columns=["Page", "Span", "seconds", "rows", "memory"])
+    summary = df.groupby(["Page", "Span"], sort=False).agg(
+        Calls=("seconds", "size"), total=("seconds", "sum"), mean=("seconds", "mean"), max=("seconds", "max"),
+        Rows=("rows", "max"), memory=("memory", "max"),
+    )
+    summary = summary.assign(**{
+        "Total (ms)": (summary["total"] * 1000).round(1),
+        "Mean (ms)": (summary["mean"] * 1000).round(1),
+        "Max (ms)": (summary["max"] * 1000).round(1),
+        "Max Memory Δ (MB)": (summary["memory"] / 1e6).round(1),
+    })
+    return summary.sort_values("total", ascending=False)[
+        ["Calls", "Total (ms)", "Mean (ms)", "Max (ms)", "Rows", "Max Memory Δ (MB)"]
+    ].reset_index()
+
+
+# — Export —
+def to_jsonl(runs):
+    # One JSON object per run, its spans inline
+    lines = []
+    for run in runs:
+        record = {
+            "run_id": run.run_id, "page": run.page, "seconds": run.seconds,
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(run.started_at)),
+            "spans": [{"name": s.name, "depth": s.depth, "start": s.start, "seconds": s.seconds, "rows": s.rows,
+                       "memory_delta": s.memory_delta, **s.attrs} for s in run.spans],
+        }
+        lines.append(json.dumps(record, default=str, ensure_ascii=False) + "\n")
+    return "".join(lines)
+
+
+def _labels(**labels):
+    def escape(value):
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return "{" + ",".join(f'{k}="{escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def to_prometheus(runs, prefix="dashboard"):
+    """Prometheus text exposition of ``runs``: per-page run time and per-span time, rows and cache outcomes."""
+    runs_by_page, spans = {}, {}
+    for run in runs:
+        if run.seconds is not None:
+            total = runs_by_page.setdefault(run.page, [0, 0.0, 0.0])
+            total[0] += 1
+            total[1] += run.seconds
+            total[2] = max(total[2], run.seconds)
+        for s in run.spans:
+            total = spans.setdefault((run.page, s.name), {"count": 0, "sum": 0.0, "max": 0.0, "rows": 0, "cache": {}})
+            total["count"] += 1
+            total["sum"] += s.seconds
+            total["max"] = max(total["max"], s.seconds)
+            total["rows"] += s.rows or 0
+            if "cache" in s.attrs:
+                total["cache"][s.attrs["cache"]] = total["cache"].get(s.attrs["cache"], 0) + 1
+
+    lines = [
+        f"# HELP {prefix}_run_seconds Wall time of whole script runs.",
+        f"# TYPE {prefix}_run_seconds summary",
+    ]
+    for page, (count, seconds, _) in runs_by_page.items():
+        lines.append(f"{prefix}_run_seconds_sum{_labels(page=page)} {seconds:.6f}")
+        lines.append(f"{prefix}_run_seconds_count{_labels(page=page)} {count}")
+    lines += [f"# HELP {prefix}_run_seconds_max Slowest script run.", f"# TYPE {prefix}_run_seconds_max gauge"]
+    lines += [f"{prefix}_run_seconds_max{_labels(page=page)} {slowest:.6f}"
+              for page, (_, _, slowest) in runs_by_page.items()]
+
+    lines += [f"# HELP {prefix}_span_seconds Wall time of profiled spans.", f"# TYPE {prefix}_span_seconds summary"]
+    for (page, name), total in spans.items():
+        lines.append(f"{prefix}_span_seconds_sum{_labels(page=page, span=name)} {total['sum']:.6f}")
+        lines.append(f"{prefix}_span_seconds_count{_labels(page=page, span=name)} {total['count']}")
+    lines += [f"# HELP {prefix}_span_seconds_max Slowest call of each span.", f"# TYPE {prefix}_span_seconds_max gauge"]
+    lines += [f"{prefix}_span_seconds_max{_labels(page=page, span=name)} {total['max']:.6f}"
+              for (page, name), total in spans.items()]
+    lines += [f"# HELP {prefix}_span_rows_total Rows processed by profiled spans.",
+              f"# TYPE {prefix}_span_rows_total counter"]
+    lines += [f"{prefix}_span_rows_total{_labels(page=page, span=name)} {total['rows']}"
+              for (page, name), total in spans.items() if total["rows"]]
+    lines += [f"# HELP {prefix}_span_cache_total Cache hits and misses of cached spans.",
+              f"# TYPE {prefix}_span_cache_total counter"]
+    lines += [f"{prefix}_span_cache_total{_labels(page=page, span=name, result=result)} {count}"
+              for (page, name), total in spans.items() for result, count in total["cache"].items()]
+    return "\n".join(lines) + "\n"
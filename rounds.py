@@ -0,0 +1,291 @@
+# rounds.py
+#
+# Streaming aggregation of VC investment-rounds exports.
+# The upload is read CHUNK_ROWS rows at a time, parsing only the four columns
+# the analyzer uses, and every chunk is folded into a compact table of counts
+# per (year, organization, funding round, lead). Peak memory is one chunk plus
+# that table (and 12 bytes of codes per round, below), however long the
+# export. Stage counts, lead %, year histograms and per-company round sets are
+# all computed from the table. Alongside it, each round is kept as int32
+# company, stage and day codes for the follow-on analytics in follow_on.py.
+#
+#     summary = read_rounds(uploaded_file)
+#     summary.between(2018, 2024).stage_counts()
+#
+# For the year slider, RoundsCube pre-aggregates the dated rounds once per
+# upload into prefix sums over years, so any year range is answered by a
+# subtraction (and an OR over the range's round bitsets) instead of a pass
+# over the rows:
+#
+#     summary.cube.select(2018, 2024).follow_on_table(min_count=2)
+
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+
+from follow_on import NO_DATE, FollowOn, decode_stages
+
+ROUNDS_COLUMNS = ["announced date", "organization name", "funding round", "lead investor"]
+KEYS = ["year", "organization name", "funding round", "lead"]
+CHUNK_ROWS = 250_000
+# Partial tables are merged once they hold this many rows between them
+COMPACT_ROWS = 1_000_000
+
+
+def clean_funding_round(series):
+    # Remove text after " - " (e.g. "Series A - Acme" → "Series A")
+    return series.astype(str).str.split(" - ").str[0].str.strip()
+
+
+def _categorical(values):
+    # Column as categories + codes; missing values get the last code (-1)
+    categorical = pd.Categorical(values)
+    return pd.Series(categorical.categories, dtype=object), categorical.codes
+
+
+class _Dictionary:
+    # Names → int codes, grown chunk by chunk so codes stay stable across the file
+    def __init__(self):
+        self.codes = {}
+
+    def lookup(self, names, missing=-1):
+        # Code per name, plus ``missing`` last, for indexing with categorical codes
+        return np.array([self.codes.setdefault(name, len(self.codes)) for name in names] + [missing], dtype=np.int32)
+
+    @property
+    def names(self):
+        return np.array(list(self.codes), dtype=object)
+
+
+def _aggregate_chunk(chunk, companies, stages):
+    # (counts per KEYS, per-round company/stage/day codes for the follow-on analytics)
+    n = len(chunk)
+    if "announced date" in chunk.columns:
+        dates = pd.to_datetime(chunk["announced date"], errors="coerce")
+        year = dates.dt.year.to_numpy(dtype=float)
+        day = np.where(dates.isna(), NO_DATE, dates.to_numpy(dtype="datetime64[D]").astype(np.int64)).astype(np.int32)
+    else:
+        year = np.full(n, np.nan)
+        day = np.full(n, NO_DATE, dtype=np.int32)
+
+    # String cleaning runs on the distinct values only, not on every row
+    if "funding round" in chunk.columns:
+        categories, codes = _categorical(chunk["funding round"])
+        cleaned = clean_funding_round(categories).to_numpy(dtype=object)
+        rounds = np.append(cleaned, "nan")[codes]
+        stage = stages.lookup(cleaned, missing=stages.lookup(["nan"])[0])[codes]
+    else:
+        rounds = np.full(n, "nan", dtype=object)
+        stage = np.full(n, stages.lookup(["nan"])[0], dtype=np.int32)
+    if "lead investor" in chunk.columns:
+        categories, codes = _categorical(chunk["lead investor"])
+        lead = np.append(categories.astype(str).str.lower().eq("yes").to_numpy(), False)[codes]
+    else:
+        lead = np.zeros(n, dtype=bool)
+    if "organization name" in chunk.columns:
+        categories, codes = _categorical(chunk["organization name"])
+        company = companies.lookup(categories)[codes]
+        orgs = np.append(categories.to_numpy(dtype=object), None)[codes]
+    else:
+        company = np.full(n, -1, dtype=np.int32)
+        orgs = np.full(n, None, dtype=object)
+
+    frame = pd.DataFrame({"year": year, "organization name": orgs, "funding round": rounds, "lead": lead})
+    counts = frame.groupby(KEYS, dropna=False, sort=False).size().rename("count").reset_index()
+    return counts, (company, stage.astype(np.int32), day)
+
+
+def _merge(parts):
+    counts = pd.concat(parts, ignore_index=True)
+    return counts.groupby(KEYS, dropna=False, sort=False)["count"].sum().reset_index()
+
+
+def read_rounds(source, chunk_rows=CHUNK_ROWS):
+    """Stream an investment-rounds CSV (path or file object) into a RoundsSummary.
+
+    Raises pandas.errors.EmptyDataError for an empty file.
+    """
+    if hasattr(source, "seek"):
+        source.seek(0)
+    reader = pd.read_csv(source, chunksize=chunk_rows, usecols=lambda c: c.lower().strip() in ROUNDS_COLUMNS)
+    columns, parts, pending, events = None, [], 0, []
+    companies, stages = _Dictionary(), _Dictionary()
+    with reader:
+        for chunk in reader:
+            chunk.columns = chunk.columns.str.lower().str.strip()
+            columns = list(chunk.columns)
+            counts, chunk_events = _aggregate_chunk(chunk, companies, stages)
+            parts.append(counts)
+            events.append(chunk_events)
+            pending += len(parts[-1])
+            if pending > COMPACT_ROWS and len(parts) > 1:
+                parts = [_merge(parts)]
+                pending = len(parts[0])
+    if columns is None:
+        # Header only: no chunks, so take the columns from the header itself
+        if hasattr(source, "seek"):
+            source.seek(0)
+        columns = list(pd.read_csv(source, nrows=0).columns.str.lower().str.strip())
+    counts = _merge(parts) if parts else pd.DataFrame({
+        "year": pd.Series(dtype=float), "organization name": pd.Series(dtype=object),
+        "funding round": pd.Series(dtype=object), "lead": pd.Series(dtype=bool), "count": pd.Series(dtype=np.int64),
+    })
+    # 12 bytes per round: int32 company, stage and day codes
+    if events:
+        company, stage, day = (np.concatenate(columns) for columns in zip(*events))
+    else:
+        company = stage = day = np.array([], dtype=np.int32)
+    follow_on = FollowOn(companies.names, stages.names, company, stage, day)
+    return RoundsSummary(counts, [c for c in columns if c in ROUNDS_COLUMNS], follow_on)
+
+
+class RoundsSummary:
+    """Counts of rounds per (year, organization, funding round, lead)."""
+
+    def __init__(self, counts, columns=ROUNDS_COLUMNS, follow_on=None):
+        self.counts = counts
+        self.columns = list(columns)
+        self.follow_on = follow_on          # FollowOn over every round, for per-company analytics
+
+    def missing(self, columns=ROUNDS_COLUMNS):
+        return [c for c in columns if c not in self.columns]
+
+    def __len__(self):
+        # Number of rounds (rows of the original export)
+        return int(self.counts["count"].sum())
+
+    def year_range(self):
+        years = self.counts["year"].dropna()
+        return (int(years.min()), int(years.max())) if len(years) else None
+
+    def between(self, first_year, last_year):
+        # Rounds announced in [first_year, last_year]; undated rounds are dropped
+        year = self.counts["year"]
+        selected = self.counts[(year >= first_year) & (year <= last_year)]
+        return RoundsSummary(selected, self.columns, self.follow_on.between(first_year, last_year))
+
+    def year_histogram(self):
+        return self.counts.groupby("year")["count"].sum().astype(np.int64)
+
+    def stage_counts(self):
+        # Same order as value_counts(): most frequent stage first
+        counts = self.counts.groupby("funding round", sort=False)["count"].sum()
+        return counts.sort_values(ascending=False, kind="stable")
+
+    def lead_count(self):
+        return int(self.counts.loc[self.counts["lead"], "count"].sum())
+
+    def company_count(self):
+        return self.counts["organization name"].nunique()
+
+    def company_rounds(self):
+        # Per-company round counts, one row per (organization, funding round), sorted
+        return self.counts.groupby(["organization name", "funding round"])["count"].sum()
+
+    @cached_property
+    def cube(self):
+        return RoundsCube(self.counts)
+
+    def follow_on_table(self, companies=None, min_count=1):
+        # Count and list unique funding rounds per organization (see FollowOn.table)
+        return self.follow_on.table(companies, min_count)
+
+
+class RoundsCube:
+    """Prefix sums over years of stage, lead and per-company counts, plus per-year round bitsets.
+
+    Undated rounds are left out, as the year slider always dropped them.
+    """
+
+    def __init__(self, counts):
+        dated = counts[counts["year"].notna()]
+        self.first_year = int(dated["year"].min()) if len(dated) else 0
+        n_years = int(dated["year"].max()) - self.first_year + 1 if len(dated) else 0
+        year = (dated["year"].to_numpy() - self.first_year).astype(np.int64)
+        count = dated["count"].to_numpy(dtype=np.int64)
+        # Codes in sorted order, so bit order is the alphabetical order of the stage lists
+        stage, stages = pd.factorize(dated["funding round"], sort=True)
+        company, companies = pd.factorize(dated["organization name"], sort=True)
+        self.stages = np.asarray(stages, dtype=object)
+        self.companies = np.asarray(companies, dtype=object)
+        n_stages, n_companies = len(self.stages), len(self.companies)
+
+        def cumulative(years, index, size, weights, dtype=np.int64):
+            # (n_years + 1, size) prefix sums, filled one year's row at a time and summed in place,
+            # so the only full-size array is the result (no float64 table or stacked copies)
+            out = np.zeros((n_years + 1, size), dtype=dtype)
+            order = np.argsort(years, kind="stable")
+            bounds = np.searchsorted(years[order], np.arange(n_years + 1))
+            for y in range(n_years):
+                rows = order[bounds[y]:bounds[y + 1]]
+                out[y + 1] = np.bincount(index[rows], weights=weights[rows], minlength=size)
+            np.cumsum(out, axis=0, out=out)
+            return out
+
+        self.stage_cum = cumulative(year, stage, n_stages, count)
+        lead = dated["lead"].to_numpy(dtype=bool)
+        self.lead_cum = cumulative(year[lead], np.zeros(lead.sum(), dtype=np.int64), 1, count[lead])[:, 0]
+        # Undated or unnamed rounds count towards stages and leads, not companies (like nunique)
+        named = company >= 0
+        self.company_cum = cumulative(year[named], company[named], n_companies, count[named], np.int32)
+
+        # Round bitsets per (year, company), one uint64 word per 64 stages
+        words = max(1, -(-n_stages // 64))
+        key = (year[named] * n_companies + company[named]) * words + stage[named] // 64
+        bit = np.left_shift(np.uint64(1), (stage[named] % 64).astype(np.uint64))
+        order = np.argsort(key, kind="stable")
+        key, bit = key[order], bit[order]
+        starts = np.flatnonzero(np.r_[True, key[1:] != key[:-1]]) if len(key) else np.array([], dtype=np.int64)
+        self.bitsets = np.zeros(n_years * n_companies * words, dtype=np.uint64)
+        if len(starts):
+            self.bitsets[key[starts]] = np.bitwise_or.reduceat(bit, starts)
+        self.bitsets = self.bitsets.reshape(n_years, n_companies, words)
+
+    @property
+    def years(self):
+        return np.arange(self.first_year, self.first_year + len(self.lead_cum) - 1)
+
+    def select(self, first_year, last_year):
+        lo = min(max(first_year - self.first_year, 0), len(self.lead_cum) - 1)
+        hi = min(max(last_year - self.first_year + 1, lo), len(self.lead_cum) - 1)
+        return YearSelection(self, lo, hi)
+
+
+class YearSelection:
+    """Rounds of a RoundsCube in a year range: years [lo, hi) as cube offsets."""
+
+    def __init__(self, cube, lo, hi):
+        self.cube, self.lo, self.hi = cube, lo, hi
+
+    def _range(self, cumulative):
+        return cumulative[self.hi] - cumulative[self.lo]
+
+    def __len__(self):
+        return int(self._range(self.cube.stage_cum).sum())
+
+    def lead_count(self):
+        return int(self._range(self.cube.lead_cum))
+
+    def stage_counts(self):
+        # Same order as value_counts(): most frequent stage first
+        counts = pd.Series(self._range(self.cube.stage_cum), index=pd.Index(self.cube.stages, name="funding round"),
+                           name="count")
+        return counts[counts > 0].sort_values(ascending=False, kind="stable")
+
+    def company_counts(self):
+        return self._range(self.cube.company_cum)
+
+    def company_count(self):
+        return int(np.count_nonzero(self.company_counts()))
+
+    def follow_on_table(self, min_count=1):
+        # Investment count and stage list per organization with at least ``min_count`` rounds;
+        # stage strings are only built for the companies returned
+        counts = self.company_counts()
+        chosen = np.flatnonzero(counts >= max(min_count, 1))
+        bitsets = np.bitwise_or.reduce(self.cube.bitsets[self.lo:self.hi, chosen], axis=0)
+        return pd.DataFrame({
+            "Investment Count": counts[chosen].astype(np.int64),
+            "Investment Stages": decode_stages(bitsets, self.cube.stages),
+        }, index=pd.Index(self.cube.companies[chosen], name="organization name"))
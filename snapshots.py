@@ -0,0 +1,117 @@
+# snapshots.py
+#
+# Typed Arrow snapshots of the bundled CSV datasets.
+# A CSV is parsed and typed once, written next to it as an Arrow IPC file and
+# memory-mapped on later loads. The source's mtime, size and SHA-256 are kept
+# in the snapshot's schema metadata: a changed mtime triggers a hash check,
+# and a changed hash triggers a rebuild.
+#
+#     df = load_snapshot("data-clean/master_unicorns.csv", prepare)
+
+import hashlib
+import json
+import os
+import tempfile
+
+import pandas as pd
+import pyarrow as pa
+
+SNAPSHOT_DIRNAME = ".snapshot"
+# Bump when a prepare function changes, so existing snapshots are rebuilt
+SNAPSHOT_VERSION = 1
+_META_KEY = b"source"
+
+
+def snapshot_path(csv_path):
+    directory = os.path.join(os.path.dirname(os.path.abspath(csv_path)), SNAPSHOT_DIRNAME)
+    return os.path.join(directory, os.path.splitext(os.path.basename(csv_path))[0] + ".arrow")
+
+
+def file_sha256(path, block_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _source_meta(csv_path, sha256=None):
+    stat = os.stat(csv_path)
+    return {
+        "version": SNAPSHOT_VERSION,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": sha256 or file_sha256(csv_path),
+    }
+
+
+def _read(path):
+    # Memory-mapped: numeric columns are read straight from the page cache
+    with pa.memory_map(path, "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+    meta = json.loads((table.schema.metadata or {}).get(_META_KEY, b"{}"))
+    return table, meta
+
+
+def _write(table, path, meta):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), _META_KEY: json.dumps(meta).encode()})
+    # Write-then-rename so concurrent readers never see a partial file
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f, pa.ipc.new_file(f, table.schema) as writer:
+            writer.write_table(table)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def build_snapshot(csv_path, prepare, read_csv_kwargs=None):
+    """Parse ``csv_path``, type it with ``prepare(df)`` and write its snapshot."""
+    meta = _source_meta(csv_path)
+    df = prepare(pd.read_csv(csv_path, **(read_csv_kwargs or {})))
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    try:
+        _write(table, snapshot_path(csv_path), meta)
+    except OSError:
+        pass                        # read-only checkout: serve the parsed frame without caching it
+    return table
+
+
+def is_fresh(csv_path, meta):
+    # (fresh, meta to re-stamp): same mtime and size is trusted, otherwise compare hashes
+    if meta.get("version") != SNAPSHOT_VERSION:
+        return False, None
+    stat = os.stat(csv_path)
+    if meta.get("mtime_ns") == stat.st_mtime_ns and meta.get("size") == stat.st_size:
+        return True, None
+    sha256 = file_sha256(csv_path)
+    if meta.get("sha256") == sha256:
+        return True, _source_meta(csv_path, sha256)
+    return False, None
+
+
+def load_snapshot(csv_path, prepare, read_csv_kwargs=None):
+    """DataFrame for ``csv_path`` from its snapshot, rebuilding it when the CSV changed."""
+    path = snapshot_path(csv_path)
+    table = None
+    if os.path.exists(path):
+        try:
+            table, meta = _read(path)
+        except (OSError, pa.ArrowInvalid, ValueError):
+            table = None
+        if table is not None:
+            fresh, restamp = is_fresh(csv_path, meta)
+            if not fresh:
+                table = None
+            elif restamp:
+                # Touched but unchanged: record the new mtime so the next load skips hashing
+                try:
+                    _write(table, path, restamp)
+                except OSError:
+                    pass
+    if table is None:
+        table = build_snapshot(csv_path, prepare, read_csv_kwargs)
+    return table.to_pandas()
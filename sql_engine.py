@@ -0,0 +1,288 @@
+# sql_engine.py
+#
+# Optional DuckDB engine for the analyzer.
+# Uploads are spilled to a temporary file and scanned by DuckDB's CSV reader,
+# so only the columns a query names are parsed (projection pushdown) and the
+# rows never become a pandas frame. The rounds upload is cleaned into one
+# columnar table once; overlap joins, stage counts, lead percentages and
+# follow-on aggregation run as SQL against it, and only display-sized results
+# come back to pandas. The objects returned mirror rounds.RoundsSummary, so
+# the analyzer renders either engine with the same code.
+#
+#     engine = SqlEngine()
+#     rounds = engine.rounds(uploaded_file)
+#     rounds.cube.select(2018, 2024).stage_counts()
+#
+# Install duckdb (pinned in requirements.txt) to enable it; without it the
+# analyzer keeps the pandas engine.
+
+import os
+import shutil
+import tempfile
+import weakref
+
+import numpy as np
+import pandas as pd
+
+from rounds import ROUNDS_COLUMNS
+
+try:
+    import duckdb
+except ImportError:                 # optional: the analyzer falls back to pandas
+    duckdb = None
+
+
+def available():
+    return duckdb is not None
+
+
+def quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _remove_files(paths):
+    for path in paths:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+class SqlEngine:
+    """A DuckDB connection holding one session's uploads."""
+
+    def __init__(self):
+        if duckdb is None:
+            raise ImportError("The DuckDB engine needs the duckdb package (see requirements.txt)")
+        self.con = duckdb.connect()
+        self._files = []
+        self._uploads = {}          # view name → (upload id, columns)
+        self._rounds = None
+        self._portfolio = None
+        weakref.finalize(self, _remove_files, self._files)
+
+    def query(self, sql, params=None):
+        return self.con.execute(sql, params or []).df()
+
+    def register(self, name, df):
+        self.con.register(name, df)
+
+    def csv_view(self, name, uploaded_file):
+        """Expose an upload as view ``name``; returns {normalized column: original column}.
+
+        The upload is copied to disk once per file; DuckDB then reads only what each query uses.
+        """
+        upload_id = getattr(uploaded_file, "file_id", None) or id(uploaded_file)
+        cached = self._uploads.get(name)
+        if cached is not None and cached[0] == upload_id:
+            return cached[1]
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        self._files.append(path)
+        uploaded_file.seek(0)
+        with os.fdopen(fd, "wb") as f:
+            shutil.copyfileobj(uploaded_file, f, 1 << 20)
+        uploaded_file.seek(0)
+        if os.path.getsize(path) == 0:
+            raise pd.errors.EmptyDataError("No columns to parse from file")
+        self.con.execute(f"CREATE OR REPLACE VIEW {quote(name)} AS SELECT * FROM read_csv_auto('{path}', header=true)")
+        columns = {c.lower().strip(): c for c in self.query(f"DESCRIBE {quote(name)}")["column_name"]}
+        self._uploads[name] = (upload_id, columns)
+        return columns
+
+    # — Uploads —
+    def rounds(self, uploaded_file):
+        upload_id = getattr(uploaded_file, "file_id", None) or id(uploaded_file)
+        if self._rounds is None or self._rounds.upload_id != upload_id:
+            self._rounds = SqlRounds(self, uploaded_file, upload_id)
+        return self._rounds
+
+    def portfolio(self, uploaded_file, name_columns, website_columns, firm_columns):
+        """Distinct (name, website, firm) rows of a portfolio upload, and its count of named rows.
+
+        Overlaps only depend on distinct names, so the full upload never reaches pandas.
+        """
+        columns = self.csv_view("portfolio_raw", uploaded_file)
+        upload_id = self._uploads["portfolio_raw"][0]
+        if self._portfolio is not None and self._portfolio[0] == upload_id:
+            return self._portfolio[1]
+        name = next((c for c in columns if c in name_columns), None)
+        if name is None:
+            result = (pd.DataFrame(columns=list(columns)), 0)
+        else:
+            website = next((c for c in columns if c in website_columns), None)
+            firm = next((c for c in columns if c in firm_columns), None)
+            keys = [f"{quote(columns[name])} AS {quote(name)}"]
+            if firm:
+                keys.append(f"{quote(columns[firm])} AS {quote(firm)}")
+            select = ", ".join(keys + ([f"min({quote(columns[website])}) AS {quote(website)}"] if website else []))
+            df = self.query(
+                f"SELECT {select} FROM portfolio_raw WHERE {quote(columns[name])} IS NOT NULL "
+                f"GROUP BY {', '.join(str(i + 1) for i in range(len(keys)))}"
+            )
+            total = self.con.execute(f"SELECT count({quote(columns[name])}) FROM portfolio_raw").fetchone()[0]
+            result = (df, int(total))
+        self._portfolio = (upload_id, result)
+        return result
+
+    def unicorn_overlaps(self, df_unicorns, name_column, valuation_column, matched_names, rounds=None):
+        """Matched unicorn rows with valuation and follow-on count / stages from the rounds upload."""
+        # _position keeps the static dataset's row order, as the pandas engine does
+        unicorns = df_unicorns[[name_column, valuation_column]].assign(_position=np.arange(len(df_unicorns)))
+        self.register("unicorns", unicorns)
+        self.register("matched", pd.DataFrame({"name": pd.Series(list(matched_names), dtype=object)}))
+        follow_on = (
+            "SELECT org, sum(n) AS investment_count, string_agg(round, ', ' ORDER BY round) AS investment_stages "
+            "FROM (SELECT org, round, count(*) AS n FROM rounds JOIN (SELECT DISTINCT name FROM matched) m "
+            "ON rounds.org = m.name GROUP BY org, round) GROUP BY org"
+            if rounds is not None else
+            "SELECT NULL::VARCHAR AS org, NULL::BIGINT AS investment_count, NULL::VARCHAR AS investment_stages"
+        )
+        df = self.query(
+            f"SELECT u.{quote(name_column)}, u.{quote(valuation_column)}, "
+            f"f.investment_count AS \"Investment Count\", f.investment_stages AS \"Investment Stages\" "
+            f"FROM unicorns u JOIN (SELECT DISTINCT name FROM matched) m ON u.{quote(name_column)} = m.name "
+            f"LEFT JOIN ({follow_on}) f ON f.org = u.{quote(name_column)} ORDER BY u._position"
+        )
+        self.con.unregister("unicorns")
+        self.con.unregister("matched")
+        return df
+
+
+class SqlRounds:
+    """Cleaned rounds table of one upload, with the RoundsSummary interface."""
+
+    def __init__(self, engine, uploaded_file, upload_id):
+        self.engine, self.upload_id = engine, upload_id
+        columns = engine.csv_view("rounds_raw", uploaded_file)
+        self.columns = [c for c in ROUNDS_COLUMNS if c in columns]
+
+        def column(name, expression, default):
+            return expression.format(quote(columns[name])) if name in columns else default
+
+        # Same cleaning as the pandas engine: text after " - " dropped, missing rounds as "nan";
+        # the CSV sniffer reads Yes/No columns as booleans, hence 'true' for leads
+        engine.con.execute(f"""
+            CREATE OR REPLACE TABLE rounds AS SELECT
+                {column("organization name", "CAST({} AS VARCHAR)", "NULL::VARCHAR")} AS org,
+                {column("funding round", "coalesce(trim(split_part(CAST({} AS VARCHAR), ' - ', 1)), 'nan')", "'nan'")}
+                    AS round,
+                {column("announced date", "TRY_CAST({} AS DATE)", "NULL::DATE")} AS day,
+                {column("lead investor", "coalesce(lower(CAST({} AS VARCHAR)) IN ('yes', 'true'), false)", "false")}
+                    AS lead
+            FROM rounds_raw
+        """)
+        self.cube = _SqlYears(engine)
+        self.follow_on = _SqlFollowOn(engine)
+
+    def missing(self, columns=ROUNDS_COLUMNS):
+        return [c for c in columns if c not in self.columns]
+
+    def __len__(self):
+        return int(self.engine.con.execute("SELECT count(*) FROM rounds").fetchone()[0])
+
+    def year_range(self):
+        first, last = self.engine.con.execute("SELECT min(year(day)), max(year(day)) FROM rounds").fetchone()
+        return None if first is None else (int(first), int(last))
+
+    def follow_on_table(self, companies=None, min_count=1):
+        if companies is None:
+            return _follow_on(self.engine, "TRUE", [], min_count)
+        self.engine.register("wanted", pd.DataFrame({"name": pd.Series(companies, dtype=object).dropna().unique()}))
+        try:
+            return _follow_on(self.engine, "org IN (SELECT name FROM wanted)", [], min_count)
+        finally:
+            self.engine.con.unregister("wanted")
+
+
+def _follow_on(engine, where, params, min_count):
+    # Investment Count and sorted, de-duplicated Investment Stages per organization
+    table = engine.query(f"""
+        SELECT org AS "organization name", sum(n) AS "Investment Count",
+               string_agg(round, ', ' ORDER BY round) AS "Investment Stages"
+        FROM (SELECT org, round, count(*) AS n FROM rounds WHERE org IS NOT NULL AND {where} GROUP BY org, round)
+        GROUP BY org HAVING sum(n) >= ? ORDER BY org
+    """, params + [min_count])
+    table["Investment Count"] = table["Investment Count"].astype(np.int64)
+    return table.set_index("organization name")
+
+
+class _SqlYears:
+    def __init__(self, engine):
+        self.engine = engine
+
+    def select(self, first_year, last_year):
+        return _SqlSelection(self.engine, first_year, last_year)
+
+
+class _SqlSelection:
+    """Rounds announced in [first_year, last_year], like rounds.YearSelection."""
+
+    WHERE = "year(day) BETWEEN ? AND ?"
+
+    def __init__(self, engine, first_year, last_year):
+        self.engine, self.params = engine, [int(first_year), int(last_year)]
+
+    def _scalar(self, expression):
+        return self.engine.con.execute(f"SELECT {expression} FROM rounds WHERE {self.WHERE}", self.params).fetchone()[0]
+
+    def __len__(self):
+        return int(self._scalar("count(*)"))
+
+    def lead_count(self):
+        return int(self._scalar("count(*) FILTER (WHERE lead)"))
+
+    def company_count(self):
+        return int(self._scalar("count(DISTINCT org)"))
+
+    def stage_counts(self):
+        df = self.engine.query(
+            f"SELECT round, count(*) AS n FROM rounds WHERE {self.WHERE} GROUP BY round ORDER BY n DESC, round",
+            self.params,
+        )
+        return pd.Series(df["n"].to_numpy(dtype=np.int64), index=pd.Index(df["round"], name="funding round"),
+                         name="count")
+
+    def follow_on_table(self, min_count=1):
+        return _follow_on(self.engine, self.WHERE, self.params, min_count)
+
+
+class _SqlFollowOn:
+    def __init__(self, engine):
+        self.engine = engine
+
+    def between(self, first_year, last_year):
+        return _SqlTiming(self.engine, [int(first_year), int(last_year)])
+
+
+class _SqlTiming:
+    """Consecutive dated rounds per company in a year range, like follow_on.FollowOn."""
+
+    def __init__(self, engine, params):
+        self.engine, self.params = engine, params
+        self.pairs = f"""
+            SELECT * FROM (
+                SELECT lag(round) OVER w AS from_stage, round AS to_stage, day - lag(day) OVER w AS days
+                FROM rounds WHERE org IS NOT NULL AND day IS NOT NULL AND year(day) BETWEEN ? AND ?
+                WINDOW w AS (PARTITION BY org ORDER BY day, round)
+            ) WHERE from_stage IS NOT NULL
+        """
+
+    def transition_matrix(self):
+        df = self.engine.query(f"SELECT from_stage, to_stage, count(*) AS n FROM ({self.pairs}) GROUP BY ALL",
+                               self.params)
+        matrix = df.pivot_table(index="from_stage", columns="to_stage", values="n", aggfunc="sum", fill_value=0)
+        stages = matrix.index.union(matrix.columns)
+        matrix = matrix.reindex(index=stages, columns=stages, fill_value=0).astype(np.int64)
+        return matrix.rename_axis(index="From Stage", columns="To Stage")
+
+    def median_days_between_rounds(self):
+        median = self.engine.con.execute(f"SELECT median(days) FROM ({self.pairs})", self.params).fetchone()[0]
+        return float("nan") if median is None else float(median)
+
+    def median_days_to_stage(self):
+        df = self.engine.query(
+            f"SELECT to_stage, median(days) AS days FROM ({self.pairs}) GROUP BY to_stage ORDER BY to_stage",
+            self.params,
+        )
+        return pd.Series(df["days"].to_numpy(dtype=float), index=pd.Index(df["to_stage"], name="Stage"),
+                         name="Median Days")
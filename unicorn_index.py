@@ -0,0 +1,372 @@
+# unicorn_index.py
+#
+# Normalized company-name index over the static unicorn datasets
+# (data-clean/master_unicorns.csv and data-clean/emerging_unicorns.csv).
+# Keys are normalized names plus aliases: a space-free form, the Crunchbase
+# slug from "Organization Name URL" and the domain from "Website". The index
+# is built once per process and answers lookups with dict hits, so a large
+# portfolio upload resolves with one vectorized normalization pass.
+# Optional fuzzy matching scores leftover names by trigram similarity against
+# candidates blocked through a trigram inverted index.
+# The datasets themselves load from typed Arrow snapshots (see snapshots.py);
+# run ``python unicorn_index.py`` to rebuild them ahead of a deploy.
+#
+#     index = get_unicorn_index()
+#     matches = index.unicorns.match(df_uploaded["organization name"], fuzzy_threshold=0.85)
+
+import os
+import re
+from functools import lru_cache
+from urllib.parse import urlparse
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from snapshots import build_snapshot, load_snapshot, snapshot_path
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data-clean")
+MASTER_UNICORNS_CSV = os.path.join(STATIC_DIR, "master_unicorns.csv")
+EMERGING_UNICORNS_CSV = os.path.join(STATIC_DIR, "emerging_unicorns.csv")
+
+# Trailing words dropped from names before matching ("Acme Labs Inc." → "acme")
+NAME_SUFFIXES = [
+    "inc", "incorporated", "llc", "ltd", "limited", "corp", "corporation", "co", "company",
+    "gmbh", "ag", "sa", "sas", "bv", "plc", "pte", "pty", "holdings", "group",
+    "labs", "lab", "technologies", "technology", "tech", "hq",
+]
+_SUFFIX_RE = re.compile(r"(?:\s+(?:" + "|".join(NAME_SUFFIXES) + r"))+$")
+_PUNCT_RE = re.compile(r"[^a-z0-9]+")
+_DOMAIN_RE = re.compile(r"^[a-z0-9-]+(\.[a-z0-9-]+)+$")
+
+VALUATION_COLUMN = "post_money_valuation_(in b)"
+NAME_KEY_COLUMN = "name key"
+MAX_KEY_CHARS = 64              # keys are truncated to this length for trigram matching
+DEFAULT_FUZZY_THRESHOLD = 0.85
+
+
+# — Normalization —
+def normalize_name(name):
+    if not isinstance(name, str):
+        return ""
+    return normalize_names(pd.Series([name])).iloc[0]
+
+
+def normalize_names(names):
+    # Vectorized: ASCII-fold, lowercase, punctuation → space, drop "the" and legal suffixes
+    return strip_suffixes(name_keys(names))
+
+
+def name_keys(names):
+    # Folded, lowercased, punctuation-free keys that still keep their suffixes
+    s = pd.Series(names, dtype=object).fillna("").astype(str)
+    s = s.str.normalize("NFKD").str.encode("ascii", errors="ignore").str.decode("ascii")
+    s = s.str.lower().str.replace("&", " and ", regex=False)
+    s = s.str.replace(_PUNCT_RE, " ", regex=True).str.strip()
+    return s.str.replace(r"^the\s+", "", regex=True)
+
+
+def strip_suffixes(keys):
+    stripped = keys.str.replace(_SUFFIX_RE, "", regex=True).str.strip()
+    return stripped.where(stripped != "", keys)   # never strip a name down to nothing
+
+
+def _normalized_keys(names):
+    # (full, stripped) keys; full keeps suffixes so "World Labs" and "World" stay distinct
+    full = name_keys(names)
+    return full, strip_suffixes(full)
+
+
+def compact(keys):
+    return keys.str.replace(" ", "", regex=False)
+
+
+def domain_of(url):
+    # "https://www.typeform.com/" → "typeform.com"
+    if not isinstance(url, str) or not url.strip():
+        return ""
+    url = url.strip().lower()
+    host = urlparse(url if "//" in url else f"//{url}").netloc or url
+    host = host.split("@")[-1].split(":")[0]
+    return host[4:] if host.startswith("www.") else host
+
+
+def trigrams(keys):
+    """Distinct padded character trigrams of each normalized key, as integer codes.
+
+    "acme" → "  a", " ac", "acm", "cme", "me ". Keys are ASCII after
+    normalization, so each trigram packs into 24 bits and extraction runs as
+    array arithmetic over a (keys × chars) byte matrix. Returns (rows, codes),
+    one entry per distinct trigram, and the trigram count of every key.
+    """
+    padded = ["  " + k[:MAX_KEY_CHARS] + " " for k in keys]
+    if not padded:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0)
+    width = max(map(len, padded))
+    chars = np.array(padded, dtype=f"S{width}").view(np.uint8).reshape(len(padded), width).astype(np.int64)
+    codes = (chars[:, :-2] << 16) | (chars[:, 1:-1] << 8) | chars[:, 2:]
+    lengths = np.fromiter(map(len, padded), dtype=np.int64, count=len(padded))
+    # Sort each row with padding past the key's end pushed last, then drop repeats
+    codes = np.where(np.arange(width - 2) < (lengths - 2)[:, None], codes, 1 << 24)
+    codes.sort(axis=1)
+    distinct = (codes < 1 << 24) & np.c_[np.ones(len(codes), dtype=bool), codes[:, 1:] != codes[:, :-1]]
+    rows = np.broadcast_to(np.arange(len(padded))[:, None], codes.shape)[distinct]
+    return rows, codes[distinct], distinct.sum(axis=1).astype(float)
+
+
+def crunchbase_slug(url):
+    # "https://www.crunchbase.com/organization/anduril-industries" → "anduril industries"
+    if not isinstance(url, str) or "/organization/" not in url:
+        return ""
+    return url.rstrip("/").rsplit("/", 1)[-1].replace("-", " ")
+
+
+# — Index —
+class NameIndex:
+    """Normalized key → canonical name for one dataset."""
+
+    def __init__(self, names, slugs=None, websites=None, keys=None):
+        # ``keys`` may carry precomputed name_keys() for ``names`` (see the snapshots)
+        names = pd.Series(names, dtype=object).reset_index(drop=True)
+        keep = names.notna()
+        self.names = names[keep].astype(str).reset_index(drop=True)
+        if keys is None:
+            full_keys, keys = _normalized_keys(self.names)
+        else:
+            full_keys = pd.Series(keys, dtype=object).reset_index(drop=True)[keep].reset_index(drop=True)
+            keys = strip_suffixes(full_keys)
+
+        self.exact = {}
+        self.alias = {}
+        self.domains = {}
+        # Unstripped keys first, so an exact name wins over a suffix-stripped one
+        for key, name in zip(pd.concat([full_keys, keys]), pd.concat([self.names, self.names])):
+            self.exact.setdefault(key, name)
+        for key, name in zip(compact(keys), self.names):
+            self.alias.setdefault(key, name)
+        if slugs is not None:
+            slug_keys = normalize_names(pd.Series(slugs, dtype=object)[keep].map(crunchbase_slug))
+            for key, name in zip(slug_keys, self.names):
+                if key:
+                    self.alias.setdefault(key, name)
+                    self.alias.setdefault(key.replace(" ", ""), name)
+        if websites is not None:
+            for url, name in zip(pd.Series(websites, dtype=object)[keep], self.names):
+                domain = domain_of(url)
+                if domain:
+                    self.domains.setdefault(domain, name)
+        self._fuzzy = None
+
+    def __len__(self):
+        return len(self.names)
+
+    def lookup(self, name):
+        matched, _, _ = self._resolve(pd.Series([name], dtype=object))
+        return matched.iloc[0]
+
+    def _trigram_index(self):
+        # Built on first fuzzy lookup. Trigram ids are numbered rarest first, so a
+        # key's lowest ids are its most selective blocking grams.
+        if self._fuzzy is None:
+            rows, codes, sizes = trigrams(list(self.exact))
+            distinct, inverse, freq = np.unique(codes, return_inverse=True, return_counts=True)
+            rank = np.empty(len(distinct), dtype=np.int64)
+            rank[np.lexsort((distinct, freq))] = np.arange(len(distinct))
+            matrix = sparse.csr_matrix(
+                (np.ones(len(rows), dtype=np.float32), (rows, rank[inverse.ravel()])),
+                shape=(len(sizes), len(distinct)),
+            )
+            # Transposed, the key × trigram matrix is the inverted index: trigram → keys
+            self._fuzzy = {
+                "codes": distinct,
+                "rank": rank,
+                "matrix": matrix,
+                "inverted": matrix.T.tocsr(),
+                "sizes": sizes,
+                "names": np.array(list(self.exact.values()), dtype=object),
+            }
+        return self._fuzzy
+
+    def fuzzy(self, keys, threshold=DEFAULT_FUZZY_THRESHOLD):
+        """Best (name, Dice similarity) per normalized key over character trigrams.
+
+        Candidates are blocked through the inverted index on each key's rarest
+        trigrams (prefix filtering: a pair reaching ``threshold`` must share one
+        of them) and length-filtered; only those pairs are scored. Keys with no
+        candidate at or above ``threshold`` return (None, 0).
+        """
+        index = self._trigram_index()
+        keys = keys.tolist() if isinstance(keys, pd.Series) else list(keys)
+        matched = np.full(len(keys), None, dtype=object)
+        score = np.zeros(len(keys))
+        if not keys or not len(index["names"]):
+            return matched, score
+
+        rows, codes, sizes = trigrams(keys)
+        pos = np.minimum(np.searchsorted(index["codes"], codes), len(index["codes"]) - 1)
+        known = index["codes"][pos] == codes
+        rows, ids = rows[known], index["rank"][pos[known]]
+
+        # Dice ≥ t needs overlap ≥ t/(2−t)·|A|, so any |known| − overlap + 1 rarest grams block
+        min_share = threshold / (2 - threshold)
+        order = np.argsort(rows * len(index["codes"]) + ids)
+        rows, ids = rows[order], ids[order]
+        starts = np.searchsorted(rows, np.arange(len(keys)))
+        prefix = np.bincount(rows, minlength=len(keys)) - np.ceil(min_share * sizes) + 1
+        in_prefix = (np.arange(len(rows)) - starts[rows]) < prefix[rows]
+
+        shape = (len(keys), len(index["codes"]))
+        blocking = sparse.csr_matrix(
+            (np.ones(in_prefix.sum(), dtype=np.float32), (rows[in_prefix], ids[in_prefix])), shape=shape
+        )
+        pairs = (blocking @ index["inverted"]).tocoo()
+        q, r = pairs.row, pairs.col
+        ref_sizes = index["sizes"][r]
+        plausible = (ref_sizes >= min_share * sizes[q]) & (sizes[q] >= min_share * ref_sizes)
+        q, r = q[plausible], r[plausible]
+        if not len(q):
+            return matched, score
+
+        query = sparse.csr_matrix((np.ones(len(rows), dtype=np.float32), (rows, ids)), shape=shape)
+        shared = np.asarray(query[q].multiply(index["matrix"][r]).sum(axis=1)).ravel()
+        dice = 2 * shared / (sizes[q] + index["sizes"][r])
+
+        # Best candidate per key: sort by (key, −score) and keep the first of each run
+        order = np.lexsort((-dice, q))
+        first = order[np.r_[True, q[order][1:] != q[order][:-1]]]
+        first = first[dice[first] >= threshold]
+        matched[q[first]] = index["names"][r[first]]
+        score[q[first]] = dice[first]
+        return matched, score
+
+    def _resolve(self, names, websites=None, fuzzy_threshold=None):
+        full_keys, keys = _normalized_keys(names)
+        matched = np.array([self.exact.get(f, self.exact.get(k)) for f, k in zip(full_keys, keys)], dtype=object)
+        kind = np.where(pd.notna(matched), "exact", None).astype(object)
+
+        missing = pd.isna(matched)
+        matched[missing] = [self.alias.get(k) for k in compact(keys[missing])]
+        kind[missing & pd.notna(matched)] = "alias"
+
+        # Names that are really domains ("quora.com"), then an explicit website column
+        missing = pd.isna(matched)
+        raw = pd.Series(names, dtype=object).fillna("").astype(str).str.strip().str.lower()
+        looks_like_domain = missing & raw.str.match(_DOMAIN_RE).to_numpy(dtype=bool)
+        matched[looks_like_domain] = [self.domains.get(domain_of(u)) for u in raw[looks_like_domain]]
+        if websites is not None:
+            missing = pd.isna(matched)
+            matched[missing] = [self.domains.get(domain_of(u)) for u in pd.Series(websites, dtype=object)[missing]]
+        kind[pd.isna(kind) & pd.notna(matched)] = "domain"
+        confidence = np.where(pd.notna(matched), 1.0, 0.0)
+
+        # Approximate matches for whatever is still unresolved
+        if fuzzy_threshold is not None:
+            missing = pd.isna(matched) & (keys != "").to_numpy(dtype=bool)
+            found, score = self.fuzzy(keys[missing], fuzzy_threshold)
+            matched[missing] = found
+            confidence[missing] = score
+            kind[missing & pd.notna(matched)] = "fuzzy"
+        return pd.Series(matched, dtype=object), pd.Series(kind, dtype=object), pd.Series(confidence)
+
+    def match(self, names, websites=None, fuzzy_threshold=None):
+        """Canonical name (or NaN), match kind and confidence for every uploaded name.
+
+        Exact, alias and domain hits have confidence 1. With ``fuzzy_threshold``
+        set, remaining names are matched approximately and scored 0–1.
+        """
+        names = pd.Series(names, dtype=object).reset_index(drop=True)
+        if websites is not None:
+            websites = pd.Series(websites, dtype=object).reset_index(drop=True)
+            matched, kind, confidence = self._resolve(names, websites, fuzzy_threshold)
+            return pd.DataFrame({"input": names, "match": matched, "kind": kind, "confidence": confidence})
+        # Normalize each distinct spelling once
+        uniques = pd.Series(names.dropna().unique(), dtype=object)
+        matched, kind, confidence = self._resolve(uniques, fuzzy_threshold=fuzzy_threshold)
+        lookup = pd.DataFrame(
+            {"match": matched.values, "kind": kind.values, "confidence": confidence.values}, index=uniques.values
+        )
+        out = lookup.reindex(names.values)
+        return pd.DataFrame({
+            "input": names,
+            "match": out["match"].values,
+            "kind": out["kind"].values,
+            "confidence": out["confidence"].fillna(0.0).values,
+        })
+
+
+class UnicornIndex:
+    """Name indexes over the master and emerging unicorn datasets."""
+
+    def __init__(self, df_unicorns, df_emerging):
+        self.unicorns = NameIndex(df_unicorns["organization name"], keys=df_unicorns.get(NAME_KEY_COLUMN))
+        self.emerging = NameIndex(
+            df_emerging["organization name"],
+            slugs=df_emerging.get("organization name url"),
+            websites=df_emerging.get("website"),
+            keys=df_emerging.get(NAME_KEY_COLUMN),
+        )
+
+    def overlaps(self, names, websites=None, fuzzy_threshold=None):
+        """Sets of canonical unicorn / emerging names present in ``names``."""
+        uni = self.unicorns.match(names, websites, fuzzy_threshold)["match"].dropna()
+        emg = self.emerging.match(names, websites, fuzzy_threshold)["match"].dropna()
+        return set(uni), set(emg)
+
+
+# — Static datasets: typed Arrow snapshots, loaded once per process —
+def _prepare_master(df):
+    df = df.copy()
+    # Valuations arrive as "350" or "350 B"; store them as numbers once
+    valuation = next(c for c in df.columns if c.lower().strip() == VALUATION_COLUMN)
+    df[valuation] = pd.to_numeric(df[valuation].astype(str).str.replace(" B", "", regex=False), errors="coerce")
+    for col in ["Country", "Continent", "Industry"]:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    df["Name Key"] = name_keys(df["Organization Name"])
+    return df
+
+
+def _prepare_emerging(df):
+    df = df.copy()
+    for col in ["Last Equity Funding Type", "Funding Status", "Number of Employees", "Hub Tags"]:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    if "Last Funding Date" in df.columns:
+        df["Last Funding Date"] = pd.to_datetime(df["Last Funding Date"], errors="coerce")
+    for col in ["Monthly Visits", "Average Visits (6 months)"]:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col].astype(str).str.replace(",", "", regex=False), errors="coerce")
+    df["Name Key"] = name_keys(df["Organization Name"])
+    return df
+
+
+STATIC_DATASETS = {
+    MASTER_UNICORNS_CSV: _prepare_master,
+    EMERGING_UNICORNS_CSV: _prepare_emerging,
+}
+
+
+def load_static_dataset(csv_path):
+    df = load_snapshot(csv_path, STATIC_DATASETS[csv_path], {"on_bad_lines": "skip"})
+    df.columns = df.columns.str.lower().str.strip()
+    return df
+
+
+@lru_cache(maxsize=1)
+def load_static_datasets():
+    return load_static_dataset(MASTER_UNICORNS_CSV), load_static_dataset(EMERGING_UNICORNS_CSV)
+
+
+def build_static_snapshots():
+    for csv_path, prepare in STATIC_DATASETS.items():
+        build_snapshot(csv_path, prepare, {"on_bad_lines": "skip"})
+        print(f"{os.path.relpath(snapshot_path(csv_path))}")
+
+
+@lru_cache(maxsize=1)
+def get_unicorn_index():
+    return UnicornIndex(*load_static_datasets())
+
+
+if __name__ == "__main__":
+    build_static_snapshots()
@@ -0,0 +1,33 @@
+# uploads.py
+#
+# Column detection and name matching for uploaded portfolio CSVs, shared by
+# the analyzer page and the headless batch CLI (batch.py). Kept free of
+# Streamlit so batch workers don't import it.
+
+POSSIBLE_NAME_COLUMNS = ["organization name", "company", "startup name", "name"]
+POSSIBLE_WEBSITE_COLUMNS = ["website", "domain", "url", "company website"]
+EARLY_STAGE_ROUNDS = ["pre-seed round", "seed round", "series a", "series b"]
+
+
+def normalize_columns(df):
+    df.columns = df.columns.str.lower().str.strip()
+    return df
+
+
+def find_name_column(df):
+    return next((col for col in df.columns if col in POSSIBLE_NAME_COLUMNS), None)
+
+
+def find_website_column(df):
+    return next((col for col in df.columns if col in POSSIBLE_WEBSITE_COLUMNS), None)
+
+
+def match_portfolio(name_index, uploaded_names, uploaded_websites=None, fuzzy_threshold=None):
+    # Matched rows only: uploaded name, canonical name, match kind and confidence
+    matches = name_index.match(uploaded_names, uploaded_websites, fuzzy_threshold)
+    return matches[matches["match"].notna()]
+
+
+def find_overlaps(name_index, uploaded_names, uploaded_websites=None, fuzzy_threshold=None):
+    # Canonical names from the index, matched on normalized names, aliases and domains
+    return set(match_portfolio(name_index, uploaded_names, uploaded_websites, fuzzy_threshold)["match"])
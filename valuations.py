@@ -0,0 +1,93 @@
+# valuations.py
+#
+# Data helpers for the Unicorns Tracker on the dashboard Home page:
+# quarter ordering and risers/fallers between two quarterly snapshots, and a
+# company × quarter valuation matrix that serves both without rescanning.
+
+import numpy as np
+import pandas as pd
+
+
+def quarter_key(quarter):
+    # "Q4 2024" → (2024, 4)
+    q, year = quarter.split()
+    return int(year), int(q[1:])
+
+
+def sort_quarters(quarters):
+    return sorted(quarters, key=quarter_key)
+
+
+def quarter_movers(df_full, quarter_from, quarter_to):
+    from_df = df_full[df_full["Quarter"] == quarter_from][["Company", "Post Money Value"]].rename(columns={"Post Money Value": "Value_From"})
+    to_df = df_full[df_full["Quarter"] == quarter_to][["Company", "Post Money Value"]].rename(columns={"Post Money Value": "Value_To"})
+    comp = pd.merge(from_df, to_df, on="Company", how="outer")
+    comp["Change_$B"] = comp["Value_To"] - comp["Value_From"]
+    comp["Multiple"] = comp["Value_To"] / comp["Value_From"]
+    return comp
+
+
+class ValuationHistory:
+    """Dense (company × quarter) valuation matrix, built once per data refresh.
+
+    Quarter slices, trend lines and movers between any two quarters are row
+    or column reads on the matrix instead of scans and merges over the frame.
+    A company listed twice in one quarter keeps its last value.
+    """
+
+    def __init__(self, companies, quarters, values, rows_by_quarter=None):
+        self.companies = np.asarray(companies, dtype=object)
+        self.quarters = list(quarters)
+        self.values = values                         # float64 (companies, quarters), NaN = absent
+        self.company_index = {c: i for i, c in enumerate(self.companies)}
+        self.quarter_index = {q: j for j, q in enumerate(self.quarters)}
+        self.rows_by_quarter = rows_by_quarter or {}
+
+    @classmethod
+    def from_frame(cls, df_full, value_column="Post Money Value"):
+        company_codes, companies = pd.factorize(df_full["Company"])
+        quarter_codes, quarters = pd.factorize(df_full["Quarter"])
+        ordered = sort_quarters(quarters)
+        position = np.array([ordered.index(q) for q in quarters], dtype=np.int64)
+        columns = position[quarter_codes]
+        values = np.full((len(companies), len(ordered)), np.nan)
+        values[company_codes, columns] = pd.to_numeric(df_full[value_column], errors="coerce").to_numpy(dtype=float)
+        # Row positions of each quarter in df_full, for slicing the full records
+        order = np.argsort(columns, kind="stable")
+        bounds = np.searchsorted(columns[order], np.arange(len(ordered) + 1))
+        rows_by_quarter = {q: order[bounds[j]:bounds[j + 1]] for j, q in enumerate(ordered)}
+        return cls(companies, ordered, values, rows_by_quarter)
+
+    def quarter_rows(self, df_full, quarter):
+        # The df_full records for one quarter, without scanning the Quarter column
+        return df_full.iloc[self.rows_by_quarter.get(quarter, np.zeros(0, dtype=np.int64))]
+
+    def snapshot(self, quarter):
+        column = self.values[:, self.quarter_index[quarter]]
+        present = ~np.isnan(column)
+        return pd.Series(column[present], index=self.companies[present], name=quarter)
+
+    def trend(self, company, quarters=None):
+        quarters = self.quarters if quarters is None else [q for q in quarters if q in self.quarter_index]
+        i = self.company_index.get(company)
+        if i is None:
+            return pd.Series(dtype=float, index=pd.Index([], name="Quarter"))
+        series = pd.Series(self.values[i, [self.quarter_index[q] for q in quarters]],
+                           index=pd.Index(quarters, name="Quarter"))
+        return series.dropna()
+
+    def movers(self, quarter_from, quarter_to):
+        # Same columns as quarter_movers(): companies present in either quarter
+        value_from = self.values[:, self.quarter_index[quarter_from]]
+        value_to = self.values[:, self.quarter_index[quarter_to]]
+        present = ~(np.isnan(value_from) & np.isnan(value_to))
+        value_from, value_to = value_from[present], value_to[present]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            multiple = value_to / value_from
+        return pd.DataFrame({
+            "Company": self.companies[present],
+            "Value_From": value_from,
+            "Value_To": value_to,
+            "Change_$B": value_to - value_from,
+            "Multiple": multiple,
+        })